@@ -4,30 +4,73 @@
 # Author: Jaydevsinh Gohil
 # ==========================================================
 
+import os
 from flask import Flask
 from flask_cors import CORS
-from dotenv import load_dotenv
+from .config import Config
 from .db import init_db
 from .routes.admin_routes import admin_bp
+from .routes.confession_routes import confession_bp
+from .services.feed import feed_cache
+from .services.health import cached_readiness, db_stats_sampler
+from .services.live import live_hub
+from .services.mood import mood_pipeline
+from .services.trending import trending_engine
+from .utils.auth import init_auth
+from .utils.compression import init_compression
+from .utils.json_provider import ConfesslyJSONProvider
+from .utils.metrics import init_metrics, register_gauges
+from .utils.mongo_monitoring import pool_stats
+from .utils.rate_limit import limiter
+from .utils.write_behind import write_buffer
 
 
 def create_app():
     """Main Flask application factory."""
-    load_dotenv()  # Load .env file
-    app = Flask(__name__)
+    app = Flask(__name__)  # .env is already loaded by app.config
+    app.json = ConfesslyJSONProvider(app)  # native ObjectId/datetime encoding
 
-    # Enable CORS for all domains (optional: restrict in prod)
-    CORS(app)
+    # Enable CORS (all domains unless CORS_ORIGINS is set; asgi.py applies the same options)
+    CORS(app, **Config.cors_options())
 
-    # Initialize MongoDB
+    # Request timing, Server-Timing headers & /metrics
+    init_metrics(app)
+    register_gauges("mongo_pool", pool_stats.snapshot)
+    register_gauges("write_behind", write_buffer.stats)
+    register_gauges("mood", mood_pipeline.stats)
+    register_gauges("feed_cache", feed_cache.stats)
+    register_gauges("trending", trending_engine.stats)
+    register_gauges("live", live_hub.stats)
+    register_gauges("db_stats", db_stats_sampler.stats)
+    register_gauges("rate_limit", limiter.stats)
+
+    # Negotiated gzip/br for large buffered responses
+    init_compression(app)
+
+    # Resolve JWT secret/algorithm once
+    init_auth(app)
+
+    # Register MongoDB (lazy client; index sync per Config.INDEX_SYNC, never blocks boot)
     init_db(app)
 
     # Register Blueprints
     app.register_blueprint(admin_bp, url_prefix="/api/admin")
+    app.register_blueprint(confession_bp, url_prefix="/api/confessions")
 
     # Root route (for quick API health check)
     @app.route("/")
     def home():
         return {"message": "💬 Confessly API running successfully"}
 
+    # Liveness: the process answers (no DB I/O) — restart the worker if this fails
+    @app.route("/livez")
+    def live():
+        return {"status": "alive", "pid": os.getpid()}
+
+    # Readiness: Mongo answered a ping recently (cached) — stop routing traffic if this fails
+    @app.route("/readyz")
+    def ready():
+        is_ready, details = cached_readiness()
+        return {"status": "ready" if is_ready else "not_ready", **details}, 200 if is_ready else 503
+
     return app
@@ -0,0 +1,206 @@
+# ==========================================================
+# 💬 CONFESSLY — ASGI SERVING MODE
+# File: app/asgi.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Optional async front for the Flask app. Routes in async_url_map run as
+coroutines on the server's event loop against the motor client, so one
+worker can keep many Mongo round-trips (and idle SSE clients) in flight. Everything else is the
+unchanged Flask app, called on a bounded thread pool.
+
+    uvicorn asgi:app --workers 4
+    gunicorn -k uvicorn.workers.UvicornWorker -w 4 asgi:app
+
+The sync path (run.py / `gunicorn run:app`) stays the default.
+"""
+
+import asyncio
+import contextvars
+import sys
+import traceback
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from flask_cors.core import ACL_ORIGIN, get_cors_headers, get_cors_options
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+from werkzeug.wrappers import Request
+from app import create_app
+from app.config import Config
+from app.db import close_async_client
+from app.routes.async_routes import async_url_map
+from app.utils.compression import compress_response
+from app.utils.metrics import REQUEST_LATENCY
+from app.utils.responses import plain_error
+
+_DONE = object()
+
+
+def _environ(scope, body):
+    """PEP 3333 environ for an ASGI http scope."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf8").decode("latin1"),
+        "PATH_INFO": scope["path"].encode("utf8").decode("latin1"),
+        "QUERY_STRING": scope["query_string"].decode("ascii"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        name = name.decode("latin1")
+        if name == "content-type":
+            key = "CONTENT_TYPE"
+        elif name == "content-length":
+            key = "CONTENT_LENGTH"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        value = value.decode("latin1")
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class ConfesslyASGI:
+    """ASGI app: async handlers first, the Flask (WSGI) app for the rest."""
+
+    def __init__(self, flask_app, url_map, sync_threads=16):
+        self.flask_app = flask_app
+        self.url_map = url_map
+        self._pool = ThreadPoolExecutor(max_workers=sync_threads, thread_name_prefix="wsgi")
+        # Same options the Flask app passed to CORS(); Flask's after_request never sees async routes
+        self._cors = get_cors_options(flask_app, Config.cors_options())
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+
+        body = await self._read_body(receive)
+        environ = _environ(scope, body)
+        try:
+            rule, args = self.url_map.bind_to_environ(environ).match(return_rule=True)
+        except (NotFound, MethodNotAllowed):
+            return await self._call_wsgi(environ, send)
+
+        started = time.perf_counter()
+        request = Request(environ)
+        try:
+            response = await rule.endpoint(request, **args)
+        except Exception:
+            # Mirror Flask: log the traceback, answer with the JSON error envelope
+            traceback.print_exc()
+            response = plain_error("Internal server error", 500)
+        if response is None:
+            return await self._call_wsgi(environ, send)
+        # Flask responses get these in after_request
+        self._apply_cors(request, response)
+        compress_response(response, request.accept_encodings)
+        REQUEST_LATENCY.observe(
+            (scope["method"], rule.rule, response.status_code), time.perf_counter() - started
+        )
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(k.lower().encode("latin1"), v.encode("latin1")) for k, v in response.headers.items()],
+        })
+        if hasattr(response.response, "__aiter__"):
+            return await self._stream(response.response, receive, send)
+        await send({"type": "http.response.body", "body": response.get_data()})
+
+    def _apply_cors(self, request, response):
+        if response.headers.get(ACL_ORIGIN):
+            return
+        for name, value in get_cors_headers(self._cors, request.headers, request.method).items():
+            response.headers.add(name, value)
+
+    @staticmethod
+    async def _stream(body, receive, send):
+        """Relay an async-iterator body until it ends or the client disconnects."""
+        async def relay():
+            async for chunk in body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def disconnected():
+            while (await receive())["type"] != "http.disconnect":
+                pass
+
+        tasks = [asyncio.ensure_future(relay()), asyncio.ensure_future(disconnected())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await body.aclose()  # runs the handler's cleanup (e.g. unsubscribe)
+
+    @staticmethod
+    async def _read_body(receive):
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        return b"".join(chunks)
+
+    async def _call_wsgi(self, environ, send):
+        """Run the Flask app on the thread pool and relay (or stream) its response."""
+        loop = asyncio.get_running_loop()
+        start = {}
+
+        def start_response(status, headers, exc_info=None):
+            start["status"] = int(status.split(" ", 1)[0])
+            start["headers"] = [(k.lower().encode("latin1"), v.encode("latin1")) for k, v in headers]
+
+        # One context for every step: stream_with_context pushes the request
+        # context on the first chunk and pops it on close, possibly on
+        # another pool thread
+        context = contextvars.copy_context()
+        result = await loop.run_in_executor(self._pool, context.run, self.flask_app, environ, start_response)
+        try:
+            chunks = iter(result)
+            started = False
+            while True:
+                chunk = await loop.run_in_executor(self._pool, context.run, next, chunks, _DONE)
+                if not started and (chunk is _DONE or chunk):
+                    await send({"type": "http.response.start", "status": start["status"], "headers": start["headers"]})
+                    started = True
+                if chunk is _DONE:
+                    break
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            if hasattr(result, "close"):
+                await loop.run_in_executor(self._pool, context.run, result.close)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                close_async_client()
+                self._pool.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app():
+    """Flask app wrapped for ASGI servers (uvicorn / gunicorn UvicornWorker)."""
+    return ConfesslyASGI(create_app(), async_url_map, sync_threads=Config.ASGI_SYNC_THREADS)
@@ -10,10 +10,30 @@ from dotenv import load_dotenv
 # Load .env file automatically
 load_dotenv()
 
+
 class Config:
     # Flask Core Settings
     SECRET_KEY = os.getenv("SECRET_KEY", "confessly_secret_key")
     JWT_SECRET = os.getenv("JWT_SECRET", "confessly_jwt_secret")
+    JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+    JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "4096"))  # verified tokens kept in memory
+    JWT_CACHE_MAX_TTL = int(os.getenv("JWT_CACHE_MAX_TTL", "3600"))  # seconds, capped by token exp
+    # Password Hashing (bounded pool; excess logins get 429)
+    PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "bcrypt")  # bcrypt | werkzeug
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    HASH_WORKERS = int(os.getenv("HASH_WORKERS", "2"))
+    HASH_MAX_QUEUE = int(os.getenv("HASH_MAX_QUEUE", "16"))
+
+    ADMIN_PROFILE_CACHE_TTL = int(os.getenv("ADMIN_PROFILE_CACHE_TTL", "60"))  # seconds
+
+    # Startup: index reconciliation mode (once | worker | off) and readiness probe budget
+    INDEX_SYNC = os.getenv("INDEX_SYNC", "once")
+    READINESS_TIMEOUT_MS = int(os.getenv("READINESS_TIMEOUT_MS", "1000"))
+    READINESS_CACHE_TTL = float(os.getenv("READINESS_CACHE_TTL", "2"))  # seconds a ping result is reused
+
+    # Health: cached collection catalog and background dbStats sampling
+    CATALOG_TTL = int(os.getenv("CATALOG_TTL", "300"))  # seconds
+    HEALTH_SAMPLE_INTERVAL = int(os.getenv("HEALTH_SAMPLE_INTERVAL", "60"))  # seconds between dbStats runs
 
     # MongoDB Connection
     MONGO_URI = os.getenv(
@@ -23,3 +43,105 @@ class Config:
 
     # Debug Mode
     DEBUG = os.getenv("FLASK_DEBUG", "True").lower() in ("true", "1", "t")
+
+    # Admin Dashboard
+    DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "15"))  # seconds
+
+    # Reactions: also honour pre-migration `reactions.session_ids` arrays (off once migrate-votes has run)
+    REACTION_LEGACY_CHECK = os.getenv("REACTION_LEGACY_CHECK", "True").lower() in ("true", "1", "t")
+
+    # Write-behind buffer for reactions / activity timestamps
+    WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "True").lower() in ("true", "1", "t")
+    WRITE_BEHIND_MAX_BATCH = int(os.getenv("WRITE_BEHIND_MAX_BATCH", "500"))
+    WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))  # seconds
+    WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "5000"))
+    WRITE_BEHIND_MAX_RETRIES = int(os.getenv("WRITE_BEHIND_MAX_RETRIES", "3"))  # then dead-lettered
+
+    # MongoDB Client / Connection Pool (per worker process)
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "20000"))
+    MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zstd,snappy,zlib")  # first available wins
+    MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+    MONGO_TLS = os.getenv("MONGO_TLS", "True").lower() in ("true", "1", "t")
+    MONGO_TLS_ALLOW_INVALID_CERTS = os.getenv("MONGO_TLS_ALLOW_INVALID_CERTS", "True").lower() in ("true", "1", "t")
+
+    # Observability
+    SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", "100"))  # 0 disables the slow-query log
+    # /metrics is off unless a bearer token is set, or METRICS_ENABLED opts in to serving it open
+    # (only behind a network boundary that keeps it internal)
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False").lower() in ("true", "1", "t")
+
+    # Mood Analysis Pipeline (TextBlob, off the request thread)
+    MOOD_ANALYSIS_ENABLED = os.getenv("MOOD_ANALYSIS_ENABLED", "True").lower() in ("true", "1", "t")
+    MOOD_BATCH_SIZE = int(os.getenv("MOOD_BATCH_SIZE", "32"))
+    MOOD_MAX_WAIT = float(os.getenv("MOOD_MAX_WAIT", "0.5"))  # seconds to fill a batch
+    MOOD_WORKERS = int(os.getenv("MOOD_WORKERS", "1"))  # scoring processes; 0 = score in-thread
+    MOOD_MAX_QUEUE = int(os.getenv("MOOD_MAX_QUEUE", "10000"))
+    MOOD_CACHE_TTL = int(os.getenv("MOOD_CACHE_TTL", "86400"))  # seconds
+    MOOD_BACKFILL_INTERVAL = int(os.getenv("MOOD_BACKFILL_INTERVAL", "300"))  # seconds; 0 = off (CLI only)
+
+    # Public Feed (keyset pages; first pages cached in-process)
+    FEED_PAGE_SIZE = int(os.getenv("FEED_PAGE_SIZE", "20"))
+    FEED_CACHE_PAGES = int(os.getenv("FEED_CACHE_PAGES", "5"))
+    FEED_CACHE_TTL = int(os.getenv("FEED_CACHE_TTL", "30"))  # seconds
+
+    # Trending Engine (time-decayed hotness, top-K in memory)
+    TRENDING_ENABLED = os.getenv("TRENDING_ENABLED", "True").lower() in ("true", "1", "t")
+    TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "50"))
+    TRENDING_HALF_LIFE = int(os.getenv("TRENDING_HALF_LIFE", "7200"))  # seconds
+    TRENDING_SYNC_INTERVAL = int(os.getenv("TRENDING_SYNC_INTERVAL", "30"))  # seconds
+    TRENDING_DOC_TTL = int(os.getenv("TRENDING_DOC_TTL", "30"))  # cached confession bodies
+
+    # Confession Text Search
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "mongo")  # mongo ($text index) | memory (local stand-in)
+    SEARCH_INDEX_REFRESH = int(os.getenv("SEARCH_INDEX_REFRESH", "300"))  # seconds (memory backend)
+
+    # Rate Limiting (token buckets; "mongo" shares limits across workers)
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True").lower() in ("true", "1", "t")
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory | mongo
+    # Proxies in front of the app that append to X-Forwarded-For (0 = use the socket address; "true" = 1)
+    RATE_LIMIT_TRUST_PROXY = int({"true": "1", "t": "1", "false": "0", "f": "0"}.get(
+        os.getenv("RATE_LIMIT_TRUST_PROXY", "0").lower(), os.getenv("RATE_LIMIT_TRUST_PROXY", "0")
+    ))
+
+    # Bulk Moderation (chunked update_many; large batches run as background jobs)
+    MODERATION_CHUNK_SIZE = int(os.getenv("MODERATION_CHUNK_SIZE", "500"))
+    MODERATION_SYNC_LIMIT = int(os.getenv("MODERATION_SYNC_LIMIT", "1000"))  # items answered inline
+    MODERATION_MAX_IDS = int(os.getenv("MODERATION_MAX_IDS", "10000"))  # larger sets go through `filter`
+    MODERATION_JOB_TTL = int(os.getenv("MODERATION_JOB_TTL", "604800"))  # seconds job docs are kept
+
+    # Response Compression & Conditional GETs
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "True").lower() in ("true", "1", "t")
+    COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))  # smaller bodies go out as-is
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))  # br needs the optional `Brotli` package
+    ETAG_MUTABLE_WINDOW = int(os.getenv("ETAG_MUTABLE_WINDOW", "30"))  # seconds; caps staleness of in-place edits (reactions)
+
+    # Live Updates (SSE stream; events coalesced per confession per tick)
+    # Off by default: every open stream pins a worker thread outside ASGI mode
+    LIVE_ENABLED = os.getenv("LIVE_ENABLED", "False").lower() in ("true", "1", "t")
+    # Also serve /stream from WSGI workers that don't report wsgi.multithread (gevent/eventlet)
+    LIVE_SYNC_STREAM = os.getenv("LIVE_SYNC_STREAM", "False").lower() in ("true", "1", "t")
+    LIVE_TICK_MS = int(os.getenv("LIVE_TICK_MS", "250"))
+    LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "64"))  # frames per client; oldest dropped first
+    LIVE_MAX_SUBSCRIBERS = int(os.getenv("LIVE_MAX_SUBSCRIBERS", "10000"))  # per worker
+    LIVE_KEEPALIVE = int(os.getenv("LIVE_KEEPALIVE", "15"))  # seconds between idle comments
+    LIVE_BROKER = os.getenv("LIVE_BROKER", "memory")  # memory (single worker) | mongo (change streams)
+
+    # ASGI Serving Mode (asgi.py: async admin reads, other routes on a thread pool)
+    ASGI_SYNC_THREADS = int(os.getenv("ASGI_SYNC_THREADS", "16"))
+
+    @staticmethod
+    def cors_options():
+        """Flask-CORS options, shared with the ASGI layer (CORS_ORIGINS: '*' or comma-separated)."""
+        origins = os.getenv("CORS_ORIGINS", "*")
+        return {"origins": origins if origins == "*" else [o.strip() for o in origins.split(",")]}
+
+    @staticmethod
+    def rate_limit(name, default):
+        """Per-route rate, overridable via env RATE_LIMIT_<NAME> (e.g. '5/minute')."""
+        return os.getenv(f"RATE_LIMIT_{name.upper()}", default)
@@ -4,31 +4,54 @@
 # Author: Jaydevsinh Gohil (Master of Code)
 # ==========================================================
 
-import os
-import jwt
+import time
 from datetime import datetime, timedelta
 from flask import jsonify, request
-from werkzeug.security import check_password_hash
-from bson import ObjectId
 from app.models.admin import AdminModel
+from app.models.confession import ConfessionModel
+from app.config import Config
 from app.db import get_db
-from app.utils.auth import admin_required
+from app.services import moderation, rollups
+from app.services.health import collection_catalog, db_stats_sampler
+from app.utils.auth import admin_required, issue_token
+from app.utils.cache import TTLCache
+from app.utils.hashing import HashingBusy
+from app.utils.mongo_monitoring import pool_stats
+from app.utils.pagination import (
+    KEYSET_SORT, fetch_page, keyset_filter, keyset_query, list_version, parse_limit, parse_offset, parse_time
+)
+from app.utils.responses import compute_etag, conditional_success, error, success, version_etag, versioned
+from app.utils.streaming import csv_response, fields_projection, ndjson_response, parse_fields
 
 
 # ==========================================================
 # 🔧 HELPER FUNCTIONS
 # ==========================================================
-def success(message, data=None, code=200):
-    """Unified JSON success response."""
-    body = {"message": message}
-    if data:
-        body["data"] = data
-    return jsonify(body), code
+def busy():
+    """429 when the password hashing pool is saturated."""
+    response = jsonify({"error": "Too many login attempts in progress, retry shortly"})
+    response.headers["Retry-After"] = "1"
+    return response, 429
 
 
-def error(message, code=400):
-    """Unified JSON error response."""
-    return jsonify({"error": message}), code
+# Shared by all admins; refreshed at most once per TTL window
+_dashboard_cache = TTLCache(ttl=Config.DASHBOARD_CACHE_TTL, maxsize=1)
+
+# Dashboard stat -> collection counted
+DASHBOARD_COUNTS = {
+    "confessions": "confessions", "feedback": "feedback", "reports": "reports", "users": "sessions"
+}
+
+# Fields whose newest value marks a change in the admins list
+ADMIN_VERSION_FIELDS = ("created_at", "last_login")
+
+
+def mutable_epoch():
+    """
+    ETag component for lists whose items change in place (confession
+    reactions/status): rolls over every ETAG_MUTABLE_WINDOW seconds.
+    """
+    return int(time.time() // Config.ETAG_MUTABLE_WINDOW)
 
 
 # ==========================================================
@@ -51,7 +74,10 @@ def register_admin():
     if existing_admin:
         return error("Admin already exists", 409)
 
-    AdminModel.create_admin(username, email, password)
+    try:
+        AdminModel.create_admin(username, email, password)
+    except HashingBusy:
+        return busy()
     return success(f"Admin '{username}' created successfully", code=201)
 
 
@@ -70,8 +96,11 @@ def admin_login():
         return error("Username and password required", 400)
 
     admin = AdminModel.find_by_username(username)
-    if not admin or not check_password_hash(admin["password_hash"], password):
-        return error("Invalid credentials", 401)
+    try:
+        if not admin or not AdminModel.verify_password(admin, password):
+            return error("Invalid credentials", 401)
+    except HashingBusy:
+        return busy()
 
     # Update login time
     AdminModel.update_login_time(username)
@@ -81,7 +110,7 @@ def admin_login():
         "role": admin.get("role", "superadmin"),
         "exp": datetime.utcnow() + timedelta(hours=8)
     }
-    token = jwt.encode(payload, os.getenv("JWT_SECRET", "confessly_jwt_secret"), algorithm="HS256")
+    token = issue_token(payload)
 
     return success("Login successful", {
         "token": token,
@@ -101,7 +130,7 @@ def get_admin_profile():
     """Returns the logged-in admin’s profile details."""
     decoded_admin = request.admin_user
     username = decoded_admin.get("username")
-    admin = AdminModel.find_by_username(username)
+    admin = AdminModel.get_profile(username)
     if not admin:
         return error("Admin not found", 404)
 
@@ -117,43 +146,76 @@ def get_admin_profile():
 # ==========================================================
 # 4️⃣ DASHBOARD SUMMARY DATA
 # ==========================================================
-@admin_required
-def dashboard_summary():
-    """Returns summary stats and recent confessions."""
+def _compute_dashboard():
+    """Collect dashboard stats using metadata counts (no collection scans)."""
     db = get_db()
 
-    total_confessions = db.confessions.count_documents({})
-    total_feedback = db.feedback.count_documents({})
-    total_reports = db.reports.count_documents({}) if "reports" in db.list_collection_names() else 0
-    total_users = db.sessions.count_documents({})
-
-    recent_confessions = list(db.confessions.find().sort("created_at", -1).limit(5))
-    for confession in recent_confessions:
-        confession["_id"] = str(confession["_id"])
-        confession.pop("ip_hash", None)
-
-    return success("Dashboard summary fetched", {
-        "stats": {
-            "confessions": total_confessions,
-            "feedback": total_feedback,
-            "reports": total_reports,
-            "users": total_users
-        },
-        "recent_confessions": recent_confessions
-    })
+    # estimated_document_count reads collection metadata and returns 0 for
+    # missing collections, so `reports` needs no existence check
+    stats = {
+        stat: db[collection].estimated_document_count() for stat, collection in DASHBOARD_COUNTS.items()
+    }
+
+    recent_confessions = list(
+        db.confessions.find({}, ConfessionModel.LIST_PROJECTION).sort("created_at", -1).limit(5)
+    )
+
+    data = {"stats": stats, "recent_confessions": recent_confessions}
+    return data, compute_etag(data)
+
+
+@admin_required
+def dashboard_summary():
+    """Returns summary stats and recent confessions (cached, ETag-aware)."""
+    data, etag = _dashboard_cache.get_or_compute("summary", _compute_dashboard)
+    return conditional_success("Dashboard summary fetched", data, etag)
 
 
 # ==========================================================
 # 5️⃣ VIEW FEEDBACK
 # ==========================================================
+def _list_or_export(collection, name):
+    """
+    Keyset page of `collection` (?cursor=&limit=&from=&to=), or a streamed
+    export of every match with ?format=ndjson|csv (&fields=a,b picks the
+    fields; CSV columns otherwise follow the first document). Pages carry a
+    weak ETag from list_version(), so unchanged lists answer 304 before the
+    page query.
+    """
+    token = request.args.get("cursor")
+    fmt = request.args.get("format")
+    try:
+        query = keyset_query(
+            parse_time(request.args.get("from"), "from"), parse_time(request.args.get("to"), "to")
+        )
+
+        if fmt in ("ndjson", "csv"):
+            fields = parse_fields(request.args.get("fields"))
+            cursor = collection.find(keyset_filter(query, token), fields_projection(fields)).sort(KEYSET_SORT)
+            if fmt == "csv":
+                return csv_response(cursor, fields, f"{name}-{datetime.utcnow():%Y%m%d%H%M%S}.csv")
+            return ndjson_response(cursor)
+        if fmt:
+            return error("format must be ndjson or csv", 400)
+
+        limit = parse_limit(request.args.get("limit"))
+        keyset_filter(query, token)  # reject a bad cursor before the version probe
+    except ValueError as e:
+        return error(str(e), 400)
+
+    def render():
+        docs, next_cursor = fetch_page(collection, query, None, token, limit)
+        if not docs and not token:
+            return success(f"No {name} found", [], next_cursor=None)
+        return success(f"{name.capitalize()} fetched successfully", docs, next_cursor=next_cursor)
+
+    return versioned(version_etag(list_version(collection, query), request.query_string.decode()), render)
+
+
 @admin_required
 def view_feedback():
-    """Returns all feedback messages (sorted newest first)."""
-    db = get_db()
-    feedbacks = list(db.feedback.find().sort("created_at", -1))
-    for f in feedbacks:
-        f["_id"] = str(f["_id"])
-    return success("Feedback fetched successfully", feedbacks)
+    """Feedback messages, newest first (paginated; ?format=ndjson|csv exports all)."""
+    return _list_or_export(get_db().feedback, "feedback")
 
 
 # ==========================================================
@@ -162,13 +224,8 @@ def view_feedback():
 @admin_required
 def delete_confession(confession_id):
     """Marks a confession as deleted."""
-    db = get_db()
     try:
-        result = db.confessions.update_one(
-            {"_id": ObjectId(confession_id)},
-            {"$set": {"status": "deleted"}}
-        )
-        if result.modified_count == 0:
+        if not ConfessionModel.delete(confession_id):
             return error("Confession not found", 404)
         return success("Confession deleted successfully")
     except Exception as e:
@@ -180,15 +237,8 @@ def delete_confession(confession_id):
 # ==========================================================
 @admin_required
 def view_reports():
-    """Shows all user-submitted reports."""
-    db = get_db()
-    if "reports" not in db.list_collection_names():
-        return success("No reports found", [])
-
-    reports = list(db.reports.find().sort("created_at", -1))
-    for r in reports:
-        r["_id"] = str(r["_id"])
-    return success("Reports fetched successfully", reports)
+    """User-submitted reports, newest first (paginated; ?format=ndjson|csv exports all)."""
+    return _list_or_export(get_db().reports, "reports")
 
 
 # ==========================================================
@@ -196,19 +246,31 @@ def view_reports():
 # ==========================================================
 @admin_required
 def system_health():
-    """Returns system status & DB stats for monitoring."""
-    db = get_db()
+    """
+    Returns system status & DB stats for monitoring (dbStats is sampled in
+    the background). 503 with status "degraded" when the last sample failed
+    or is stale.
+    """
     try:
-        db_stats = db.command("dbStats")
-        print(f"🔍 Health check at {datetime.utcnow()} | DB size: {db_stats['dataSize']} bytes")
-        return success("System healthy", {
-            "database_size_MB": round(db_stats["dataSize"] / 1024 / 1024, 2),
-            "collections": db.list_collection_names(),
-            "server_time": datetime.utcnow().isoformat() + "Z"
-        })
+        collections = collection_catalog.names()
     except Exception as e:
         return error(f"Health check failed: {str(e)}", 500)
 
+    snapshot = db_stats_sampler.snapshot()
+    problem = db_stats_sampler.problem(snapshot)
+    snapshot = snapshot or {}
+    data_size = snapshot.get("data_size")
+    message = f"System degraded: {problem}" if problem else "System healthy"
+    return success(message, {
+        "status": "degraded" if problem else "ok",
+        "database_size_MB": round(data_size / 1024 / 1024, 2) if data_size is not None else None,
+        "db_stats_sampled_at": snapshot.get("sampled_at"),
+        "db_stats_error": snapshot.get("error"),
+        "collections": collections,
+        "connection_pool": pool_stats.snapshot(),
+        "server_time": datetime.utcnow().isoformat() + "Z"
+    }, code=503 if problem else 200)
+
 
 # ==========================================================
 # 9️⃣ LIST ALL ADMINS
@@ -220,11 +282,8 @@ def get_all_admins():
     if decoded.get("role") != "superadmin":
         return error("Unauthorized access", 403)
 
-    db = get_db()
-    admins = list(db.admins.find({}, {"password_hash": 0}))
-    for a in admins:
-        a["_id"] = str(a["_id"])
-    return success("All admins fetched", admins)
+    etag = version_etag(list_version(get_db().admins, {}, ADMIN_VERSION_FIELDS))
+    return versioned(etag, lambda: success("All admins fetched", AdminModel.list_admins()))
 
 
 # ==========================================================
@@ -249,7 +308,10 @@ def create_moderator():
     if existing:
         return error("Username already exists", 409)
 
-    AdminModel.create_admin(username, email, password, role="moderator")
+    try:
+        AdminModel.create_admin(username, email, password, role="moderator")
+    except HashingBusy:
+        return busy()
     return success(f"Moderator '{username}' created successfully", code=201)
 
 
@@ -263,30 +325,119 @@ def delete_admin(username):
     if decoded.get("role") != "superadmin":
         return error("Only superadmins can delete admins", 403)
 
-    db = get_db()
-    result = db.admins.delete_one({"username": username})
-    if result.deleted_count == 0:
+    if not AdminModel.delete_admin(username):
         return error("Admin not found", 404)
     return success(f"Admin '{username}' deleted")
 
 
 # ==========================================================
-# 12️⃣ SEARCH CONFESSIONS BY MOOD / STATUS
+# 12️⃣ SEARCH CONFESSIONS (FILTERS / KEYWORDS)
 # ==========================================================
 @admin_required
 def search_confessions():
-    """Allows admin to search confessions by mood or status."""
+    """
+    Allows admin to search confessions by mood, status, time range or keywords.
+    - ?q=words (word* = prefix, &prefix=1 = last word is a prefix): ranked,
+      paginated with ?offset=&limit=
+    - otherwise keyset-paginated via ?cursor=&limit=; ?format=ndjson streams all matches.
+    Time range: ?from=&to= (ISO-8601).
+    """
     db = get_db()
     mood = request.args.get("mood")
     status = request.args.get("status", "active")
+    token = request.args.get("cursor")
+    q = request.args.get("q", "").strip()
+
+    try:
+        since = parse_time(request.args.get("from"), "from")
+        until = parse_time(request.args.get("to"), "to")
+
+        if q:
+            limit = parse_limit(request.args.get("limit"))
+            offset = parse_offset(request.args.get("offset"))
+            confessions, has_more = ConfessionModel.search(
+                q, mood=mood, status=status, since=since, until=until,
+                prefix_last=request.args.get("prefix") in ("1", "true"),
+                offset=offset, limit=limit
+            )
+            return success("Confessions search results", confessions,
+                           next_offset=offset + limit if has_more else None)
+
+        query = ConfessionModel.search_filter(mood, status, since, until)
+
+        if request.args.get("format") == "ndjson":
+            cursor = db.confessions.find(
+                keyset_filter(query, token), ConfessionModel.LIST_PROJECTION
+            ).sort(KEYSET_SORT)
+            return ndjson_response(cursor)
+
+        limit = parse_limit(request.args.get("limit"))
+        keyset_filter(query, token)
+    except ValueError as e:
+        return error(str(e), 400)
+
+    def render():
+        confessions, next_cursor = ConfessionModel.search_page(query, token, limit)
+        return success("Confessions search results", confessions, next_cursor=next_cursor)
+
+    marker = list_version(db.confessions, query)
+    return versioned(version_etag(marker, request.query_string.decode(), mutable_epoch()), render)
+
+
+# ==========================================================
+# 13️⃣ ANALYTICS TIME SERIES (PRE-AGGREGATED ROLLUPS)
+# ==========================================================
+@admin_required
+def analytics_series():
+    """
+    Confession counts, mood distribution and reaction totals per bucket.
+    ?granularity=minute|hour|day&from=&to= (ISO-8601). Survives the 24h TTL.
+    """
+    try:
+        buckets = rollups.series(
+            request.args.get("granularity", "hour"),
+            since=parse_time(request.args.get("from"), "from"),
+            until=parse_time(request.args.get("to"), "to")
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+    return success("Analytics fetched", buckets)
+
+
+# ==========================================================
+# 14️⃣ BULK MODERATION (IDS OR FILTER, CHUNKED WRITES)
+# ==========================================================
+@admin_required
+def bulk_moderate():
+    """
+    Soft-delete / hide / restore many confessions at once.
+    Body: {"ids": [...]} or {"filter": {mood, from, to, text, session_id}},
+    optional "status" (default "deleted") and "background": true.
+    Small batches answer 200 with per-item results; large ones answer 202 with a job.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        report, job = moderation.moderate(data, moderator=request.admin_user.get("username"))
+    except ValueError as e:
+        return error(str(e), 400)
 
-    query = {}
-    if mood:
-        query["mood"] = mood
-    if status:
-        query["status"] = status
+    if job is not None:
+        response, code = success("Moderation job queued", _job_view(job), code=202)
+        response.headers["Location"] = f"/api/admin/moderation/jobs/{job['_id']}"
+        return response, code
+    return success(f"{report['counts']['updated']} confessions moderated", report)
 
-    confessions = list(db.confessions.find(query).sort("created_at", -1))
-    for c in confessions:
-        c["_id"] = str(c["_id"])
-    return success("Confessions search results", confessions)
+
+def _job_view(job):
+    view = {k: v for k, v in job.items() if k != "_id"}
+    view["job_id"] = job["_id"]
+    return view
+
+
+@admin_required
+def moderation_job_status(job_id):
+    """Progress of a background moderation job."""
+    job = moderation.moderation_jobs.get(job_id)
+    if not job:
+        return error("Job not found", 404)
+    return success("Moderation job status", _job_view(job))
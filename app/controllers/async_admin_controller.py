@@ -0,0 +1,129 @@
+# ==========================================================
+# 💬 CONFESSLY — ASYNC ADMIN CONTROLLER (ASGI MODE)
+# File: app/controllers/async_admin_controller.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Read-only admin views served on the event loop when the app runs under
+ASGI (see app/asgi.py). They reuse the models' queries and the sync
+controller's caches, and answer with the same envelopes. A handler that
+returns None hands the request to the Flask app instead.
+"""
+
+import asyncio
+from app.controllers.admin_controller import (
+    ADMIN_VERSION_FIELDS, _compute_dashboard, _dashboard_cache, mutable_epoch
+)
+from app.db import get_async_db
+from app.models.admin import AdminModel
+from app.models.confession import ConfessionModel
+from app.utils.auth import async_admin_required
+from app.utils.pagination import afetch_page, alist_version, keyset_filter, keyset_query, parse_limit, parse_time
+from app.utils.responses import (
+    plain_conditional_success, plain_error, plain_success, plain_versioned, version_etag
+)
+
+
+# ==========================================================
+# 3️⃣ ADMIN PROFILE INFO
+# ==========================================================
+@async_admin_required
+async def get_admin_profile(req):
+    admin = await AdminModel.get_profile_async(req.admin_user.get("username"))
+    if not admin:
+        return plain_error("Admin not found", 404)
+
+    return plain_success("Admin profile fetched", {
+        "username": admin["username"],
+        "email": admin["email"],
+        "role": admin["role"],
+        "last_login": admin.get("last_login"),
+        "created_at": admin.get("created_at")
+    })
+
+
+# ==========================================================
+# 4️⃣ DASHBOARD SUMMARY DATA
+# ==========================================================
+@async_admin_required
+async def dashboard_summary(req):
+    # Single-flight with the sync view: concurrent misses share one computation
+    data, etag = await asyncio.to_thread(_dashboard_cache.get_or_compute, "summary", _compute_dashboard)
+    return plain_conditional_success(req, "Dashboard summary fetched", data, etag)
+
+
+# ==========================================================
+# 5️⃣ / 7️⃣ VIEW FEEDBACK & REPORTS (PAGINATED)
+# ==========================================================
+async def _list_page(req, collection, name):
+    """Keyset page; ?format= exports stream from the sync view."""
+    if req.args.get("format"):
+        return None
+    token = req.args.get("cursor")
+    try:
+        query = keyset_query(parse_time(req.args.get("from"), "from"), parse_time(req.args.get("to"), "to"))
+        limit = parse_limit(req.args.get("limit"))
+        keyset_filter(query, token)
+    except ValueError as e:
+        return plain_error(str(e), 400)
+
+    async def render():
+        docs, next_cursor = await afetch_page(collection, query, None, token, limit)
+        if not docs and not token:
+            return plain_success(f"No {name} found", [], next_cursor=None)
+        return plain_success(f"{name.capitalize()} fetched successfully", docs, next_cursor=next_cursor)
+
+    etag = version_etag(await alist_version(collection, query), req.query_string.decode())
+    return await plain_versioned(req, etag, render)
+
+
+@async_admin_required
+async def view_feedback(req):
+    return await _list_page(req, get_async_db().feedback, "feedback")
+
+
+@async_admin_required
+async def view_reports(req):
+    return await _list_page(req, get_async_db().reports, "reports")
+
+
+# ==========================================================
+# 9️⃣ LIST ALL ADMINS
+# ==========================================================
+@async_admin_required
+async def get_all_admins(req):
+    if req.admin_user.get("role") != "superadmin":
+        return plain_error("Unauthorized access", 403)
+
+    async def render():
+        return plain_success("All admins fetched", await AdminModel.list_admins_async())
+
+    etag = version_etag(await alist_version(get_async_db().admins, {}, ADMIN_VERSION_FIELDS))
+    return await plain_versioned(req, etag, render)
+
+
+# ==========================================================
+# 12️⃣ SEARCH CONFESSIONS (KEYSET MODE)
+# ==========================================================
+@async_admin_required
+async def search_confessions(req):
+    """Filter/keyset searches; ranked (?q=) and NDJSON requests go to the sync view."""
+    if req.args.get("q", "").strip() or req.args.get("format") == "ndjson":
+        return None
+
+    try:
+        query = ConfessionModel.search_filter(
+            req.args.get("mood"), req.args.get("status", "active"),
+            parse_time(req.args.get("from"), "from"), parse_time(req.args.get("to"), "to")
+        )
+        token, limit = req.args.get("cursor"), parse_limit(req.args.get("limit"))
+        keyset_filter(query, token)
+    except ValueError as e:
+        return plain_error(str(e), 400)
+
+    async def render():
+        confessions, next_cursor = await ConfessionModel.search_page_async(query, token, limit)
+        return plain_success("Confessions search results", confessions, next_cursor=next_cursor)
+
+    marker = await alist_version(get_async_db().confessions, query)
+    return await plain_versioned(req, version_etag(marker, req.query_string.decode(), mutable_epoch()), render)
@@ -0,0 +1,40 @@
+# ==========================================================
+# 💬 CONFESSLY — ASYNC PUBLIC CONFESSION CONTROLLER (ASGI MODE)
+# File: app/controllers/async_confession_controller.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import asyncio
+from werkzeug.wrappers import Response
+from app.config import Config
+from app.controllers.confession_controller import parse_stream_ids
+from app.services.live import SSE_HEADERS, SSE_KEEPALIVE, SSE_RETRY, live_hub
+from app.utils.responses import plain_error
+
+
+# ==========================================================
+# 3️⃣ LIVE STREAM (SERVER-SENT EVENTS)
+# ==========================================================
+async def stream_live(req):
+    """Same stream as the sync view, but an idle client costs a coroutine, not a thread."""
+    if not Config.LIVE_ENABLED:
+        return plain_error("Live updates are disabled", 503)
+    try:
+        ids = parse_stream_ids(req.args.get("ids"))
+    except ValueError as e:
+        return plain_error(str(e), 400)
+
+    subscriber = live_hub.subscribe(ids, loop=asyncio.get_running_loop())
+    if subscriber is None:
+        return plain_error("Too many live connections, retry shortly", 503)
+
+    async def generate():
+        try:
+            yield SSE_RETRY
+            while True:
+                yield await subscriber.next_chunk(Config.LIVE_KEEPALIVE) or SSE_KEEPALIVE
+        finally:
+            live_hub.unsubscribe(subscriber)
+
+    # app/asgi.py streams bodies that are async iterators
+    return Response(generate(), mimetype="text/event-stream", headers=SSE_HEADERS)
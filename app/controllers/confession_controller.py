@@ -0,0 +1,108 @@
+# ==========================================================
+# 💬 CONFESSLY — PUBLIC CONFESSION CONTROLLER
+# File: app/controllers/confession_controller.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from bson import ObjectId
+from flask import Response, request
+from app.config import Config
+from app.models.confession import ConfessionModel
+from app.models.user import UserModel
+from app.services.live import SSE_HEADERS, SSE_KEEPALIVE, SSE_RETRY, live_hub
+from app.utils.pagination import parse_limit
+from app.utils.rate_limit import client_session
+from app.utils.responses import error, success
+
+
+# ==========================================================
+# 1️⃣ PUBLIC FEED (KEYSET PAGINATED, HOT PAGES CACHED)
+# ==========================================================
+def get_feed():
+    """Newest active confessions. Pass ?cursor=<next_cursor> for the next page."""
+    try:
+        limit = parse_limit(request.args.get("limit"), default=Config.FEED_PAGE_SIZE, maximum=50)
+        confessions, next_cursor = ConfessionModel.get_page(request.args.get("cursor"), limit)
+    except ValueError as e:
+        return error(str(e), 400)
+
+    return success("Feed fetched", confessions, next_cursor=next_cursor)
+
+
+# ==========================================================
+# 2️⃣ TRENDING CONFESSIONS (TIME-DECAYED HOTNESS)
+# ==========================================================
+def get_trending():
+    """Top confessions by recent engagement."""
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=Config.TRENDING_TOP_K)
+    except ValueError as e:
+        return error(str(e), 400)
+
+    return success("Trending confessions fetched", ConfessionModel.get_trending(limit))
+
+
+# ==========================================================
+# 3️⃣ LIVE STREAM (SERVER-SENT EVENTS)
+# ==========================================================
+MAX_STREAM_IDS = 100
+
+
+def parse_stream_ids(raw):
+    """?ids=a,b,c -> set of confession id strings (None = every confession)."""
+    if not raw:
+        return None
+    ids = {part.strip() for part in raw.split(",") if part.strip()}
+    if len(ids) > MAX_STREAM_IDS or not all(ObjectId.is_valid(i) for i in ids):
+        raise ValueError(f"ids must be up to {MAX_STREAM_IDS} comma-separated confession ids")
+    return ids
+
+
+def stream_live():
+    """
+    New confessions, reaction deltas and deletions as text/event-stream.
+    Each connection holds a worker thread for its whole life, so this view
+    refuses gunicorn's sync workers (a few clients would pin all of them);
+    asgi.py serves the same route on the event loop.
+    """
+    if not Config.LIVE_ENABLED:
+        return error("Live updates are disabled", 503)
+    if not (request.environ.get("wsgi.multithread") or Config.LIVE_SYNC_STREAM):
+        return error("Live updates need ASGI mode (asgi.py) or a threaded/async worker", 503)
+    try:
+        ids = parse_stream_ids(request.args.get("ids"))
+    except ValueError as e:
+        return error(str(e), 400)
+
+    subscriber = live_hub.subscribe(ids)
+    if subscriber is None:
+        return error("Too many live connections, retry shortly", 503)
+
+    def generate():
+        try:
+            yield SSE_RETRY
+            while True:
+                yield subscriber.wait(Config.LIVE_KEEPALIVE) or SSE_KEEPALIVE
+        finally:
+            live_hub.unsubscribe(subscriber)
+
+    return Response(generate(), mimetype="text/event-stream", headers=SSE_HEADERS)
+
+
+# ==========================================================
+# 4️⃣ SESSION HISTORY (OWN CONFESSIONS / REPLIES, KEYSET PAGINATED)
+# ==========================================================
+def get_history():
+    """The caller's own items, newest first. Session from X-Session-ID; ?kind=confession|reply."""
+    session_id = client_session()
+    if not session_id:
+        return error("X-Session-ID header required", 401)
+    try:
+        limit = parse_limit(request.args.get("limit"), default=Config.FEED_PAGE_SIZE, maximum=50)
+        items, next_cursor = UserModel.get_history(
+            session_id, request.args.get("kind", "confession"), request.args.get("cursor"), limit
+        )
+    except ValueError as e:
+        return error(str(e), 400)
+
+    return success("History fetched", items, next_cursor=next_cursor)
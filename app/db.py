@@ -4,44 +4,420 @@
 # Author: Jaydevsinh Gohil
 # ==========================================================
 
-from pymongo import MongoClient
+import argparse
+import hashlib
+import json
 import os
+import socket
+import sys
+import threading
+from datetime import datetime, timedelta
+import pymongo
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient
+from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError
+from app.config import Config
+from app.utils.mongo_monitoring import command_timing, pool_stats
 
 client = None
 db = None
+_client_pid = None  # process that owns `client` (gunicorn forks after create_app)
+_initialized = False
+_client_lock = threading.Lock()
+async_client = None  # ASGI mode only (see get_async_db)
+_async_loop = None
 
+# Index reconciliation state for this process (reported by readiness())
+_index_state = "pending"
+META_COLLECTION = "app_meta"  # {_id: "index_sync", fingerprint, lease_until, synced_at}
+INDEX_SYNC_LEASE = timedelta(seconds=120)
 
-def init_db(app):
-    """Initialize MongoDB connection and create TTL indexes."""
-    global client, db
+# Wire compressors and the module each one needs (zlib ships with Python)
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+
+# ----------------------------------------------------------
+# Index registry: collection name -> {index name: IndexModel}
+# Models contribute their indexes via register_indexes() at import.
+# ----------------------------------------------------------
+INDEX_REGISTRY = {}
+
+# Options that change index behaviour (compared during verification)
+_INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+
+def register_indexes(collection, *indexes):
+    """Declare the indexes a collection needs (IndexModel instances with a name)."""
+    entries = INDEX_REGISTRY.setdefault(collection, {})
+    for index in indexes:
+        name = index.document["name"]
+        entries[name] = index
+
+
+# `replies` and `reports` have no model of their own, so their indexes live here
+register_indexes(
+    "replies",
+    IndexModel([("created_at", ASCENDING)], name="created_at_1", expireAfterSeconds=86400),
+)
+register_indexes(
+    "reports",
+    # Keyset pages / exports: (created_at, _id) newest first (replaces created_at_-1)
+    IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+)
+
+
+def _available_compressors(names):
+    """Keep only the requested compressors whose optional package is installed."""
+    available = []
+    for name in [n.strip() for n in names.split(",") if n.strip()]:
+        module = _COMPRESSOR_MODULES.get(name, name)
+        if module:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+        available.append(name)
+    return available
+
+
+def client_options():
+    """MongoClient keyword arguments built from Config (pool, compression, reads)."""
+    options = {
+        "tls": Config.MONGO_TLS,
+        "serverSelectionTimeoutMS": Config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "maxPoolSize": Config.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": Config.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": Config.MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": Config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "readPreference": Config.MONGO_READ_PREFERENCE,
+        "event_listeners": [pool_stats, command_timing]
+    }
+    if Config.MONGO_TLS:
+        # TLS fix for GitHub Codespaces + MongoDB Atlas SSL handshake issue
+        # (set MONGO_TLS_ALLOW_INVALID_CERTS=false in production with valid CA certs)
+        options["tlsAllowInvalidCertificates"] = Config.MONGO_TLS_ALLOW_INVALID_CERTS
+    compressors = _available_compressors(Config.MONGO_COMPRESSORS)
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
+
+def _connect():
+    """Create this process's MongoClient and return the confessly database."""
+    global client, db, _client_pid
 
     mongo_uri = os.getenv("MONGO_URI")
     if not mongo_uri:
         raise ValueError("⚠️ MONGO_URI not found in environment variables.")
 
-    # TLS fix for GitHub Codespaces + MongoDB Atlas SSL handshake issue
-    client = MongoClient(
-        mongo_uri,
-        tls=True,
-        tlsAllowInvalidCertificates=True,  # remove this in production if you have valid CA certs
-        serverSelectionTimeoutMS=20000
+    with _client_lock:
+        if client is None or _client_pid != os.getpid():
+            client = MongoClient(mongo_uri, **client_options())
+            db = client.get_database("confessly")
+            _client_pid = os.getpid()
+    return db
+
+
+def _reset_after_fork():
+    """
+    Runs in every forked child. The parent's client (and its sockets) must
+    not be reused, so drop the reference; get_db() reconnects lazily.
+    """
+    global client, db, _client_pid, async_client, _async_loop
+    client = None
+    db = None
+    _client_pid = None
+    async_client = None
+    _async_loop = None
+    pool_stats.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_client():
+    """Returns this worker's MongoClient, creating it on first use."""
+    get_db()
+    return client
+
+
+def get_async_db():
+    """
+    Returns the asyncio database for the running event loop (ASGI mode).
+    Motor clients are bound to the loop they first run on, so a new loop
+    (e.g. a fresh worker) gets its own client. Requires `motor`.
+    """
+    global async_client, _async_loop
+    import asyncio  # ASGI mode only; keeps it off the sync startup path
+    loop = asyncio.get_running_loop()
+    if async_client is None or _async_loop is not loop:
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+        except ImportError:
+            raise RuntimeError("⚠️ ASGI mode needs the async driver: pip install motor")
+        mongo_uri = os.getenv("MONGO_URI")
+        if not mongo_uri:
+            raise ValueError("⚠️ MONGO_URI not found in environment variables.")
+        async_client = AsyncIOMotorClient(mongo_uri, io_loop=loop, **client_options())
+        _async_loop = loop
+    return async_client.get_database("confessly")
+
+
+def close_async_client():
+    """Close the asyncio client (ASGI lifespan shutdown)."""
+    global async_client, _async_loop
+    if async_client is not None:
+        async_client.close()
+    async_client = None
+    _async_loop = None
+
+
+def _load_models():
+    """Import every model so its indexes are registered."""
+    import app.models  # noqa: F401
+
+
+def _same_options(spec, live):
+    return all(spec.get(opt) == live.get(opt) for opt in _INDEX_OPTIONS)
+
+
+def ensure_indexes(database=None):
+    """
+    Reconcile registered indexes against the live database (idempotent).
+    Missing indexes are created; TTL drift is fixed with collMod; other
+    option conflicts are reported, never dropped automatically.
+    Returns a report dict: {"created": [...], "updated": [...], "conflicts": [...]}.
+    """
+    database = database if database is not None else db
+    _load_models()
+    report = {"created": [], "updated": [], "conflicts": []}
+
+    for coll_name, indexes in INDEX_REGISTRY.items():
+        collection = database[coll_name]
+        live = collection.index_information()
+        missing = []
+
+        for name, index in indexes.items():
+            spec = index.document
+            if name not in live:
+                missing.append(index)
+                continue
+            current = live[name]
+            if list(current["key"]) != list(spec["key"].items()):
+                report["conflicts"].append(f"{coll_name}.{name}: key mismatch")
+            elif not _same_options(spec, current):
+                ttl = spec.get("expireAfterSeconds")
+                only_ttl = all(
+                    spec.get(opt) == current.get(opt)
+                    for opt in _INDEX_OPTIONS if opt != "expireAfterSeconds"
+                )
+                if ttl is not None and only_ttl:
+                    database.command("collMod", coll_name, index={
+                        "name": name, "expireAfterSeconds": ttl
+                    })
+                    report["updated"].append(f"{coll_name}.{name}")
+                else:
+                    report["conflicts"].append(f"{coll_name}.{name}: option mismatch")
+
+        for index in missing:
+            name = index.document["name"]
+            try:
+                collection.create_indexes([index])
+                report["created"].append(f"{coll_name}.{name}")
+            except OperationFailure as e:
+                # e.g. duplicate keys blocking a unique index
+                report["conflicts"].append(f"{coll_name}.{name}: {e.details.get('errmsg', e)}")
+
+    return report
+
+
+def verify_indexes(database=None):
+    """
+    Compare registry vs live database without changing anything.
+    Returns {"missing": [...], "unregistered": [...], "unused": [...]}.
+    "unused" lists live indexes with zero accesses since server start ($indexStats).
+    """
+    database = database if database is not None else db
+    _load_models()
+    report = {"missing": [], "unregistered": [], "unused": []}
+
+    for coll_name in sorted(set(INDEX_REGISTRY) | set(database.list_collection_names())):
+        collection = database[coll_name]
+        wanted = INDEX_REGISTRY.get(coll_name, {})
+        live = collection.index_information()
+
+        report["missing"] += [f"{coll_name}.{name}" for name in wanted if name not in live]
+        report["unregistered"] += [
+            f"{coll_name}.{name}" for name in live
+            if name != "_id_" and name not in wanted
+        ]
+        try:
+            for stat in collection.aggregate([{"$indexStats": {}}]):
+                if stat["name"] != "_id_" and stat["accesses"]["ops"] == 0:
+                    report["unused"].append(f"{coll_name}.{stat['name']}")
+        except OperationFailure:
+            pass  # $indexStats not permitted (e.g. restricted Atlas tier)
+
+    return report
+
+
+def registry_fingerprint():
+    """Stable hash of every registered index spec (changes when a deploy alters indexes)."""
+    _load_models()
+    spec = {
+        coll: {name: index.document for name, index in sorted(indexes.items())}
+        for coll, indexes in sorted(INDEX_REGISTRY.items())
+    }
+    return hashlib.sha1(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _claim_index_sync(database, fingerprint):
+    """
+    Take the index-sync lease unless this fingerprint is already synced or
+    another process holds a live lease. One round trip; False means skip.
+    """
+    now = datetime.utcnow()
+    try:
+        database[META_COLLECTION].update_one(
+            {"_id": "index_sync", "fingerprint": {"$ne": fingerprint}, "lease_until": {"$not": {"$gt": now}}},
+            {"$set": {"lease_until": now + INDEX_SYNC_LEASE, "holder": f"{socket.gethostname()}:{os.getpid()}"}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return False  # the document exists but did not match: synced, or leased elsewhere
+    return True
+
+
+def _mark_synced(database, fingerprint):
+    now = datetime.utcnow()
+    database[META_COLLECTION].update_one(
+        {"_id": "index_sync"},
+        {"$set": {"fingerprint": fingerprint, "synced_at": now, "lease_until": now}},
+        upsert=True
     )
 
-    db = client.get_database("confessly")
 
-    # Create TTL indexes (auto-delete old data)
+def sync_indexes_once(database=None):
+    """
+    Reconcile indexes only if no process has done so for the current
+    registry. Returns the ensure_indexes report, or None when skipped.
+    """
+    global _index_state
+    database = database if database is not None else get_db()
+    fingerprint = registry_fingerprint()
+    if not _claim_index_sync(database, fingerprint):
+        _index_state = "synced"
+        return None
+
+    report = ensure_indexes(database)
+    _mark_synced(database, fingerprint)
+    _index_state = "synced"
+    return report
+
+
+def _log_index_report(report):
+    print(f"✅ MongoDB indexes reconciled | created: {len(report['created'])}, "
+          f"updated: {len(report['updated'])}")
+    for conflict in report["conflicts"]:
+        print(f"⚠️ Index conflict: {conflict}")
+
+
+def _background_index_sync():
+    global _index_state
     try:
-        db.confessions.create_index("created_at", expireAfterSeconds=86400)   # 24 hrs
-        db.replies.create_index("created_at", expireAfterSeconds=86400)
-        db.sessions.create_index("last_activity", expireAfterSeconds=604800)  # 7 days
-        print("✅ MongoDB connected and TTL indexes applied!")
-    except Exception as e:
+        report = sync_indexes_once()
+        if report is not None:
+            _log_index_report(report)
+    except PyMongoError as e:
+        _index_state = "failed"
         print(f"⚠️ MongoDB index creation skipped or failed: {e}")
 
-    # Attach DB to app context
-    app.db = db
+
+def init_db(app):
+    """
+    Register MongoDB for this app without blocking worker boot.
+    The client is created on first use (get_db); index reconciliation
+    follows Config.INDEX_SYNC:
+      once   — background thread; only the first process per registry
+               version does the work (lease in app_meta), others skip
+      worker — every worker reconciles inline (old behaviour)
+      off    — nothing at boot; run `python -m app.db sync` at deploy
+    """
+    global _initialized, _index_state
+    if not os.getenv("MONGO_URI"):
+        raise ValueError("⚠️ MONGO_URI not found in environment variables.")
+    _initialized = True
+
+    mode = Config.INDEX_SYNC
+    if mode == "off":
+        _index_state = "skipped"
+    elif mode == "worker":
+        try:
+            _log_index_report(ensure_indexes(get_db()))
+            _index_state = "synced"
+        except PyMongoError as e:
+            _index_state = "failed"
+            print(f"⚠️ MongoDB index creation skipped or failed: {e}")
+    else:
+        threading.Thread(target=_background_index_sync, name="confessly-index-sync", daemon=True).start()
+
+
+def readiness():
+    """
+    Ready when the primary answers a ping within READINESS_TIMEOUT_MS
+    (liveness never touches Mongo). Returns (ready, details).
+    """
+    details = {"indexes": _index_state}
+    try:
+        database = get_db()
+        if database is None:
+            details["mongo"] = "not_initialized"
+        else:
+            with pymongo.timeout(Config.READINESS_TIMEOUT_MS / 1000):
+                database.command("ping")
+            details["mongo"] = "ok"
+    except (PyMongoError, ValueError) as e:
+        details["mongo"] = type(e).__name__
+    return details["mongo"] == "ok", details
 
 
 def get_db():
-    """Returns current MongoDB instance."""
+    """
+    Returns current MongoDB instance.
+    After a fork the client is rebuilt lazily in the child on first use.
+    """
+    if _initialized and (db is None or _client_pid != os.getpid()):
+        _connect()
     return db
+
+
+# ----------------------------------------------------------
+# CLI: python -m app.db [sync|verify]
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confessly index manager")
+    parser.add_argument("command", choices=["sync", "verify"], nargs="?", default="verify")
+    args = parser.parse_args(argv)
+
+    database = _connect()
+
+    if args.command == "sync":
+        # Also records the registry fingerprint so workers booting with
+        # INDEX_SYNC=once skip reconciliation for this version
+        report = ensure_indexes(database)
+        _mark_synced(database, registry_fingerprint())
+    else:
+        report = verify_indexes(database)
+
+    for key, items in report.items():
+        print(f"{key}: {len(items)}")
+        for item in items:
+            print(f"  - {item}")
+
+    problems = report.get("missing", []) + report.get("conflicts", [])
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    # Run through the package module so model registrations land in the same registry
+    from app.db import main as _main
+    sys.exit(_main())
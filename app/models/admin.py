@@ -5,18 +5,26 @@
 # ==========================================================
 
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
-from app.db import get_db
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_async_db, get_db, register_indexes
+from app.utils.cache import TTLCache
+from app.utils.hashing import HashingBusy, hashing_pool, password_hasher
 
 
 class AdminModel:
     """Handles admin creation, authentication, and management."""
 
+    # username -> profile (no password hash); short TTL, invalidated on writes
+    _profile_cache = TTLCache(ttl=Config.ADMIN_PROFILE_CACHE_TTL, maxsize=1024)
+    PROFILE_PROJECTION = {"password_hash": 0}
+
     @staticmethod
     def _collection():
         """Fetch the admins collection only after DB initialization."""
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.admins
 
@@ -25,7 +33,7 @@ class AdminModel:
     # ------------------------------------------------------
     @staticmethod
     def create_admin(username, email, password, role="superadmin"):
-        hashed_pw = generate_password_hash(password)
+        hashed_pw = hashing_pool.hash(password)
         admin = {
             "username": username,
             "email": email,
@@ -37,6 +45,7 @@ class AdminModel:
             "last_login": None
         }
         AdminModel._collection().insert_one(admin)
+        AdminModel.invalidate_profile(username)
 
     # ------------------------------------------------------
     # Find admin by username
@@ -46,11 +55,71 @@ class AdminModel:
         return AdminModel._collection().find_one({"username": username})
 
     # ------------------------------------------------------
-    # Verify password
+    # Cached profile lookup (no password hash)
+    # ------------------------------------------------------
+    @staticmethod
+    def get_profile(username):
+        return AdminModel._profile_cache.get_or_compute(
+            username,
+            lambda: AdminModel._collection().find_one(
+                {"username": username}, AdminModel.PROFILE_PROJECTION
+            )
+        )
+
+    @staticmethod
+    async def get_profile_async(username):
+        """get_profile on the asyncio client (ASGI mode); shares the same cache."""
+        profile = AdminModel._profile_cache.get(username)
+        if profile is None:
+            profile = await get_async_db().admins.find_one(
+                {"username": username}, AdminModel.PROFILE_PROJECTION
+            )
+            if profile is not None:
+                AdminModel._profile_cache.set(username, profile)
+        return profile
+
+    @staticmethod
+    def invalidate_profile(username):
+        AdminModel._profile_cache.delete(username)
+
+    # ------------------------------------------------------
+    # List admins (no password hashes)
+    # ------------------------------------------------------
+    @staticmethod
+    def list_admins():
+        return list(AdminModel._collection().find({}, AdminModel.PROFILE_PROJECTION))
+
+    @staticmethod
+    async def list_admins_async():
+        return await get_async_db().admins.find({}, AdminModel.PROFILE_PROJECTION).to_list(length=None)
+
+    # ------------------------------------------------------
+    # Delete admin
+    # ------------------------------------------------------
+    @staticmethod
+    def delete_admin(username):
+        result = AdminModel._collection().delete_one({"username": username})
+        AdminModel.invalidate_profile(username)
+        return result.deleted_count > 0
+
+    # ------------------------------------------------------
+    # Verify password (rehashes legacy / outdated hashes on success)
     # ------------------------------------------------------
     @staticmethod
     def verify_password(admin_data, password):
-        return check_password_hash(admin_data["password_hash"], password)
+        password_hash = admin_data["password_hash"]
+        if not hashing_pool.verify(password_hash, password):
+            return False
+        if password_hasher.needs_rehash(password_hash):
+            # Best effort: a busy pool or failed write must not fail a valid login
+            try:
+                AdminModel._collection().update_one(
+                    {"_id": admin_data["_id"], "password_hash": password_hash},
+                    {"$set": {"password_hash": hashing_pool.hash(password)}}
+                )
+            except (HashingBusy, PyMongoError) as e:
+                print(f"⚠️ Password rehash skipped (retried next login): {e}")
+        return True
 
     # ------------------------------------------------------
     # Update last login timestamp
@@ -61,3 +130,10 @@ class AdminModel:
             {"username": username},
             {"$set": {"last_login": datetime.utcnow()}}
         )
+        AdminModel.invalidate_profile(username)
+
+
+register_indexes(
+    "admins",
+    IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+)
@@ -6,33 +6,104 @@
 
 from datetime import datetime
 from bson import ObjectId
-from app.db import get_db
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from app.db import get_async_db, get_db, register_indexes
+from app.services import rollups
+from app.services.feed import feed_cache
+from app.services.live import live_hub
+from app.services.mood import mood_pipeline
+from app.services.search import confession_search
+from app.services.trending import trending_engine
+from app.utils.pagination import KEYSET_SORT, afetch_page, fetch_page, time_filter
+from app.utils.write_behind import write_buffer
 
 
 class ConfessionModel:
     """Handles CRUD operations for confessions."""
 
+    # Fields returned by list endpoints (leaves out ip_hash & other heavy fields)
+    LIST_PROJECTION = {
+        "text": 1, "mood": 1, "status": 1, "reactions": 1, "created_at": 1
+    }
+
     @staticmethod
     def _collection():
         """Fetch collection only after DB is initialized."""
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.confessions
 
     @staticmethod
     def create(data):
-        data["created_at"] = datetime.utcnow()
+        now = datetime.utcnow()
+        # BSON dates hold milliseconds; truncate so cached docs sort and page like stored ones
+        data["created_at"] = now.replace(microsecond=now.microsecond // 1000 * 1000)
         data["status"] = "active"
         data["reactions"] = {
             "heart": 0, "laugh": 0, "sad": 0, "angry": 0, "relate": 0
         }
         result = ConfessionModel._collection().insert_one(data)
+        rollups.record_confession(data["created_at"])
+        if "mood" not in data:
+            # Scored asynchronously and written back in batches
+            mood_pipeline.submit(result.inserted_id, data.get("text"))
+        else:
+            rollups.record_mood(data["created_at"], data["mood"])
+        trending_engine.on_create(result.inserted_id, data["created_at"])
+        listed = {k: v for k, v in data.items() if k == "_id" or k in ConfessionModel.LIST_PROJECTION}
+        feed_cache.on_create(listed)
+        confession_search.on_create(listed)
+        live_hub.on_create(listed)
         return str(result.inserted_id)
 
     @staticmethod
-    def get_all():
-        return list(ConfessionModel._collection().find({"status": "active"}))
+    def get_all(limit=100):
+        """Newest active confessions (bounded; use get_page to go deeper)."""
+        return list(
+            ConfessionModel._collection()
+            .find({"status": "active"}, ConfessionModel.LIST_PROJECTION)
+            .sort(KEYSET_SORT).limit(limit)
+        )
+
+    @staticmethod
+    def get_page(cursor=None, limit=20):
+        """Keyset feed page -> (confessions, next_cursor); hot pages come from cache."""
+        return feed_cache.page(ConfessionModel.LIST_PROJECTION, cursor, limit)
+
+    @staticmethod
+    def get_trending(limit=20):
+        """Hottest confessions right now (served from the in-process top-K)."""
+        return trending_engine.top_documents(ConfessionModel.LIST_PROJECTION, limit)
+
+    @staticmethod
+    def search(q, mood=None, status=None, since=None, until=None, prefix_last=False, offset=0, limit=20):
+        """Ranked keyword search -> (confessions with `score`, has_more)."""
+        return confession_search.search(
+            q, ConfessionModel.LIST_PROJECTION, mood=mood, status=status, since=since,
+            until=until, prefix_last=prefix_last, offset=offset, limit=limit
+        )
+
+    @staticmethod
+    def search_filter(mood=None, status=None, since=None, until=None):
+        """Mongo filter for admin search (shared by the sync and ASGI paths)."""
+        query = {}
+        if mood:
+            query["mood"] = mood
+        if status:
+            query["status"] = status
+        query.update(time_filter(since, until))
+        return query
+
+    @staticmethod
+    def search_page(query, cursor=None, limit=50):
+        """Keyset page of a search_filter() query -> (confessions, next_cursor)."""
+        return fetch_page(ConfessionModel._collection(), query, ConfessionModel.LIST_PROJECTION, cursor, limit)
+
+    @staticmethod
+    async def search_page_async(query, cursor=None, limit=50):
+        """search_page on the asyncio client (ASGI mode)."""
+        return await afetch_page(get_async_db().confessions, query, ConfessionModel.LIST_PROJECTION, cursor, limit)
 
     @staticmethod
     def get_by_id(confession_id):
@@ -40,15 +111,81 @@ class ConfessionModel:
 
     @staticmethod
     def update_reactions(confession_id, emoji):
+        """Buffered: increments are summed per confession and bulk-written."""
         field = f"reactions.{emoji}"
-        ConfessionModel._collection().update_one(
-            {"_id": ObjectId(confession_id)},
-            {"$inc": {field: 1}}
+        confession_id = ObjectId(confession_id)
+        write_buffer.update(
+            "confessions",
+            {"_id": confession_id},
+            inc={field: 1}
         )
+        trending_engine.on_reaction(confession_id, emoji)
+        live_hub.on_reaction(confession_id, emoji)
+        rollups.record_reaction(emoji)
 
     @staticmethod
     def delete(confession_id):
-        ConfessionModel._collection().update_one(
-            {"_id": ObjectId(confession_id)},
+        """Soft-delete; returns False if no active confession matched."""
+        confession_id = ObjectId(confession_id)
+        result = ConfessionModel._collection().update_one(
+            {"_id": confession_id},
             {"$set": {"status": "deleted"}}
         )
+        feed_cache.on_delete(confession_id)
+        trending_engine.on_delete(confession_id)
+        confession_search.on_status(confession_id, "deleted")
+        live_hub.on_delete(confession_id)
+        return result.modified_count > 0
+
+    @staticmethod
+    def set_status_many(confession_ids, status, moderator=None):
+        """
+        Moderate one chunk of ObjectIds with a single read and a single update_many.
+        Returns {confession_id: "updated" | "unchanged" | "not_found"}.
+        """
+        collection = ConfessionModel._collection()
+        # Restores re-announce the confession, so read its listed fields too
+        projection = ConfessionModel.LIST_PROJECTION if status == "active" else {"status": 1}
+        docs = {doc["_id"]: doc for doc in collection.find({"_id": {"$in": confession_ids}}, projection)}
+        current = {cid: doc.get("status") for cid, doc in docs.items()}
+        changed = {cid for cid, old in current.items() if old != status}
+        if changed:
+            collection.update_many(
+                {"_id": {"$in": list(changed)}, "status": {"$ne": status}},
+                {"$set": {"status": status, "moderated_at": datetime.utcnow(), "moderated_by": moderator}}
+            )
+            for cid in changed:
+                if status != "active":
+                    feed_cache.on_delete(cid)
+                    trending_engine.on_delete(cid)
+                    live_hub.on_delete(cid)
+                else:
+                    restored = dict(docs[cid], status="active")
+                    trending_engine.on_restore(cid, restored.get("created_at"))
+                    live_hub.on_create(restored)
+                confession_search.on_status(cid, status)
+            if status == "active":
+                feed_cache.clear()  # restored items may belong anywhere in the window
+
+        return {
+            cid: "not_found" if cid not in current else "updated" if cid in changed else "unchanged"
+            for cid in confession_ids
+        }
+
+
+register_indexes(
+    "confessions",
+    # TTL: auto-delete confessions after 24 hrs
+    IndexModel([("created_at", ASCENDING)], name="created_at_1", expireAfterSeconds=86400),
+    # Admin search / feed: {status, mood} sorted newest first
+    IndexModel(
+        [("status", ASCENDING), ("mood", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="status_mood_created_at"
+    ),
+    IndexModel(
+        [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="status_created_at"
+    ),
+    # Keyword search for moderators ($text + textScore ranking)
+    IndexModel([("text", TEXT)], name="text_search", default_language="english"),
+)
@@ -5,7 +5,9 @@
 # ==========================================================
 
 from datetime import datetime
-from app.db import get_db
+from pymongo import DESCENDING, IndexModel
+from app.db import get_db, register_indexes
+from app.utils.pagination import fetch_page
 
 
 class FeedbackModel:
@@ -14,7 +16,7 @@ class FeedbackModel:
     @staticmethod
     def _collection():
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.feedback
 
@@ -24,5 +26,13 @@ class FeedbackModel:
         FeedbackModel._collection().insert_one(data)
 
     @staticmethod
-    def get_all():
-        return list(FeedbackModel._collection().find().sort("created_at", -1))
+    def get_page(cursor=None, limit=20):
+        """Newest-first keyset page -> (feedback, next_cursor)."""
+        return fetch_page(FeedbackModel._collection(), {}, None, cursor, limit)
+
+
+register_indexes(
+    "feedback",
+    # Keyset pages / exports: (created_at, _id) newest first (replaces created_at_-1)
+    IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+)
@@ -4,29 +4,185 @@
 # Author: Jaydevsinh Gohil
 # ==========================================================
 
-from datetime import datetime
+import argparse
+import sys
+from datetime import datetime, timedelta
 from bson import ObjectId
-from app.db import get_db
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from app.config import Config
+from app.db import get_db, register_indexes
+from app.utils.write_behind import write_buffer
+
+CONFESSION_TTL = timedelta(hours=24)  # confessions TTL (created_at_1 in models/confession.py)
 
 
 class ReactionModel:
-    """Tracks emoji reactions for confessions."""
+    """
+    Tracks emoji reactions for confessions.
+
+    `reactions` holds one small aggregate per (confession_id, emoji) with a
+    plain counter. Per-session dedupe lives in `reaction_votes`, one tiny
+    document per vote guarded by a unique index, so aggregate documents
+    never grow with the number of reactors. Votes carry the confession's
+    own expiry (`expires_at`) so they are purged together. Aggregates written before that
+    change still carry a `session_ids` array: add_reaction honours it
+    (REACTION_LEGACY_CHECK) until migrate_votes() has moved it out.
+    """
 
     @staticmethod
     def _collection():
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.reactions
 
+    @staticmethod
+    def _votes():
+        db = get_db()
+        if db is None:
+            raise ConnectionError("Database not initialized. Call init_db() first.")
+        return db.reaction_votes
+
     @staticmethod
     def add_reaction(confession_id, emoji, session_id):
-        ReactionModel._collection().update_one(
-            {"confession_id": ObjectId(confession_id), "emoji": emoji},
-            {
-                "$inc": {"count": 1},
-                "$addToSet": {"session_ids": session_id},
-                "$set": {"created_at": datetime.utcnow()}
-            },
-            upsert=True
+        """
+        Record a vote. Returns False if this session already reacted with
+        this emoji, True otherwise (the counter increment is buffered).
+        """
+        confession_id = ObjectId(confession_id)
+        try:
+            vote_id = ReactionModel._votes().insert_one({
+                "confession_id": confession_id,
+                "emoji": emoji,
+                "session_id": session_id,
+                "created_at": datetime.utcnow(),
+                "expires_at": ReactionModel._expires_at(confession_id)
+            }).inserted_id
+        except DuplicateKeyError:
+            return False
+        if Config.REACTION_LEGACY_CHECK and ReactionModel._collection().find_one(
+            {"confession_id": confession_id, "emoji": emoji, "session_ids": session_id}, {"_id": 1}
+        ):
+            return False  # voted before the migration; the vote doc now blocks repeats
+
+        try:
+            write_buffer.update(
+                "reactions",
+                {"confession_id": confession_id, "emoji": emoji},
+                inc={"count": 1},
+                set_fields={"created_at": datetime.utcnow()},
+                upsert=True
+            )
+        except Exception:
+            # Without its count the vote must not block a retry
+            ReactionModel._votes().delete_one({"_id": vote_id})
+            raise
+        return True
+
+    @staticmethod
+    def _expires_at(confession_id):
+        """When the confession (and so its votes) expires, from its ObjectId."""
+        return confession_id.generation_time.replace(tzinfo=None) + CONFESSION_TTL
+
+    @staticmethod
+    def has_reacted(confession_id, emoji, session_id):
+        return ReactionModel._votes().find_one(
+            {"confession_id": ObjectId(confession_id), "emoji": emoji, "session_id": session_id},
+            {"_id": 1}
+        ) is not None
+
+    @staticmethod
+    def get_counts(confession_id):
+        """Return {emoji: count} for a confession."""
+        docs = ReactionModel._collection().find(
+            {"confession_id": ObjectId(confession_id)}, {"emoji": 1, "count": 1, "_id": 0}
         )
+        return {doc["emoji"]: doc.get("count", 0) for doc in docs}
+
+    # ------------------------------------------------------
+    # One-off: legacy session_ids arrays -> reaction_votes
+    # ------------------------------------------------------
+    @staticmethod
+    def migrate_votes(batch_size=500):
+        """
+        Copy legacy `session_ids` arrays into reaction_votes and unset them,
+        then give votes written before `expires_at` existed their expiry and
+        drop the old created_at TTL index. Vote times come from the
+        confession's ObjectId so they expire with it. Safe to re-run: the
+        unique index skips votes already copied. Returns aggregates migrated.
+        """
+        reactions = ReactionModel._collection()
+        migrated = 0
+        for doc in reactions.find({"session_ids": {"$exists": True}}).batch_size(batch_size):
+            created_at = doc["confession_id"].generation_time.replace(tzinfo=None)
+            votes = [
+                {"confession_id": doc["confession_id"], "emoji": doc["emoji"],
+                 "session_id": session_id, "created_at": created_at,
+                 "expires_at": created_at + CONFESSION_TTL}
+                for session_id in doc.get("session_ids") or []
+            ]
+            if votes:
+                try:
+                    ReactionModel._votes().insert_many(votes, ordered=False)
+                except BulkWriteError as e:
+                    if any(err["code"] != 11000 for err in e.details["writeErrors"]):
+                        raise
+            reactions.update_one({"_id": doc["_id"]}, {"$unset": {"session_ids": ""}})
+            migrated += 1
+
+        votes = ReactionModel._votes()
+        pending = []
+        for vote in votes.find({"expires_at": {"$exists": False}}, {"confession_id": 1}).batch_size(batch_size):
+            pending.append(UpdateOne(
+                {"_id": vote["_id"]}, {"$set": {"expires_at": ReactionModel._expires_at(vote["confession_id"])}}
+            ))
+            if len(pending) >= batch_size:
+                votes.bulk_write(pending, ordered=False)
+                pending = []
+        if pending:
+            votes.bulk_write(pending, ordered=False)
+        try:
+            votes.drop_index("created_at_1")  # superseded by expires_at_ttl
+        except OperationFailure:
+            pass  # already gone
+        return migrated
+
+
+register_indexes(
+    "reactions",
+    IndexModel(
+        [("confession_id", ASCENDING), ("emoji", ASCENDING)],
+        name="confession_emoji_unique", unique=True
+    ),
+)
+register_indexes(
+    "reaction_votes",
+    # One vote per session per emoji per confession
+    IndexModel(
+        [("confession_id", ASCENDING), ("emoji", ASCENDING), ("session_id", ASCENDING)],
+        name="confession_emoji_session_unique", unique=True
+    ),
+    # Votes expire with their confession (24 hrs after it was created)
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+)
+
+
+# ----------------------------------------------------------
+# CLI: python -m app.models.reaction migrate-votes
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confessly reaction maintenance")
+    parser.add_argument("command", choices=["migrate-votes"])
+    args = parser.parse_args(argv)
+
+    from app.db import _connect
+    _connect()
+    if args.command == "migrate-votes":
+        print(f"✅ Moved session_ids out of {ReactionModel.migrate_votes()} reaction documents")
+    return 0
+
+
+if __name__ == "__main__":
+    from app.models.reaction import main as _main
+    sys.exit(_main())
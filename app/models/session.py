@@ -6,7 +6,9 @@
 
 from datetime import datetime
 from uuid import uuid4
-from app.db import get_db
+from pymongo import ASCENDING, IndexModel
+from app.db import get_db, register_indexes
+from app.utils.write_behind import write_buffer
 
 
 class SessionModel:
@@ -15,7 +17,7 @@ class SessionModel:
     @staticmethod
     def _collection():
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.sessions
 
@@ -33,7 +35,17 @@ class SessionModel:
 
     @staticmethod
     def update_activity(session_id):
-        SessionModel._collection().update_one(
+        """Buffered: only the latest timestamp per session is written."""
+        write_buffer.update(
+            "sessions",
             {"session_id": session_id},
-            {"$set": {"last_activity": datetime.utcnow()}}
+            max_fields={"last_activity": datetime.utcnow()}
         )
+
+
+register_indexes(
+    "sessions",
+    # TTL: drop sessions idle for 7 days
+    IndexModel([("last_activity", ASCENDING)], name="last_activity_1", expireAfterSeconds=604800),
+    IndexModel([("session_id", ASCENDING)], name="session_id_unique", unique=True),
+)
@@ -4,9 +4,20 @@
 # Author: Jaydevsinh Gohil
 # ==========================================================
 
+import argparse
+import sys
 from datetime import datetime
 from uuid import uuid4
-from app.db import get_db
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from app.db import get_db, register_indexes
+from app.utils.pagination import fetch_page
+from app.utils.write_behind import write_buffer
+
+HISTORY = "user_history"
+HISTORY_KINDS = ("confession", "reply")
+HISTORY_TTL = 86400  # same 24h lifetime as the confessions/replies they point at
+LEGACY_ARRAYS = {"confession": "confessions", "reply": "replies"}
 
 
 class UserModel:
@@ -16,10 +27,17 @@ class UserModel:
     def _collection():
         """Fetch users collection after DB initialization."""
         db = get_db()
-        if not db:
+        if db is None:
             raise ConnectionError("Database not initialized. Call init_db() first.")
         return db.users
 
+    @staticmethod
+    def _history():
+        db = get_db()
+        if db is None:
+            raise ConnectionError("Database not initialized. Call init_db() first.")
+        return db[HISTORY]
+
     @staticmethod
     def create_guest():
         """Create a guest user session."""
@@ -28,8 +46,6 @@ class UserModel:
             "type": "guest",
             "email": None,
             "username": None,
-            "confessions": [],
-            "replies": [],
             "mood_profile": {},
             "last_active": datetime.utcnow(),
             "created_at": datetime.utcnow()
@@ -39,21 +55,139 @@ class UserModel:
 
     @staticmethod
     def find_by_session(session_id):
-        """Find user by their session ID."""
-        return UserModel._collection().find_one({"session_id": session_id})
+        """Find user by their session ID (lean: history is paged via get_history)."""
+        # Legacy documents may still carry the old unbounded arrays
+        return UserModel._collection().find_one(
+            {"session_id": session_id}, {"confessions": 0, "replies": 0}
+        )
 
     @staticmethod
     def update_activity(session_id):
-        """Update last active timestamp."""
-        UserModel._collection().update_one(
+        """Update last active timestamp (buffered, latest wins)."""
+        write_buffer.update(
+            "users",
             {"session_id": session_id},
-            {"$set": {"last_active": datetime.utcnow()}}
+            max_fields={"last_active": datetime.utcnow()}
+        )
+
+    # ------------------------------------------------------
+    # History: one small document per item in `user_history`,
+    # expiring with the item instead of growing the user document
+    # ------------------------------------------------------
+    @staticmethod
+    def _history_upsert(session_id, kind, ref_id, created_at):
+        """Keyed on (session_id, kind, ref_id), so repeats and re-runs add nothing."""
+        return UpdateOne(
+            {"session_id": session_id, "kind": kind, "ref_id": ref_id},
+            {"$setOnInsert": {"created_at": created_at}},
+            upsert=True
         )
 
     @staticmethod
     def add_confession(session_id, confession_id):
         """Link a confession to a user session."""
-        UserModel._collection().update_one(
-            {"session_id": session_id},
-            {"$push": {"confessions": confession_id}}
+        UserModel._history().bulk_write([
+            UserModel._history_upsert(session_id, "confession", confession_id, datetime.utcnow())
+        ])
+
+    @staticmethod
+    def get_history(session_id, kind="confession", cursor=None, limit=20):
+        """
+        Newest-first keyset page of a user's confessions or replies -> (items, next_cursor).
+        Replies only exist as history migrated from the legacy `replies` array.
+        """
+        if kind not in HISTORY_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(HISTORY_KINDS)}")
+        return fetch_page(
+            UserModel._history(), {"session_id": session_id, "kind": kind},
+            {"session_id": 0, "kind": 0}, cursor, limit
         )
+
+    @staticmethod
+    def migrate_history(batch_size=500):
+        """
+        Move legacy `confessions` / `replies` arrays into user_history and
+        unset them. Entry times come from the ObjectId; entries already past
+        the TTL are dropped by Mongo's TTL monitor. Entries are upserts, so
+        re-running after a partial failure adds no duplicates. Returns users
+        migrated.
+        """
+        users = UserModel._collection()
+        legacy = {"$or": [{f"{field}.0": {"$exists": True}} for field in LEGACY_ARRAYS.values()]}
+        projection = {"session_id": 1, "created_at": 1, **{field: 1 for field in LEGACY_ARRAYS.values()}}
+        migrated = 0
+        for user in users.find(legacy, projection).batch_size(batch_size):
+            upserts = []
+            fallback = user.get("created_at") or datetime.utcnow()
+            for kind, field in LEGACY_ARRAYS.items():
+                for ref_id in user.get(field) or []:
+                    created_at = fallback
+                    if ObjectId.is_valid(ref_id):
+                        created_at = ObjectId(ref_id).generation_time.replace(tzinfo=None)
+                    upserts.append(UserModel._history_upsert(user["session_id"], kind, ref_id, created_at))
+            if upserts:
+                UserModel._history().bulk_write(upserts, ordered=False)
+            users.update_one({"_id": user["_id"]}, {"$unset": {f: "" for f in LEGACY_ARRAYS.values()}})
+            migrated += 1
+        return migrated
+
+    @staticmethod
+    def duplicate_sessions(limit=100):
+        """
+        session_ids shared by several user documents -> [(session_id, count)].
+        Any of these block the session_id_unique index; resolve them before
+        `python -m app.db sync`.
+        """
+        return [(doc["_id"], doc["count"]) for doc in UserModel._collection().aggregate([
+            {"$group": {"_id": "$session_id", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$sort": {"count": -1}},
+            {"$limit": limit}
+        ], allowDiskUse=True)]
+
+
+register_indexes(
+    "users",
+    IndexModel([("session_id", ASCENDING)], name="session_id_unique", unique=True),
+)
+register_indexes(
+    HISTORY,
+    # get_history pages: one user's items of one kind, newest first
+    IndexModel(
+        [("session_id", ASCENDING), ("kind", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="session_kind_created_at"
+    ),
+    IndexModel(
+        [("session_id", ASCENDING), ("kind", ASCENDING), ("ref_id", ASCENDING)],
+        name="session_kind_ref_unique", unique=True
+    ),
+    IndexModel([("created_at", ASCENDING)], name="created_at_ttl", expireAfterSeconds=HISTORY_TTL),
+)
+
+
+# ----------------------------------------------------------
+# CLI: python -m app.models.user migrate-history | duplicate-sessions
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confessly user maintenance")
+    parser.add_argument("command", choices=["migrate-history", "duplicate-sessions"])
+    args = parser.parse_args(argv)
+
+    from app.db import _connect
+    _connect()
+    if args.command == "migrate-history":
+        print(f"✅ Moved history out of {UserModel.migrate_history()} user documents")
+    elif args.command == "duplicate-sessions":
+        duplicates = UserModel.duplicate_sessions()
+        for session_id, count in duplicates:
+            print(f"  - {session_id}: {count} users")
+        if duplicates:
+            print(f"⚠️ {len(duplicates)} duplicate session_ids block session_id_unique")
+            return 1
+        print("✅ No duplicate session_ids")
+    return 0
+
+
+if __name__ == "__main__":
+    from app.models.user import main as _main
+    sys.exit(_main())
@@ -17,8 +17,12 @@ from app.controllers.admin_controller import (
     get_all_admins,
     create_moderator,
     delete_admin,
-    search_confessions
+    search_confessions,
+    analytics_series,
+    bulk_moderate,
+    moderation_job_status
 )
+from app.utils.rate_limit import limiter
 
 # ----------------------------------------------------------
 # Blueprint Initialization
@@ -28,8 +32,8 @@ admin_bp = Blueprint("admin", __name__)
 # ----------------------------------------------------------
 # Public Routes (No Auth Required)
 # ----------------------------------------------------------
-admin_bp.route("/register", methods=["POST"])(register_admin)
-admin_bp.route("/login", methods=["POST"])(admin_login)
+admin_bp.route("/register", methods=["POST"])(limiter.limit("register", "3/hour")(register_admin))
+admin_bp.route("/login", methods=["POST"])(limiter.limit("login", "10/minute")(admin_login))
 
 # ----------------------------------------------------------
 # Protected Routes (JWT Required)
@@ -41,6 +45,9 @@ admin_bp.route("/confessions/<string:confession_id>", methods=["DELETE"])(delete
 admin_bp.route("/reports", methods=["GET"])(view_reports)
 admin_bp.route("/health", methods=["GET"])(system_health)
 admin_bp.route("/all", methods=["GET"])(get_all_admins)
-admin_bp.route("/moderator", methods=["POST"])(create_moderator)
+admin_bp.route("/moderator", methods=["POST"])(limiter.limit("moderator", "30/hour")(create_moderator))
 admin_bp.route("/delete/<string:username>", methods=["DELETE"])(delete_admin)
 admin_bp.route("/search", methods=["GET"])(search_confessions)
+admin_bp.route("/analytics", methods=["GET"])(analytics_series)
+admin_bp.route("/confessions/bulk", methods=["POST"])(limiter.limit("bulk_moderation", "30/minute")(bulk_moderate))
+admin_bp.route("/moderation/jobs/<string:job_id>", methods=["GET"])(moderation_job_status)
@@ -0,0 +1,32 @@
+# ==========================================================
+# 💬 CONFESSLY — ASYNC ROUTES (ASGI MODE)
+# File: app/routes/async_routes.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from werkzeug.routing import Map, Rule
+from app.controllers.async_admin_controller import (
+    get_admin_profile,
+    dashboard_summary,
+    view_feedback,
+    view_reports,
+    get_all_admins,
+    search_confessions
+)
+from app.controllers.async_confession_controller import stream_live
+from app.utils.rate_limit import limiter
+
+# ----------------------------------------------------------
+# Protected admin reads and the live stream are served on the
+# event loop; every other path (and method) falls through to
+# the Flask app
+# ----------------------------------------------------------
+async_url_map = Map([
+    Rule("/api/admin/profile", methods=["GET"], endpoint=get_admin_profile),
+    Rule("/api/admin/dashboard", methods=["GET"], endpoint=dashboard_summary),
+    Rule("/api/admin/feedback", methods=["GET"], endpoint=view_feedback),
+    Rule("/api/admin/reports", methods=["GET"], endpoint=view_reports),
+    Rule("/api/admin/all", methods=["GET"], endpoint=get_all_admins),
+    Rule("/api/admin/search", methods=["GET"], endpoint=search_confessions),
+    Rule("/api/confessions/stream", methods=["GET"], endpoint=limiter.async_limit("stream", "30/minute")(stream_live)),
+])
@@ -0,0 +1,22 @@
+# ==========================================================
+# 💬 CONFESSLY — PUBLIC CONFESSION ROUTES (Blueprint)
+# File: app/routes/confession_routes.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from flask import Blueprint
+from app.controllers.confession_controller import get_feed, get_history, get_trending, stream_live
+from app.utils.rate_limit import limiter
+
+# ----------------------------------------------------------
+# Blueprint Initialization
+# ----------------------------------------------------------
+confession_bp = Blueprint("confessions", __name__)
+
+# ----------------------------------------------------------
+# Public Routes (No Auth Required)
+# ----------------------------------------------------------
+confession_bp.route("/feed", methods=["GET"])(limiter.limit("feed", "120/minute", per="ip+session")(get_feed))
+confession_bp.route("/trending", methods=["GET"])(limiter.limit("trending", "120/minute", per="ip+session")(get_trending))
+confession_bp.route("/stream", methods=["GET"])(limiter.limit("stream", "30/minute")(stream_live))
+confession_bp.route("/history", methods=["GET"])(limiter.limit("history", "60/minute", per="ip+session")(get_history))
@@ -0,0 +1,152 @@
+# ==========================================================
+# 💬 CONFESSLY — PUBLIC FEED CACHE
+# File: app/services/feed.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import threading
+import time
+from app.config import Config
+from app.db import get_db
+from app.utils.pagination import KEYSET_SORT, decode_cursor, encode_cursor, fetch_page
+
+FEED_QUERY = {"status": "active"}
+
+
+def _sort_key(doc):
+    return (doc["created_at"], doc["_id"])
+
+
+class FeedCache:
+    """
+    Read-through cache of the newest `max_items` active confessions
+    (the first few feed pages), kept newest-first in memory.
+
+    Pages that fall inside the window are sliced without touching Mongo.
+    ConfessionModel.create()/delete() patch the window in place, and the
+    whole window is reloaded every `ttl` seconds to pick up reaction
+    counts, moods and writes made by other workers. The reload query runs
+    outside the lock (one thread at a time); creates/deletes that land
+    meanwhile are replayed onto the fresh window. Pages past the window
+    use an index seek on (status, created_at, _id) via fetch_page().
+    """
+
+    def __init__(self, max_items=200, ttl=30):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._window = []        # newest first
+        self._complete = False   # window holds every active confession
+        self._loaded_at = 0.0
+        self._reloading = False
+        self._changes = []       # (method, arg) applied during a reload, replayed after it
+        self._generation = 0     # bumped by clear(); a reload that straddles it is discarded
+        self._lock = threading.Lock()
+        self.metrics = {"hits": 0, "misses": 0, "reloads": 0}
+
+    # ------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------
+    def page(self, projection, token=None, limit=20):
+        """Return (docs, next_cursor) for a feed page."""
+        after = decode_cursor(token) if token else None
+        if time.monotonic() - self._loaded_at > self.ttl:
+            self._reload(projection)
+        with self._lock:
+            start = self._position(after) if after else 0
+            end = start + limit
+            if end <= len(self._window) or self._complete:
+                docs = self._window[start:end]
+                more = end < len(self._window) or not self._complete
+                self.metrics["hits"] += 1
+                next_cursor = encode_cursor(docs[-1]) if docs and more else None
+                return [dict(d) for d in docs], next_cursor
+
+        # Deep page: keyset seek in Mongo
+        self.metrics["misses"] += 1
+        return fetch_page(get_db().confessions, FEED_QUERY, projection, token, limit)
+
+    def _reload(self, projection):
+        """Query Mongo without holding the lock, then swap the window in."""
+        with self._lock:
+            if self._reloading:
+                return  # another thread is on it; serve the current window
+            self._reloading = True
+            self._changes = []
+            generation = self._generation
+        docs = None
+        try:
+            docs = list(
+                get_db().confessions.find(FEED_QUERY, projection)
+                .sort(KEYSET_SORT).limit(self.max_items + 1)
+            )
+        finally:
+            with self._lock:
+                changes, self._changes, self._reloading = self._changes, [], False
+                if docs is not None and generation == self._generation:
+                    self._complete = len(docs) <= self.max_items
+                    self._window = docs[:self.max_items]
+                    self._loaded_at = time.monotonic()
+                    self.metrics["reloads"] += 1
+                    for method, arg in changes:
+                        method(arg)
+
+    def _position(self, after):
+        """Index of the first window entry older than the cursor key (binary search)."""
+        lo, hi = 0, len(self._window)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _sort_key(self._window[mid]) < after:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    # ------------------------------------------------------
+    # Incremental invalidation
+    # ------------------------------------------------------
+    def on_create(self, doc):
+        """Insert a new confession at its sorted position."""
+        with self._lock:
+            if self._reloading:
+                self._changes.append((self._insert, doc))
+            if self._loaded_at:
+                self._insert(doc)
+
+    def on_delete(self, confession_id):
+        """Drop a confession; the window stays a valid (shorter) prefix."""
+        with self._lock:
+            if self._reloading:
+                self._changes.append((self._remove, confession_id))
+            self._remove(confession_id)
+
+    def _insert(self, doc):
+        pos = self._position(_sort_key(doc))
+        if pos > 0 and self._window[pos - 1]["_id"] == doc["_id"]:
+            return  # already loaded by the reload it raced with
+        if pos >= self.max_items or (pos == len(self._window) and not self._complete):
+            return  # older than the cached prefix
+        self._window.insert(pos, doc)
+        if len(self._window) > self.max_items:
+            self._window.pop()
+            self._complete = False
+
+    def _remove(self, confession_id):
+        self._window = [d for d in self._window if d["_id"] != confession_id]
+
+    def clear(self):
+        with self._lock:
+            self._window = []
+            self._complete = False
+            self._loaded_at = 0.0
+            self._generation += 1
+
+    def stats(self):
+        m = dict(self.metrics)
+        m["window_size"] = len(self._window)
+        return m
+
+
+feed_cache = FeedCache(
+    max_items=Config.FEED_CACHE_PAGES * Config.FEED_PAGE_SIZE,
+    ttl=Config.FEED_CACHE_TTL
+)
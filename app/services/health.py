@@ -0,0 +1,147 @@
+# ==========================================================
+# 💬 CONFESSLY — HEALTH: CATALOG, READINESS & DB STATS SAMPLER
+# File: app/services/health.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import os
+import threading
+import time
+from datetime import datetime
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_db, readiness
+from app.utils.cache import TTLCache
+
+
+# ==========================================================
+# Collection catalog (collection names without a round trip per request)
+# ==========================================================
+class CollectionCatalog:
+    """list_collection_names(), cached for `ttl` seconds and refreshed by the sampler."""
+
+    def __init__(self, ttl=300):
+        self._cache = TTLCache(ttl=ttl, maxsize=1)
+
+    def names(self):
+        return self._cache.get_or_compute("names", lambda: sorted(get_db().list_collection_names()))
+
+    def refresh(self):
+        self._cache.set("names", sorted(get_db().list_collection_names()))
+
+    def invalidate(self):
+        self._cache.clear()
+
+
+collection_catalog = CollectionCatalog(ttl=Config.CATALOG_TTL)
+
+
+# ==========================================================
+# Readiness (one ping per TTL window, however often probes arrive)
+# ==========================================================
+_readiness_cache = TTLCache(ttl=Config.READINESS_CACHE_TTL, maxsize=1)
+
+
+def cached_readiness():
+    """readiness() shared across probes for READINESS_CACHE_TTL seconds."""
+    return _readiness_cache.get_or_compute("ready", readiness)
+
+
+# ==========================================================
+# dbStats sampler
+# ==========================================================
+class DbStatsSampler:
+    """
+    Runs `dbStats` (and refreshes the catalog) every `interval` seconds on a
+    daemon thread; system_health serves the last snapshot.
+    """
+
+    def __init__(self, interval=60, catalog=None):
+        self.interval = interval
+        self.catalog = catalog
+        self._snapshot = None
+        self._sampled = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.metrics = {"samples": 0, "errors": 0, "last_sample_ms": 0.0}
+
+    def sample(self):
+        started = time.perf_counter()
+        snapshot = {"sampled_at": datetime.utcnow(), "error": None}
+        try:
+            stats = get_db().command("dbStats")
+            snapshot.update({
+                "data_size": stats.get("dataSize"),
+                "storage_size": stats.get("storageSize"),
+                "index_size": stats.get("indexSize"),
+                "objects": stats.get("objects"),
+                "collections": stats.get("collections")
+            })
+        except (PyMongoError, NotImplementedError) as e:  # mongomock has no dbStats
+            snapshot["error"] = f"{type(e).__name__}: {e}"
+            self.metrics["errors"] += 1
+        if self.catalog is not None:
+            try:
+                self.catalog.refresh()
+            except PyMongoError:
+                self.metrics["errors"] += 1
+
+        self.metrics["samples"] += 1
+        self.metrics["last_sample_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self._snapshot = snapshot
+        self._sampled.set()
+        return snapshot
+
+    def snapshot(self, wait=2.0):
+        """Last sample; the first call per process waits up to `wait` seconds for one."""
+        self._ensure_worker()
+        if self._snapshot is None:
+            self._sampled.wait(wait)
+        return self._snapshot
+
+    def problem(self, snapshot):
+        """Why `snapshot` can't vouch for the database (None when it can)."""
+        if not snapshot:
+            return "no dbStats sample yet"
+        if snapshot["error"]:
+            return f"dbStats failed: {snapshot['error']}"
+        age = (datetime.utcnow() - snapshot["sampled_at"]).total_seconds()
+        if age > 3 * self.interval:  # the sampler thread is stuck or dead
+            return f"dbStats sample is stale ({age:.0f}s old)"
+        return None
+
+    def _run(self):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:  # never let the sampler die
+                print(f"⚠️ dbStats sample failed: {e}")
+            time.sleep(self.interval)
+
+    def _ensure_worker(self):
+        """Start the sampling loop once per process."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._snapshot = None  # a forked child samples its own
+            self._sampled.clear()
+            self._thread = threading.Thread(target=self._run, name="confessly-dbstats", daemon=True)
+            self._thread.start()
+
+    def stats(self):
+        m = dict(self.metrics)
+        snapshot = self._snapshot
+        if snapshot and snapshot["error"] is None:
+            m["sample_age_s"] = round((datetime.utcnow() - snapshot["sampled_at"]).total_seconds(), 1)
+            for key in ("data_size", "storage_size", "index_size", "objects"):
+                if isinstance(snapshot.get(key), (int, float)):
+                    m[f"{key}_bytes" if key != "objects" else key] = snapshot[key]
+        return m
+
+
+db_stats_sampler = DbStatsSampler(interval=Config.HEALTH_SAMPLE_INTERVAL, catalog=collection_catalog)
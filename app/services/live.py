@@ -0,0 +1,333 @@
+# ==========================================================
+# 💬 CONFESSLY — LIVE UPDATES HUB (SERVER-SENT EVENTS)
+# File: app/services/live.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_db, register_indexes
+from app.utils.json_provider import dumps_bytes
+
+BROKER_COLLECTION = "live_events"
+
+SSE_RETRY = b"retry: 3000\n\n"  # client reconnect delay (ms)
+SSE_KEEPALIVE = b": keepalive\n\n"  # comment line; keeps proxies from idling the stream out
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _frame(kind, data):
+    """One SSE message, encoded once and shared by every subscriber."""
+    return b"event: " + kind.encode() + b"\ndata: " + dumps_bytes(data) + b"\n\n"
+
+
+# ==========================================================
+# Subscribers: bounded queues, oldest frames dropped first
+# ==========================================================
+class Subscriber:
+    """
+    One SSE client. `ids` (a set of confession id strings) limits the
+    stream to those confessions; None receives everything.
+    """
+
+    def __init__(self, maxlen, ids=None, loop=None):
+        self.ids = ids
+        self.loop = loop  # asyncio subscribers (ASGI mode) are woken on their loop
+        self.frames = deque(maxlen=maxlen)
+        self.dropped = 0
+        self.event = threading.Event() if loop is None else None
+        self._waiter = None  # future awaited by next_chunk()
+
+    def push(self, frames):
+        """Queue one tick's frames; beyond maxlen the deque drops the oldest."""
+        overflow = len(self.frames) + len(frames) - self.frames.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+        self.frames.extend(frames)
+
+    def drain(self):
+        """All queued frames as one chunk (b"" if none)."""
+        frames = []
+        while self.frames:
+            frames.append(self.frames.popleft())
+        return b"".join(frames)
+
+    def wait(self, timeout):
+        """Sync workers: block until frames are queued or `timeout` passes; returns the chunk."""
+        deadline = time.monotonic() + timeout
+        while not self.frames:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.event.wait(remaining)
+            self.event.clear()
+        return self.drain()
+
+    async def next_chunk(self, timeout):
+        """ASGI mode: same as wait() without blocking the event loop."""
+        if not self.frames:
+            self._waiter = self.loop.create_future()
+            timer = self.loop.call_later(timeout, _wake, [self])
+            try:
+                await self._waiter
+            finally:
+                timer.cancel()
+                self._waiter = None
+        return self.drain()
+
+    def wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+# ==========================================================
+# Brokers: carry each worker's coalesced tick to the other workers
+# ==========================================================
+class LocalBroker:
+    """Single-process stand-in: nothing leaves this worker."""
+
+    def publish(self, events):
+        pass
+
+    def start(self, deliver):
+        pass
+
+
+class MongoBroker:
+    """
+    Cross-worker fan-in via a change stream on `live_events` (needs a
+    replica set, e.g. Atlas). Each worker inserts one document per
+    non-empty tick and applies every other worker's documents locally.
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self._thread = None
+        self._pid = None
+        self.metrics = {"published": 0, "received": 0, "errors": 0}
+
+    def publish(self, events):
+        try:
+            get_db()[BROKER_COLLECTION].insert_one(
+                {"origin": self.origin, "events": events, "created_at": datetime.utcnow()}
+            )
+            self.metrics["published"] += 1
+        except PyMongoError as e:
+            self.metrics["errors"] += 1
+            print(f"⚠️ Live broker publish failed: {e}")
+
+    def start(self, deliver):
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        self.origin = uuid.uuid4().hex  # forked workers must not share an origin
+        self._pid = pid
+        self._thread = threading.Thread(target=self._watch, args=(deliver,), name="confessly-live-broker", daemon=True)
+        self._thread.start()
+
+    def _watch(self, deliver):
+        pipeline = [{"$match": {"operationType": "insert", "fullDocument.origin": {"$ne": self.origin}}}]
+        resume_token = None
+        while True:
+            try:
+                with get_db()[BROKER_COLLECTION].watch(pipeline, resume_after=resume_token) as stream:
+                    for change in stream:
+                        resume_token = stream.resume_token
+                        self.metrics["received"] += 1
+                        deliver(change["fullDocument"]["events"])
+            except PyMongoError as e:
+                self.metrics["errors"] += 1
+                print(f"⚠️ Live broker change stream interrupted: {e}")
+                time.sleep(1.0)
+
+
+# ==========================================================
+# Hub
+# ==========================================================
+class LiveHub:
+    """
+    In-process fan-out for confession events.
+
+    Models publish created / reaction / deleted events; they are coalesced
+    per confession and flushed every `tick` seconds: each confession yields
+    at most one frame per tick (reaction deltas are summed; a delete wins).
+    Frames are encoded once per tick and appended to every subscriber's
+    bounded queue, so a slow client only loses its own oldest frames.
+    """
+
+    def __init__(self, tick=0.25, queue_size=64, max_subscribers=10000, broker=None, enabled=True):
+        self.tick = tick
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.broker = broker or LocalBroker()
+        self.enabled = enabled
+
+        self._pending = {}  # confession_id str -> {"doc", "reactions", "deleted"}
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.metrics = {
+            "events": 0, "ticks": 0, "frames": 0, "dropped": 0,
+            "last_fanout_ms": 0.0, "max_fanout_ms": 0.0
+        }
+
+    # ------------------------------------------------------
+    # Publishing (called from ConfessionModel)
+    # ------------------------------------------------------
+    def _entry(self, cid):
+        entry = self._pending.get(cid)
+        if entry is None:
+            entry = self._pending[cid] = {"doc": None, "reactions": {}, "deleted": False}
+        return entry
+
+    def on_create(self, doc):
+        if not self.enabled:
+            return
+        self._ensure_worker()
+        with self._lock:
+            self.metrics["events"] += 1
+            self._entry(str(doc["_id"]))["doc"] = doc
+
+    def on_reaction(self, confession_id, emoji, amount=1):
+        if not self.enabled:
+            return
+        self._ensure_worker()
+        with self._lock:
+            self.metrics["events"] += 1
+            reactions = self._entry(str(confession_id))["reactions"]
+            reactions[emoji] = reactions.get(emoji, 0) + amount
+
+    def on_delete(self, confession_id):
+        if not self.enabled:
+            return
+        self._ensure_worker()
+        with self._lock:
+            self.metrics["events"] += 1
+            self._entry(str(confession_id))["deleted"] = True
+
+    # ------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------
+    def subscribe(self, ids=None, loop=None):
+        """New Subscriber, or None when this worker is at max_subscribers."""
+        self._ensure_worker()
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscriber = Subscriber(self.queue_size, ids=ids, loop=loop)
+            self._subscribers.add(subscriber)
+            return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            self.metrics["dropped"] += subscriber.dropped
+
+    # ------------------------------------------------------
+    # Tick: coalesce, publish to other workers, fan out locally
+    # ------------------------------------------------------
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        events = []
+        for cid, entry in pending.items():
+            if entry["deleted"]:
+                events.append({"type": "deleted", "id": cid})
+            elif entry["doc"] is not None:
+                events.append({"type": "confession", "id": cid, "doc": entry["doc"]})
+                if entry["reactions"]:
+                    events.append({"type": "reactions", "id": cid, "delta": entry["reactions"]})
+            elif entry["reactions"]:
+                events.append({"type": "reactions", "id": cid, "delta": entry["reactions"]})
+        self.broker.publish(events)
+        return self.deliver(events)
+
+    def deliver(self, events):
+        """Fan a list of coalesced events out to local subscribers."""
+        started = time.perf_counter()
+        frames = [(event["id"], _frame(event["type"], event)) for event in events]
+        everything = [frame for _, frame in frames]
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        loops = {}
+        for subscriber in subscribers:
+            if subscriber.ids is None:
+                chunk = everything
+            else:
+                chunk = [frame for cid, frame in frames if cid in subscriber.ids]
+                if not chunk:
+                    continue
+            subscriber.push(chunk)
+            if subscriber.loop is None:
+                subscriber.event.set()
+            else:
+                loops.setdefault(subscriber.loop, []).append(subscriber)
+        for loop, waiting in loops.items():
+            # One cross-thread wakeup per event loop, not per subscriber
+            loop.call_soon_threadsafe(_wake, waiting)
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self.metrics["ticks"] += 1
+        self.metrics["frames"] += len(frames)
+        self.metrics["last_fanout_ms"] = round(elapsed, 3)
+        self.metrics["max_fanout_ms"] = max(self.metrics["max_fanout_ms"], round(elapsed, 3))
+        return len(frames)
+
+    def _run(self):
+        while True:
+            time.sleep(self.tick)
+            try:
+                self.flush()
+            except Exception as e:  # never let the ticker die
+                print(f"⚠️ Live hub tick failed: {e}")
+
+    def _ensure_worker(self):
+        """Start the tick loop (and broker) once per process."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._subscribers = set()  # forked children inherit no clients
+            self._thread = threading.Thread(target=self._run, name="confessly-live", daemon=True)
+            self._thread.start()
+        self.broker.start(self.deliver)
+
+    def stats(self):
+        m = dict(self.metrics)
+        m["subscribers"] = len(self._subscribers)
+        m["pending"] = len(self._pending)
+        return m
+
+
+def _wake(subscribers):
+    for subscriber in subscribers:
+        subscriber.wake()
+
+
+register_indexes(
+    BROKER_COLLECTION,
+    IndexModel([("created_at", ASCENDING)], name="created_at_1", expireAfterSeconds=300),
+)
+
+
+live_hub = LiveHub(
+    tick=Config.LIVE_TICK_MS / 1000,
+    queue_size=Config.LIVE_QUEUE_SIZE,
+    max_subscribers=Config.LIVE_MAX_SUBSCRIBERS,
+    broker=MongoBroker() if Config.LIVE_BROKER == "mongo" else LocalBroker(),
+    enabled=Config.LIVE_ENABLED
+)
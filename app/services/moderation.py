@@ -0,0 +1,244 @@
+# ==========================================================
+# 💬 CONFESSLY — BULK MODERATION
+# File: app/services/moderation.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import os
+import re
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_db, register_indexes
+from app.models.confession import ConfessionModel
+from app.utils.pagination import parse_time
+
+STATUSES = ("active", "hidden", "deleted")
+JOBS = "moderation_jobs"
+OUTCOMES = ("updated", "unchanged", "not_found", "invalid_id")
+MAX_JOB_FAILURES = 1000  # per-item non-"updated" results kept on a job document
+FILTER_FIELDS = ("mood", "from", "to", "text", "session_id")
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _filter_chunks(collection, query, size):
+    """
+    _id-ordered chunks of the ids matching `query`, one short query per
+    chunk (resuming after the last _id) so no server cursor has to survive
+    a whole background job.
+    """
+    last = None
+    while True:
+        page = query if last is None else {"$and": [query, {"_id": {"$gt": last}}]}
+        chunk = [doc["_id"] for doc in collection.find(page, {"_id": 1}).sort("_id", ASCENDING).limit(size)]
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < size:
+            return
+        last = chunk[-1]
+
+
+def _parse_ids(raw_ids):
+    """Split raw ids into (unique ObjectIds in order, invalid raw values)."""
+    valid, invalid, seen = [], [], set()
+    for raw in raw_ids:
+        if not isinstance(raw, str) or not ObjectId.is_valid(raw):
+            invalid.append(raw)
+            continue
+        oid = ObjectId(raw)
+        if oid not in seen:
+            seen.add(oid)
+            valid.append(oid)
+    return valid, invalid
+
+
+def build_filter(criteria, status):
+    """
+    Mongo filter for {mood, from, to, text, session_id}; at least one is
+    required so a typo can never moderate the whole collection. Documents
+    already in the target status are skipped.
+    """
+    if not isinstance(criteria, dict) or not any(criteria.get(f) for f in FILTER_FIELDS):
+        raise ValueError(f"filter needs at least one of: {', '.join(FILTER_FIELDS)}")
+
+    query = ConfessionModel.search_filter(
+        criteria.get("mood"), None,
+        parse_time(criteria.get("from"), "from"), parse_time(criteria.get("to"), "to")
+    )
+    if criteria.get("session_id"):
+        query["session_id"] = criteria["session_id"]
+    if criteria.get("text"):
+        # Literal, case-insensitive substring (raids repeat the same text)
+        query["text"] = {"$regex": re.escape(criteria["text"]), "$options": "i"}
+    query["status"] = {"$ne": status}
+    return query
+
+
+def _apply(chunks, status, moderator, on_chunk):
+    """Run set_status_many per chunk and hand each {id: outcome} map to on_chunk."""
+    for chunk in chunks:
+        on_chunk(ConfessionModel.set_status_many(chunk, status, moderator))
+
+
+# ==========================================================
+# Background jobs (progress persisted so any worker can answer polls)
+# ==========================================================
+class ModerationJobs:
+    """Runs large moderation batches off the request thread, one at a time per worker."""
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        pid = os.getpid()
+        with self._lock:
+            if self._executor is None or self._pid != pid:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="confessly-moderation")
+                self._pid = pid
+            return self._executor
+
+    def submit(self, chunks, status, moderator, total, invalid, spec):
+        now = datetime.utcnow()
+        job = {
+            "_id": ObjectId(),
+            "state": "queued",
+            "status": status,
+            "spec": spec,
+            "total": total,
+            "processed": len(invalid),
+            "counts": {outcome: 0 for outcome in OUTCOMES},
+            "failures": [{"id": raw, "result": "invalid_id"} for raw in invalid[:MAX_JOB_FAILURES]],
+            "created_by": moderator,
+            "created_at": now,
+            "updated_at": now,
+            "finished_at": None,
+            "error": None
+        }
+        job["counts"]["invalid_id"] = len(invalid)
+        get_db()[JOBS].insert_one(job)
+        self._pool().submit(self._run, job["_id"], chunks, status, moderator)
+        return job
+
+    def get(self, job_id):
+        try:
+            return get_db()[JOBS].find_one({"_id": ObjectId(job_id)})
+        except (InvalidId, TypeError):
+            return None
+
+    def _run(self, job_id, chunks, status, moderator):
+        jobs = get_db()[JOBS]
+
+        def progress(outcomes):
+            counts = {}
+            for outcome in outcomes.values():
+                counts[f"counts.{outcome}"] = counts.get(f"counts.{outcome}", 0) + 1
+            failures = [{"id": cid, "result": r} for cid, r in outcomes.items() if r != "updated"]
+            jobs.update_one({"_id": job_id}, {
+                "$inc": {"processed": len(outcomes), **counts},
+                "$push": {"failures": {"$each": failures, "$slice": MAX_JOB_FAILURES}},
+                "$set": {"updated_at": datetime.utcnow()}
+            })
+
+        try:
+            jobs.update_one({"_id": job_id}, {"$set": {"state": "running", "updated_at": datetime.utcnow()}})
+            _apply(chunks, status, moderator, progress)
+            final = {"state": "done", "error": None}
+        except Exception as e:  # any failure must leave the job in a terminal state
+            traceback.print_exc()
+            final = {"state": "failed", "error": f"{type(e).__name__}: {e}"}
+        now = datetime.utcnow()
+        try:
+            jobs.update_one({"_id": job_id}, {"$set": {**final, "finished_at": now, "updated_at": now}})
+        except PyMongoError as e:
+            print(f"⚠️ Moderation job {job_id} finished but its state was not saved: {e}")
+            return
+        print(f"🧹 Moderation job {job_id} {final['state']}")
+
+
+moderation_jobs = ModerationJobs()
+
+
+# ==========================================================
+# Entry point
+# ==========================================================
+def moderate(body, moderator=None):
+    """
+    Apply a bulk status change described by a request body:
+      {"ids": [...]} or {"filter": {mood, from, to, text, session_id}},
+      "status": active|hidden|deleted (default deleted), "background": bool.
+    Returns (report, None) when processed inline, or (None, job) when queued.
+    Raises ValueError for invalid input.
+    """
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+    status = body.get("status", "deleted")
+    if status not in STATUSES:
+        raise ValueError(f"status must be one of {', '.join(STATUSES)}")
+    raw_ids, criteria = body.get("ids"), body.get("filter")
+    if bool(raw_ids) == bool(criteria):
+        raise ValueError("Provide either a non-empty `ids` list or a `filter`")
+    background = bool(body.get("background"))
+    chunk_size = Config.MODERATION_CHUNK_SIZE
+
+    if raw_ids:
+        if not isinstance(raw_ids, list):
+            raise ValueError("ids must be a list")
+        if len(raw_ids) > Config.MODERATION_MAX_IDS:
+            raise ValueError(f"At most {Config.MODERATION_MAX_IDS} ids per request; use a `filter` for more")
+        ids, invalid = _parse_ids(raw_ids)
+        total = len(ids) + len(invalid)
+        chunks = _chunks(ids, chunk_size)
+        spec = {"ids": len(raw_ids)}
+    else:
+        query = build_filter(criteria, status)
+        collection = get_db().confessions
+        # Inline decision only needs to know whether the limit is exceeded
+        total = None
+        if not background:
+            total = collection.count_documents(query, limit=Config.MODERATION_SYNC_LIMIT + 1)
+        if total is None or total > Config.MODERATION_SYNC_LIMIT:
+            total = collection.count_documents(query)
+            background = True
+        chunks = _filter_chunks(collection, query, chunk_size)
+        invalid = []
+        spec = {"filter": {f: criteria.get(f) for f in FILTER_FIELDS if criteria.get(f)}}
+
+    if background or total > Config.MODERATION_SYNC_LIMIT:
+        return None, moderation_jobs.submit(chunks, status, moderator, total, invalid, spec)
+
+    results = [{"id": raw, "result": "invalid_id"} for raw in invalid]
+    counts = {outcome: 0 for outcome in OUTCOMES}
+    counts["invalid_id"] = len(invalid)
+
+    def collect(outcomes):
+        for cid, outcome in outcomes.items():
+            counts[outcome] += 1
+            results.append({"id": cid, "result": outcome})
+
+    _apply(chunks, status, moderator, collect)
+    return {"status": status, "total": total, "counts": counts, "results": results}, None
+
+
+register_indexes(
+    JOBS,
+    IndexModel([("created_at", ASCENDING)], name="created_at_ttl", expireAfterSeconds=Config.MODERATION_JOB_TTL),
+)
@@ -0,0 +1,318 @@
+# ==========================================================
+# 💬 CONFESSLY — MOOD ANALYSIS PIPELINE
+# File: app/services/mood.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import argparse
+import atexit
+import hashlib
+import os
+import queue
+import sys
+import threading
+import time
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_db
+from app.services import rollups
+from app.services.search import confession_search
+from app.utils.cache import TTLCache
+
+# Polarity (-1..1) thresholds for mood labels
+HAPPY_THRESHOLD = 0.1
+SAD_THRESHOLD = -0.1
+
+_TextBlob = None
+
+
+def _textblob():
+    """Import TextBlob on first use (heavy import, keep it off app startup)."""
+    global _TextBlob
+    if _TextBlob is None:
+        from textblob import TextBlob
+        _TextBlob = TextBlob
+    return _TextBlob
+
+
+def mood_from_polarity(polarity):
+    if polarity >= HAPPY_THRESHOLD:
+        return "happy"
+    if polarity <= SAD_THRESHOLD:
+        return "sad"
+    return "neutral"
+
+
+def score_texts(texts):
+    """Score a list of texts -> list of mood labels (runs in pool workers)."""
+    TextBlob = _textblob()
+    return [mood_from_polarity(TextBlob(text).sentiment.polarity) for text in texts]
+
+
+def normalize(text):
+    return " ".join(text.lower().split())
+
+
+def text_key(text):
+    return hashlib.sha1(normalize(text).encode()).hexdigest()
+
+
+class MoodPipeline:
+    """
+    Scores confession moods off the request thread.
+
+    ConfessionModel.create() enqueues (confession_id, text). A background
+    thread drains the queue in micro-batches of up to `batch_size` (or
+    whatever arrived within `max_wait` seconds), reuses cached scores for
+    identical normalized text, scores the rest on a process pool (TextBlob
+    is pure Python, so threads would serialize on the GIL) and writes the
+    moods back with a single bulk_write per batch. Every `backfill_interval`
+    seconds, once the queue is empty, it re-queues confessions still missing
+    a mood (dropped on overflow, or lost in a restart).
+    """
+
+    def __init__(self, batch_size=32, max_wait=0.5, workers=1, max_queue=10000,
+                 cache_size=50000, backfill_interval=300, enabled=True):
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.workers = workers
+        self.backfill_interval = backfill_interval
+        self.enabled = enabled
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._cache = TTLCache(ttl=Config.MOOD_CACHE_TTL, maxsize=cache_size)
+        self._executor = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stopped = False
+        self.metrics = {
+            "enqueued": 0,
+            "dropped": 0,
+            "scored": 0,
+            "cache_hits": 0,
+            "batches": 0,
+            "write_errors": 0,
+            "already_scored": 0,
+            "backfilled": 0,
+            "last_batch_size": 0,
+            "last_batch_ms": 0.0
+        }
+
+    # ------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------
+    def submit(self, confession_id, text):
+        """Queue a confession for scoring. Never blocks the request."""
+        if not self.enabled or not text:
+            return False
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((ObjectId(confession_id), text))
+        except queue.Full:
+            self.metrics["dropped"] += 1  # re-queued by the worker's periodic backfill()
+            return False
+        self.metrics["enqueued"] += 1
+        return True
+
+    def backfill(self, limit=1000):
+        """Queue active confessions that have no mood yet (e.g. after drops)."""
+        cursor = get_db().confessions.find(
+            {"status": "active", "mood": {"$exists": False}}, {"text": 1}
+        ).limit(limit)
+        queued = sum(1 for doc in cursor if self.submit(doc["_id"], doc.get("text")))
+        self.metrics["backfilled"] += queued
+        return queued
+
+    # ------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------
+    def score(self, texts):
+        """Score texts using the cache first and the worker pool for misses."""
+        keys = [text_key(t) for t in texts]
+        moods = [self._cache.get(k) for k in keys]
+        misses = {}
+        for i, mood in enumerate(moods):
+            if mood is None:
+                misses.setdefault(keys[i], texts[i])
+        self.metrics["cache_hits"] += len(texts) - len(misses)
+
+        if misses:
+            miss_keys = list(misses)
+            scored = self._score_uncached([misses[k] for k in miss_keys])
+            for key, mood in zip(miss_keys, scored):
+                self._cache.set(key, mood)
+            fresh = dict(zip(miss_keys, scored))
+            moods = [m if m is not None else fresh[k] for m, k in zip(moods, keys)]
+        self.metrics["scored"] += len(texts)
+        return moods
+
+    def _score_uncached(self, texts):
+        if self.workers <= 0:
+            return score_texts(texts)
+        chunk = max(1, -(-len(texts) // self.workers))  # ceil division
+        chunks = [texts[i:i + chunk] for i in range(0, len(texts), chunk)]
+        try:
+            return [mood for part in self._pool().map(score_texts, chunks) for mood in part]
+        except RuntimeError:  # broken pool, or interpreter exit: score inline, rebuild next batch
+            self._executor = None
+            return score_texts(texts)
+
+    def _pool(self):
+        if self._executor is None:
+            # First batch only (multiprocessing is slow to import). Created from the
+            # worker thread, so never fork: a forked child would inherit held locks.
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context(method)
+            )
+        return self._executor
+
+    # ------------------------------------------------------
+    # Background worker
+    # ------------------------------------------------------
+    def _next_batch(self):
+        try:
+            first = self._queue.get(timeout=self.max_wait)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def process_batch(self, batch):
+        """Score a batch of (confession_id, text) and bulk-write the moods."""
+        started = time.perf_counter()
+        moods = self.score([text for _, text in batch])
+        # Only the first mood sticks: another worker's queue or backfill may hold the same
+        # confession. `mood_batch` tags the documents this batch actually wrote.
+        batch_id = ObjectId()
+        requests = [
+            UpdateOne({"_id": cid, "mood": {"$exists": False}}, {"$set": {"mood": mood, "mood_batch": batch_id}})
+            for (cid, _), mood in zip(batch, moods)
+        ]
+        confessions = get_db().confessions
+        try:
+            result = confessions.bulk_write(requests, ordered=False)
+            if result.modified_count == len(batch):
+                written = {cid for cid, _ in batch}
+            elif result.modified_count:
+                written = {doc["_id"] for doc in confessions.find(
+                    {"_id": {"$in": [cid for cid, _ in batch]}, "mood_batch": batch_id}, {"_id": 1}
+                )}
+            else:
+                written = set()
+        except PyMongoError as e:
+            self.metrics["write_errors"] += 1
+            print(f"⚠️ Mood write-back failed: {e}")
+        else:
+            self.metrics["already_scored"] += len(batch) - len(written)
+            for (cid, _), mood in zip(batch, moods):
+                if cid not in written:
+                    continue  # scored elsewhere first; counting it again would inflate rollups
+                written.discard(cid)  # the same id twice in one batch is written once
+                # ObjectIds carry their creation time; rollups use naive UTC
+                rollups.record_mood(cid.generation_time.replace(tzinfo=None), mood)
+                confession_search.on_mood(cid, mood)
+        self.metrics["batches"] += 1
+        self.metrics["last_batch_size"] = len(batch)
+        self.metrics["last_batch_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+    def _run(self):
+        next_backfill = time.monotonic() + self.backfill_interval
+        while not self._stopped:
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self.process_batch(batch)
+                except Exception as e:
+                    print(f"⚠️ Mood pipeline error: {e}")
+            if self.backfill_interval and time.monotonic() >= next_backfill and self._queue.empty():
+                next_backfill = time.monotonic() + self.backfill_interval
+                try:
+                    self.backfill()
+                except PyMongoError as e:
+                    print(f"⚠️ Mood backfill failed: {e}")
+
+    def _ensure_worker(self):
+        """Start once per process (gunicorn forks after create_app)."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._executor = None
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name="confessly-mood", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Drain what is already queued, then stop the worker and pool."""
+        self._stopped = True
+        if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+            self._thread.join(timeout=self.max_wait * 2 + 1)
+        pending = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if pending and get_db() is not None:
+            for i in range(0, len(pending), self.batch_size):
+                self.process_batch(pending[i:i + self.batch_size])
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=False)
+
+    def stats(self):
+        m = dict(self.metrics)
+        m["queued"] = self._queue.qsize()
+        m["cache_size"] = len(self._cache)
+        return m
+
+
+mood_pipeline = MoodPipeline(
+    batch_size=Config.MOOD_BATCH_SIZE,
+    max_wait=Config.MOOD_MAX_WAIT,
+    workers=Config.MOOD_WORKERS,
+    max_queue=Config.MOOD_MAX_QUEUE,
+    backfill_interval=Config.MOOD_BACKFILL_INTERVAL,
+    enabled=Config.MOOD_ANALYSIS_ENABLED
+)
+
+atexit.register(mood_pipeline.close)
+
+
+# ----------------------------------------------------------
+# CLI: python -m app.services.mood backfill --limit 5000
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confessly mood analysis")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--limit", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    from app.db import _connect
+    _connect()
+    queued = mood_pipeline.backfill(args.limit)
+    mood_pipeline.close()  # scores and writes everything queued before exiting
+    print(f"✅ Scored {queued} confessions missing a mood")
+    return 0
+
+
+if __name__ == "__main__":
+    from app.services.mood import main as _main
+    sys.exit(_main())
@@ -0,0 +1,161 @@
+# ==========================================================
+# 💬 CONFESSLY — ANALYTICS ROLLUPS
+# File: app/services/rollups.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, IndexModel
+from app.db import get_db, register_indexes
+from app.utils.write_behind import write_buffer
+
+COLLECTION = "analytics_rollups"
+
+# granularity -> (bucket seconds, retention or None = keep forever)
+GRANULARITIES = {
+    "minute": (60, timedelta(days=2)),
+    "hour": (3600, timedelta(days=90)),
+    "day": (86400, None),
+}
+MAX_BUCKETS = 500
+SOURCE_TTL = timedelta(hours=24)  # confessions TTL (created_at_1 in models/confession.py)
+
+
+def bucket_start(ts, granularity):
+    seconds = GRANULARITIES[granularity][0]
+    epoch = int((ts - datetime(1970, 1, 1)).total_seconds())
+    return datetime(1970, 1, 1) + timedelta(seconds=epoch - epoch % seconds)
+
+
+def _record(ts, inc):
+    """Add counters to the minute/hour/day buckets containing `ts` (write-behind)."""
+    for granularity, (_, retention) in GRANULARITIES.items():
+        start = bucket_start(ts, granularity)
+        fields = {"expires_at": start + retention} if retention else None
+        write_buffer.update(
+            COLLECTION,
+            {"granularity": granularity, "bucket": start},
+            inc=inc,
+            set_fields=fields,
+            upsert=True
+        )
+
+
+# ----------------------------------------------------------
+# Write hooks (called from models / pipelines)
+# ----------------------------------------------------------
+def record_confession(created_at):
+    _record(created_at, {"confessions": 1})
+
+
+def record_mood(created_at, mood):
+    _record(created_at, {f"moods.{mood}": 1})
+
+
+def record_reaction(emoji, at=None):
+    _record(at or datetime.utcnow(), {f"reactions.{emoji}": 1, "reactions_total": 1})
+
+
+# ----------------------------------------------------------
+# Reads
+# ----------------------------------------------------------
+def series(granularity, since=None, until=None):
+    """Bucket docs for [since, until), oldest first (at most MAX_BUCKETS)."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+    seconds = GRANULARITIES[granularity][0]
+    until = until or datetime.utcnow()
+    since = since or until - timedelta(seconds=seconds * 60)
+    if (until - since).total_seconds() / seconds > MAX_BUCKETS:
+        raise ValueError(f"Range too large: at most {MAX_BUCKETS} {granularity} buckets")
+
+    return list(get_db()[COLLECTION].find(
+        {"granularity": granularity, "bucket": {"$gte": bucket_start(since, granularity), "$lt": until}},
+        {"_id": 0, "expires_at": 0}
+    ).sort("bucket", ASCENDING))
+
+
+# ----------------------------------------------------------
+# Reconciliation: rebuild confession / mood counts from raw data
+# ----------------------------------------------------------
+def rebuild(granularity="hour", hours=24):
+    """
+    Recompute `confessions` and `moods` for recent buckets with one
+    aggregation + $merge. Raw confessions only live SOURCE_TTL, so buckets
+    that started before the oldest surviving confession are skipped: their
+    sources are partly expired and a recount would shrink them. Reaction
+    totals are event-time counters and are left untouched. Returns the
+    first bucket rebuilt.
+    """
+    seconds, retention = GRANULARITIES[granularity]
+    now = datetime.utcnow()
+    oldest_complete = bucket_start(now - SOURCE_TTL, granularity)
+    if oldest_complete < now - SOURCE_TTL:
+        oldest_complete += timedelta(seconds=seconds)
+    since = max(bucket_start(now - timedelta(hours=hours), granularity), oldest_complete)
+
+    pipeline = [
+        {"$match": {"created_at": {"$gte": since}}},
+        {"$group": {
+            "_id": {
+                "bucket": {"$dateTrunc": {"date": "$created_at", "unit": granularity}},
+                "mood": {"$ifNull": ["$mood", None]}
+            },
+            "count": {"$sum": 1}
+        }},
+        {"$group": {
+            "_id": "$_id.bucket",
+            "confessions": {"$sum": "$count"},
+            "moods": {"$push": {"k": "$_id.mood", "v": "$count"}}
+        }},
+        {"$project": {
+            "_id": 0,
+            "granularity": granularity,
+            "bucket": "$_id",
+            "confessions": 1,
+            "moods": {"$arrayToObject": {"$filter": {
+                "input": "$moods", "cond": {"$ne": ["$$this.k", None]}
+            }}},
+            **({"expires_at": {"$add": ["$_id", int(retention.total_seconds() * 1000)]}} if retention else {})
+        }},
+        {"$merge": {
+            "into": COLLECTION,
+            "on": ["granularity", "bucket"],
+            "whenMatched": "merge",
+            "whenNotMatched": "insert"
+        }}
+    ]
+    get_db().confessions.aggregate(pipeline)
+    return since
+
+
+register_indexes(
+    COLLECTION,
+    IndexModel([("granularity", ASCENDING), ("bucket", ASCENDING)], name="granularity_bucket_unique", unique=True),
+    # Minute (2 days) and hour (90 days) buckets age out via expires_at; day buckets are kept
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+)
+
+
+# ----------------------------------------------------------
+# CLI: python -m app.services.rollups rebuild --granularity hour --hours 24
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confessly analytics rollups")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--granularity", choices=list(GRANULARITIES), default="hour")
+    parser.add_argument("--hours", type=int, default=24)
+    args = parser.parse_args(argv)
+
+    from app.db import _connect
+    _connect()
+    since = rebuild(args.granularity, args.hours)
+    print(f"✅ Rebuilt {args.granularity} rollups since {since:%Y-%m-%d %H:%M} UTC")
+    return 0
+
+
+if __name__ == "__main__":
+    from app.services.rollups import main as _main
+    sys.exit(_main())
@@ -0,0 +1,297 @@
+# ==========================================================
+# 💬 CONFESSLY — CONFESSION TEXT SEARCH
+# File: app/services/search.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+import unicodedata
+from datetime import datetime
+from app.config import Config
+from app.db import get_db
+
+
+def _combining_marks():
+    """Character-class body for every combining mark (Mn/Mc/Me) in the BMP."""
+    marks = [code for code in range(0x10000) if unicodedata.category(chr(code)).startswith("M")]
+    ranges, start = [], marks[0]
+    for prev, code in zip(marks, marks[1:] + [None]):
+        if code != prev + 1:
+            ranges.append(f"\\u{start:04x}-\\u{prev:04x}")
+            start = code
+    return "".join(ranges)
+
+
+# Letters/digits in any script. \w alone splits Indic words at vowel signs
+# (combining marks are not alphanumeric), so marks continue a token.
+TOKEN_RE = re.compile(rf"\w[\w{_combining_marks()}]*", re.UNICODE)
+MAX_PREFIX_EXPANSION = 200  # vocabulary terms one prefix may expand to
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(unicodedata.normalize("NFC", (text or "").casefold()))
+
+
+def parse_query(q, prefix_last=False):
+    """
+    Split a query into (terms, prefixes). `word*` is a prefix term; with
+    prefix_last=True the final word is treated as a prefix (search-as-you-type).
+    """
+    terms, prefixes = [], []
+    raw = (q or "").casefold().split()
+    for i, word in enumerate(raw):
+        is_prefix = word.endswith("*") or (prefix_last and i == len(raw) - 1)
+        for token in tokenize(word):
+            (prefixes if is_prefix else terms).append(token)
+    return list(dict.fromkeys(terms)), list(dict.fromkeys(prefixes))
+
+
+def _matches_filters(meta, mood, status, since, until):
+    return (
+        (not mood or meta["mood"] == mood)
+        and (not status or meta["status"] == status)
+        and (since is None or meta["created_at"] >= since)
+        and (until is None or meta["created_at"] < until)
+    )
+
+
+# ==========================================================
+# In-process inverted index (local stand-in / small deployments)
+# ==========================================================
+class InvertedIndex:
+    """
+    Token -> {confession_id: term frequency} postings with a sorted
+    vocabulary for prefix expansion, ranked with BM25. All query terms
+    must match (AND); a prefix matches if any expansion matches.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings = {}
+        self._vocab = []        # sorted tokens for prefix lookup
+        self._meta = {}         # id -> {"mood", "status", "created_at", "length", "tokens"}
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._meta)
+
+    def add(self, doc):
+        cid = doc["_id"]
+        tokens = tokenize(doc.get("text"))
+        with self._lock:
+            if cid in self._meta:
+                self.remove(cid)
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    bisect.insort(self._vocab, token)
+                postings[cid] = tf
+            self._meta[cid] = {
+                "mood": doc.get("mood"),
+                "status": doc.get("status"),
+                "created_at": doc.get("created_at"),
+                "length": len(tokens),
+                "tokens": tuple(counts)
+            }
+            self._total_length += len(tokens)
+
+    def remove(self, cid):
+        with self._lock:
+            meta = self._meta.pop(cid, None)
+            if meta is None:
+                return
+            self._total_length -= meta["length"]
+            for token in meta["tokens"]:
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(cid, None)
+                    if not postings:
+                        del self._postings[token]
+                        i = bisect.bisect_left(self._vocab, token)
+                        if i < len(self._vocab) and self._vocab[i] == token:
+                            self._vocab.pop(i)
+
+    def update(self, cid, **fields):
+        with self._lock:
+            meta = self._meta.get(cid)
+            if meta is not None:
+                meta.update({k: v for k, v in fields.items() if k in ("mood", "status")})
+
+    def expand(self, prefix):
+        i = bisect.bisect_left(self._vocab, prefix)
+        out = []
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix) and len(out) < MAX_PREFIX_EXPANSION:
+            out.append(self._vocab[i])
+            i += 1
+        return out
+
+    def _idf(self, df):
+        n = len(self._meta)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, terms, prefixes, mood=None, status=None, since=None, until=None,
+               offset=0, limit=20):
+        """Return ([(id, score)], total_matches) ranked by BM25."""
+        with self._lock:
+            groups = [[t] for t in terms] + [self.expand(p) for p in prefixes]
+            if not groups or any(not g for g in groups):
+                return [], 0
+
+            # Candidate set: intersect the smallest groups first
+            group_docs = []
+            for group in groups:
+                docs = set()
+                for token in group:
+                    docs.update(self._postings.get(token, ()))
+                group_docs.append(docs)
+            group_docs.sort(key=len)
+            candidates = set.intersection(*group_docs) if group_docs else set()
+
+            avg_len = (self._total_length / len(self._meta)) if self._meta else 1
+            k1, b = self.K1, self.B
+            # Resolve postings and idf once per token, not once per document
+            weighted = [
+                (self._postings[token], self._idf(len(self._postings[token])) * (k1 + 1))
+                for group in groups for token in group if token in self._postings
+            ]
+            filtered = mood or status or since is not None or until is not None
+            meta_all = self._meta
+            scored = []
+            for cid in candidates:
+                meta = meta_all[cid]
+                if filtered and not _matches_filters(meta, mood, status, since, until):
+                    continue
+                norm = k1 * (1 - b + b * meta["length"] / avg_len)
+                score = 0.0
+                for postings, weight in weighted:
+                    tf = postings.get(cid)
+                    if tf:
+                        score += weight * tf / (tf + norm)
+                scored.append((score, meta["created_at"] or datetime.min, cid))
+
+        # Only the requested page needs ordering
+        page = heapq.nlargest(offset + limit, scored, key=lambda row: (row[0], row[1]))[offset:]
+        return [(cid, score) for score, _, cid in page], len(scored)
+
+
+# ==========================================================
+# Search front-end (Mongo $text or in-process index)
+# ==========================================================
+class ConfessionSearch:
+    """
+    Ranked confession search. The `mongo` backend uses the `text_search`
+    text index ($text + textScore); `$text` has no prefix operator, so prefix
+    terms become anchored word-boundary regexes evaluated on the rows the
+    other conditions select. The `memory` backend keeps an InvertedIndex of
+    live confessions, refreshed every `refresh` seconds and patched on
+    create/delete.
+    """
+
+    def __init__(self, backend="mongo", refresh=300):
+        self.backend = backend
+        self.refresh = refresh
+        self.index = InvertedIndex()
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------
+    # Hooks from ConfessionModel
+    # ------------------------------------------------------
+    def on_create(self, doc):
+        if self.backend == "memory" and self._loaded_at:
+            self.index.add(doc)
+
+    def on_status(self, cid, status):
+        if self.backend == "memory":
+            self.index.update(cid, status=status)
+
+    def on_mood(self, cid, mood):
+        """Moods are scored after create (MoodPipeline); keep mood filters current."""
+        if self.backend == "memory":
+            self.index.update(cid, mood=mood)
+
+    # ------------------------------------------------------
+    # Query
+    # ------------------------------------------------------
+    def search(self, q, projection, mood=None, status=None, since=None, until=None,
+               prefix_last=False, offset=0, limit=20):
+        """Return (documents ranked best first, has_more)."""
+        terms, prefixes = parse_query(q, prefix_last)
+        if not terms and not prefixes:
+            return [], False
+        if self.backend == "memory":
+            return self._search_memory(terms, prefixes, projection, mood, status, since, until, offset, limit)
+        return self._search_mongo(terms, prefixes, projection, mood, status, since, until, offset, limit)
+
+    def _search_mongo(self, terms, prefixes, projection, mood, status, since, until, offset, limit):
+        query = {}
+        if terms:
+            # Quoting each term makes $text require all of them (AND)
+            query["$text"] = {"$search": " ".join(f'"{t}"' for t in terms)}
+        if prefixes:
+            query["$and"] = [
+                {"text": {"$regex": rf"\b{re.escape(p)}", "$options": "i"}} for p in prefixes
+            ]
+        if mood:
+            query["mood"] = mood
+        if status:
+            query["status"] = status
+        if since or until:
+            query["created_at"] = {
+                **({"$gte": since} if since else {}), **({"$lt": until} if until else {})
+            }
+
+        projection = dict(projection)
+        if terms:
+            projection["score"] = {"$meta": "textScore"}
+            sort = [("score", {"$meta": "textScore"}), ("created_at", -1)]
+        else:
+            sort = [("created_at", -1), ("_id", -1)]
+
+        cursor = get_db().confessions.find(query, projection).sort(sort).skip(offset).limit(limit + 1)
+        docs = list(cursor)
+        return docs[:limit], len(docs) > limit
+
+    def _search_memory(self, terms, prefixes, projection, mood, status, since, until, offset, limit):
+        self._ensure_loaded()
+        ranked, total = self.index.search(terms, prefixes, mood, status, since, until, offset, limit)
+        has_more = offset + len(ranked) < total
+        if not ranked:
+            return [], has_more
+        ids = [cid for cid, _ in ranked]
+        found = {d["_id"]: d for d in get_db().confessions.find({"_id": {"$in": ids}}, projection)}
+        docs = []
+        for cid, score in ranked:
+            if cid in found:
+                docs.append(dict(found[cid], score=round(score, 4)))
+        return docs, has_more
+
+    def _ensure_loaded(self):
+        if time.monotonic() - self._loaded_at < self.refresh:
+            return
+        with self._lock:
+            if time.monotonic() - self._loaded_at < self.refresh:
+                return
+            index = InvertedIndex()
+            cursor = get_db().confessions.find(
+                {}, {"text": 1, "mood": 1, "status": 1, "created_at": 1}
+            ).batch_size(1000)
+            for doc in cursor:
+                index.add(doc)
+            self.index = index
+            self._loaded_at = time.monotonic()
+
+
+confession_search = ConfessionSearch(backend=Config.SEARCH_BACKEND, refresh=Config.SEARCH_INDEX_REFRESH)
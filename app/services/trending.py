@@ -0,0 +1,377 @@
+# ==========================================================
+# 💬 CONFESSLY — TRENDING / HOT RANKING ENGINE
+# File: app/services/trending.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import atexit
+import heapq
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from app.config import Config
+from app.db import get_db, register_indexes
+from app.utils.cache import TTLCache
+
+EPOCH_SECONDS = 86400  # scores are rebased once per UTC day
+CREATE_WEIGHT = 1.0
+REACTION_WEIGHTS = {"heart": 1.0, "laugh": 1.0, "sad": 1.0, "angry": 1.0, "relate": 1.5}
+
+
+def _timestamp(dt):
+    """Unix seconds for a naive-UTC (pymongo style) or aware datetime."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _naive_utc(ts):
+    """Unix seconds -> naive-UTC datetime (pymongo style)."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+
+def _created_ts(confession_id):
+    """Creation time encoded in the ObjectId, for confessions created on another worker."""
+    if isinstance(confession_id, ObjectId):
+        return _timestamp(confession_id.generation_time)
+    return time.time()
+
+
+def _current_epoch(now=None):
+    now = time.time() if now is None else now
+    return int(now // EPOCH_SECONDS) * EPOCH_SECONDS
+
+
+class TrendingEngine:
+    """
+    Time-decayed hotness ranking maintained incrementally.
+
+    Instead of decaying every score over time, each event adds
+    weight * 2^((t - epoch) / half_life): newer events count exponentially
+    more, and relative order is identical to a true exponential decay.
+    Scores are rebased when the UTC day (epoch) changes so they stay small.
+
+    The top `k` confessions live in a min-heap (lazy deletion), so an event
+    costs O(log k) and top() is O(k) from a cached sorted snapshot. Every
+    `sync_interval` seconds local deltas are $inc'ed into `trending_scores`
+    and the best `sync_size` scores are read back, which merges the views
+    of all gunicorn workers and survives restarts. Deletions are synced as
+    tombstones (`deleted: true`, expiring with the confession) so another
+    worker's pending $inc upsert cannot bring a deleted confession back.
+    """
+
+    def __init__(self, k=50, half_life=7200, sync_interval=30, sync_size=1000,
+                 max_age=86400, enabled=True):
+        self.k = k
+        self.half_life = half_life
+        self.sync_interval = sync_interval
+        self.sync_size = sync_size
+        self.max_age = max_age
+        self.enabled = enabled
+
+        self._lock = threading.RLock()
+        self._epoch = _current_epoch()
+        self._scores = {}    # confession_id -> score (epoch-relative)
+        self._created = {}   # confession_id -> created_at (unix seconds)
+        self._pending = {}   # confession_id -> score delta not yet synced
+        self._deleted = set()  # removed locally, to tombstone in Mongo on sync
+        self._restored = set()  # restored by moderation, to un-tombstone on sync
+        self._top = {}       # confession_id -> score, the current top-k
+        self._heap = []      # (score, confession_id) min-heap; stale entries skipped
+        self._snapshot = None
+        self._docs = TTLCache(ttl=Config.TRENDING_DOC_TTL, maxsize=k * 4)
+        self._thread = None
+        self._pid = None
+        self._stopped = False
+        self.metrics = {"events": 0, "syncs": 0, "sync_errors": 0, "last_sync_ms": 0.0}
+
+    # ------------------------------------------------------
+    # Events
+    # ------------------------------------------------------
+    def on_create(self, confession_id, created_at=None):
+        if not self.enabled:
+            return  # nothing would ever drain the local state
+        ts = _timestamp(created_at) if isinstance(created_at, datetime) else _created_ts(confession_id)
+        self._ensure_worker()
+        with self._lock:
+            self._deleted.discard(confession_id)  # a moderation restore re-creates it
+            self._docs.delete(confession_id)
+            self._created[confession_id] = ts
+            self._add(confession_id, CREATE_WEIGHT * self._weight(ts))
+
+    def on_restore(self, confession_id, created_at=None):
+        """A moderation restore: like on_create, but clears the synced tombstone too."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._restored.add(confession_id)
+        self.on_create(confession_id, created_at)
+
+    def on_reaction(self, confession_id, emoji, at=None):
+        if not self.enabled:
+            return
+        weight = REACTION_WEIGHTS.get(emoji, 1.0)
+        self._ensure_worker()
+        with self._lock:
+            if confession_id in self._deleted:
+                return
+            if confession_id not in self._created:
+                self._created[confession_id] = _created_ts(confession_id)
+            self._add(confession_id, weight * self._weight(at or time.time()))
+
+    def on_delete(self, confession_id):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._scores.pop(confession_id, None)
+            self._created.pop(confession_id, None)
+            self._pending.pop(confession_id, None)
+            self._restored.discard(confession_id)
+            self._deleted.add(confession_id)
+            self._docs.delete(confession_id)
+            if self._top.pop(confession_id, None) is not None:
+                self._rebuild_top()
+
+    # ------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------
+    def top(self, limit=None):
+        """[(confession_id, hotness)] best first; hotness is the decayed score now."""
+        self._ensure_worker()
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+            snapshot = self._snapshot
+            scale = self._weight(time.time())
+        limit = self.k if limit is None else min(limit, self.k)
+        return [(cid, score / scale) for cid, score in snapshot[:limit]]
+
+    def top_documents(self, projection, limit=None):
+        """Top confessions as documents; bodies come from a short-TTL cache."""
+        ranked = self.top(limit)
+        missing = [cid for cid, _ in ranked if self._docs.get(cid) is None]
+        if missing:
+            found = {
+                doc["_id"]: doc for doc in get_db().confessions.find(
+                    {"_id": {"$in": missing}, "status": "active"}, projection
+                )
+            }
+            for cid in missing:
+                self._docs.set(cid, found.get(cid, False))  # False = gone / deleted
+        results = []
+        for cid, hotness in ranked:
+            doc = self._docs.get(cid)
+            if doc:
+                results.append(dict(doc, hotness=round(hotness, 4)))
+        return results
+
+    # ------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------
+    def _weight(self, ts):
+        epoch = _current_epoch(ts)
+        if epoch > self._epoch:
+            self._rebase(epoch)
+        return 2 ** ((ts - self._epoch) / self.half_life)
+
+    def _rebase(self, epoch):
+        factor = 2 ** (-(epoch - self._epoch) / self.half_life)
+        self._epoch = epoch
+        for store in (self._scores, self._pending):
+            for cid in store:
+                store[cid] *= factor
+        self._rebuild_top()
+
+    def _add(self, cid, amount):
+        self.metrics["events"] += 1
+        score = self._scores.get(cid, 0.0) + amount
+        self._scores[cid] = score
+        self._pending[cid] = self._pending.get(cid, 0.0) + amount
+        self._offer(cid, score)
+
+    def _offer(self, cid, score):
+        if cid in self._top:
+            self._top[cid] = score
+        elif len(self._top) < self.k:
+            self._top[cid] = score
+        elif score > self._min_top():
+            min_score, min_cid = heapq.heappop(self._heap)
+            del self._top[min_cid]
+            self._top[cid] = score
+        else:
+            return
+        heapq.heappush(self._heap, (score, cid))
+        self._snapshot = None
+        if len(self._heap) > self.k * 4:
+            self._heap = [(s, c) for c, s in self._top.items()]
+            heapq.heapify(self._heap)
+
+    def _min_top(self):
+        heap = self._heap
+        while heap and self._top.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0]
+
+    def _rebuild_top(self):
+        best = heapq.nlargest(self.k, self._scores.items(), key=lambda item: item[1])
+        self._top = dict(best)
+        self._heap = [(s, c) for c, s in best]
+        heapq.heapify(self._heap)
+        self._snapshot = None
+
+    # ------------------------------------------------------
+    # Persistence / cross-worker merge
+    # ------------------------------------------------------
+    def sync(self):
+        """Push local deltas to Mongo and pull the merged top scores back."""
+        db = get_db()
+        if db is None:
+            return
+        started = time.perf_counter()
+        with self._lock:
+            self._weight(time.time())  # rebase first if the day rolled over
+            pending, self._pending = self._pending, {}
+            deleted, self._deleted = self._deleted, set()
+            restored, self._restored = self._restored, set()
+            epoch = self._epoch
+            created = {cid: self._created.get(cid) for cid in pending}
+        pushed = False
+
+        coll = db.trending_scores
+        try:
+            # Rebase documents written under an older epoch (idempotent)
+            coll.update_many({"epoch": {"$lt": epoch}}, [{"$set": {
+                "score": {"$multiply": ["$score", {"$pow": [
+                    2, {"$divide": [{"$subtract": ["$epoch", epoch]}, self.half_life]}
+                ]}]},
+                "epoch": epoch
+            }}])
+            if deleted:
+                coll.bulk_write([
+                    UpdateOne(
+                        {"_id": cid},
+                        {"$set": {"deleted": True, "score": 0.0, "epoch": epoch},
+                         "$setOnInsert": {"created_at": _naive_utc(_created_ts(cid))}},
+                        upsert=True
+                    ) for cid in deleted
+                ], ordered=False)
+            if restored:
+                coll.update_many(
+                    {"_id": {"$in": list(restored)}},
+                    {"$unset": {"deleted": ""}, "$set": {"score": 0.0, "epoch": epoch}}
+                )
+            if pending:
+                items = list(pending.items())
+                try:
+                    coll.bulk_write([
+                        UpdateOne(
+                            {"_id": cid, "deleted": {"$ne": True}},
+                            {
+                                "$inc": {"score": delta},
+                                "$set": {"epoch": epoch},
+                                "$setOnInsert": {"created_at": _naive_utc(created[cid] or _created_ts(cid))}
+                            },
+                            upsert=True
+                        ) for cid, delta in items
+                    ], ordered=False)
+                except BulkWriteError as e:
+                    # Duplicate _id: tombstoned by the worker that saw the delete, so the
+                    # delta is dropped. Other failures retry; the rest of the batch applied.
+                    retry = [items[err["index"]] for err in e.details.get("writeErrors", [])
+                             if err.get("code") != 11000]
+                    if retry:
+                        self.metrics["sync_errors"] += 1
+                        with self._lock:
+                            for cid, delta in retry:
+                                self._pending[cid] = self._pending.get(cid, 0.0) + delta
+                pushed = True
+            merged = list(
+                coll.find({"epoch": epoch, "deleted": {"$ne": True}}).sort("score", -1).limit(self.sync_size)
+            )
+        except PyMongoError as e:
+            with self._lock:
+                if not pushed:
+                    for cid, delta in pending.items():  # retry next round
+                        self._pending[cid] = self._pending.get(cid, 0.0) + delta
+                self._deleted |= deleted - self._restored
+                self._restored |= restored - self._deleted
+            self.metrics["sync_errors"] += 1
+            print(f"⚠️ Trending sync failed: {e}")
+            return
+
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            scores = {}
+            for doc in merged:
+                ts = _timestamp(doc["created_at"]) if doc.get("created_at") else _created_ts(doc["_id"])
+                if ts >= cutoff:
+                    scores[doc["_id"]] = doc["score"]
+                    self._created[doc["_id"]] = ts
+            # Events that arrived while we were talking to Mongo
+            for cid, delta in self._pending.items():
+                scores[cid] = scores.get(cid, 0.0) + delta
+            for cid in self._deleted:
+                scores.pop(cid, None)
+            self._scores = scores
+            self._created = {cid: self._created[cid] for cid in scores if cid in self._created}
+            self._rebuild_top()
+        self.metrics["syncs"] += 1
+        self.metrics["last_sync_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+    def _run(self):
+        while not self._stopped:
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"⚠️ Trending sync error: {e}")
+            for _ in range(int(self.sync_interval * 10)):
+                if self._stopped:
+                    break
+                time.sleep(0.1)
+
+    def _ensure_worker(self):
+        """Start the sync loop once per process (loads persisted scores first)."""
+        if not self.enabled:
+            return
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name="confessly-trending", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        self._stopped = True
+        if self.enabled and self._pending:
+            self.sync()
+
+    def stats(self):
+        m = dict(self.metrics)
+        m["tracked"] = len(self._scores)
+        m["pending"] = len(self._pending)
+        return m
+
+
+register_indexes(
+    "trending_scores",
+    IndexModel([("epoch", ASCENDING), ("score", DESCENDING)], name="epoch_score"),
+    # Scores and tombstones expire with their confession
+    IndexModel([("created_at", ASCENDING)], name="created_at_1", expireAfterSeconds=86400),
+)
+
+
+trending_engine = TrendingEngine(
+    k=Config.TRENDING_TOP_K,
+    half_life=Config.TRENDING_HALF_LIFE,
+    sync_interval=Config.TRENDING_SYNC_INTERVAL,
+    enabled=Config.TRENDING_ENABLED
+)
+
+atexit.register(trending_engine.close)
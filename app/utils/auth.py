@@ -1,21 +1,89 @@
-import os
+import hashlib
+import time
 import jwt
 from flask import request, jsonify
 from functools import wraps
+from app.config import Config
+from app.utils.cache import TTLCache
+from app.utils.metrics import timed
+from app.utils.responses import plain_error
+
+# Resolved once by init_auth() at app creation
+_jwt_secret = Config.JWT_SECRET
+_jwt_algorithm = Config.JWT_ALGORITHM
+
+# token digest -> decoded claims; each entry expires at the token's `exp`
+_token_cache = TTLCache(ttl=Config.JWT_CACHE_MAX_TTL, maxsize=Config.JWT_CACHE_SIZE)
+
+
+def init_auth(app):
+    """Resolve JWT settings once per app instead of on every request."""
+    global _jwt_secret, _jwt_algorithm
+    _jwt_secret = app.config.get("JWT_SECRET") or Config.JWT_SECRET
+    _jwt_algorithm = app.config.get("JWT_ALGORITHM") or Config.JWT_ALGORITHM
+    _token_cache.clear()
+
+
+def issue_token(payload):
+    """Sign a JWT with the app's secret/algorithm."""
+    return jwt.encode(payload, _jwt_secret, algorithm=_jwt_algorithm)
+
+
+def verify_token(token):
+    """
+    Decode a JWT, reusing a cached verification when the same token was
+    already checked. Raises jwt.InvalidTokenError subclasses like jwt.decode.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    decoded = _token_cache.get(key)
+    if decoded is not None:
+        return decoded
+
+    with timed("jwt"):
+        decoded = jwt.decode(token, _jwt_secret, algorithms=[_jwt_algorithm])
+
+    ttl = decoded.get("exp", 0) - time.time()
+    if ttl > 0:
+        _token_cache.set(key, decoded, ttl=min(ttl, Config.JWT_CACHE_MAX_TTL))
+    return decoded
+
+
+class AuthError(Exception):
+    """Rejected Authorization header (message is safe to return as a 401)."""
+
+
+def authenticate(header):
+    """Claims for an `Authorization: Bearer <jwt>` header; raises AuthError."""
+    if not header:
+        raise AuthError("Missing token")
+    try:
+        return verify_token(header.split(" ")[1])
+    except IndexError:
+        raise AuthError("Invalid token")
+    except jwt.ExpiredSignatureError:
+        raise AuthError("Token expired")
+    except jwt.InvalidTokenError:
+        raise AuthError("Invalid token")
+
 
 def admin_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = request.headers.get("Authorization")
-        if not token:
-            return jsonify({"error": "Missing token"}), 401
         try:
-            token = token.split(" ")[1]
-            decoded = jwt.decode(token, os.getenv("JWT_SECRET"), algorithms=["HS256"])
-            request.admin_user = decoded
-        except jwt.ExpiredSignatureError:
-            return jsonify({"error": "Token expired"}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({"error": "Invalid token"}), 401
+            request.admin_user = authenticate(request.headers.get("Authorization"))
+        except AuthError as e:
+            return jsonify({"error": str(e)}), 401
         return f(*args, **kwargs)
     return decorated
+
+
+def async_admin_required(f):
+    """admin_required for ASGI-mode handlers (they receive the request explicitly)."""
+    @wraps(f)
+    async def decorated(req, *args, **kwargs):
+        try:
+            req.admin_user = authenticate(req.headers.get("Authorization"))
+        except AuthError as e:
+            return plain_error(str(e), 401)
+        return await f(req, *args, **kwargs)
+    return decorated
@@ -0,0 +1,81 @@
+# ==========================================================
+# 💬 CONFESSLY — IN-PROCESS TTL CACHE
+# File: app/utils/cache.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+    get_or_compute() is single-flight: concurrent misses on the same key
+    wait for one computation instead of all hitting the database.
+    """
+
+    def __init__(self, ttl, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> Lock held by the computing thread
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_compute(self, key, compute, ttl=None):
+        """Return the cached value or compute it once for all concurrent callers."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = threading.Lock()
+
+        with flight:
+            # Another thread may have filled the cache while we waited
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            try:
+                value = compute()
+                self.set(key, value, ttl)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+        return value
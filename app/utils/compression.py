@@ -0,0 +1,64 @@
+# ==========================================================
+# 💬 CONFESSLY — RESPONSE COMPRESSION
+# File: app/utils/compression.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import gzip
+from flask import request
+from app.config import Config
+from app.utils.metrics import timed
+
+try:
+    import brotli
+except ImportError:  # optional dependency: gzip only
+    brotli = None
+
+COMPRESSIBLE = {"application/json", "text/plain", "text/html", "text/csv"}
+ENCODINGS = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def _encode(encoding, data):
+    if encoding == "br":
+        return brotli.compress(data, quality=Config.COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=Config.COMPRESS_GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response, accept_encodings):
+    """
+    Compress a buffered response in place with the client's preferred
+    encoding (br > gzip). Streamed bodies (exports, SSE), small bodies and
+    already-encoded responses are left alone.
+    """
+    if (
+        not Config.COMPRESS_ENABLED
+        or response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < Config.COMPRESS_MIN_BYTES:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = accept_encodings.best_match(ENCODINGS)
+    if encoding is None:
+        return response
+
+    response.set_data(_encode(encoding, data))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _after_request(response):
+    with timed("compress"):
+        return compress_response(response, request.accept_encodings)
+
+
+def init_compression(app):
+    """Register after init_metrics so Server-Timing includes the compress phase."""
+    app.after_request(_after_request)
@@ -0,0 +1,149 @@
+# ==========================================================
+# 💬 CONFESSLY — PASSWORD HASHING (BOUNDED POOL)
+# File: app/utils/hashing.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import bcrypt
+from werkzeug.security import check_password_hash, generate_password_hash
+from app.config import Config
+
+
+class HashingBusy(Exception):
+    """Raised when too many hash/verify jobs are queued or one times out (→ HTTP 429)."""
+
+
+# ----------------------------------------------------------
+# Hashers (identified by the stored hash prefix)
+# ----------------------------------------------------------
+class BcryptHasher:
+    name = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, rounds=12):
+        self.rounds = rounds
+
+    def hash(self, password):
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(self.rounds)).decode()
+
+    def verify(self, password_hash, password):
+        return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+    def needs_rehash(self, password_hash):
+        # $2b$12$... -> cost is the second field
+        return int(password_hash.split("$")[2]) != self.rounds
+
+
+class WerkzeugHasher:
+    """Legacy hashes created by werkzeug's generate_password_hash (scrypt/pbkdf2)."""
+    name = "werkzeug"
+    prefixes = ("scrypt:", "pbkdf2:")
+
+    def hash(self, password):
+        return generate_password_hash(password)
+
+    def verify(self, password_hash, password):
+        return check_password_hash(password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        return False
+
+
+class PasswordHasher:
+    """Hashes with the preferred scheme, verifies any known scheme."""
+
+    def __init__(self, preferred, hashers):
+        self.hashers = {h.name: h for h in hashers}
+        self.preferred = self.hashers[preferred]
+
+    def _for(self, password_hash):
+        for hasher in self.hashers.values():
+            if password_hash.startswith(hasher.prefixes):
+                return hasher
+        raise ValueError("Unknown password hash format")
+
+    def hash(self, password):
+        return self.preferred.hash(password)
+
+    def verify(self, password_hash, password):
+        try:
+            return self._for(password_hash).verify(password_hash, password)
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash):
+        hasher = self._for(password_hash)
+        return hasher is not self.preferred or hasher.needs_rehash(password_hash)
+
+
+# ----------------------------------------------------------
+# Bounded executor: KDF work never runs unbounded on request threads
+# ----------------------------------------------------------
+class HashingPool:
+    """
+    Runs hash/verify jobs on a small dedicated pool. Both bcrypt and
+    hashlib's KDFs release the GIL, so worker threads give real parallelism
+    up to `workers`; beyond `workers + max_queue` jobs we reject instead of
+    letting logins stall every other request.
+    """
+
+    def __init__(self, hasher, workers=2, max_queue=16, timeout=10.0):
+        self.hasher = hasher
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _pool(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="confessly-hash"
+                    )
+        return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HashingBusy("Too many concurrent password operations")
+        try:
+            future = self._pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()  # still queued: drop it; already running: its slot frees when done
+            self.timed_out += 1
+            raise HashingBusy("Password operation timed out") from None
+
+    def hash(self, password):
+        return self._run(self.hasher.hash, password)
+
+    def verify(self, password_hash, password):
+        return self._run(self.hasher.verify, password_hash, password)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    Config.PASSWORD_HASHER,
+    [BcryptHasher(rounds=Config.BCRYPT_ROUNDS), WerkzeugHasher()]
+)
+hashing_pool = HashingPool(
+    password_hasher,
+    workers=Config.HASH_WORKERS,
+    max_queue=Config.HASH_MAX_QUEUE
+)
@@ -0,0 +1,74 @@
+# ==========================================================
+# 💬 CONFESSLY — FAST JSON PROVIDER (BSON-AWARE)
+# File: app/utils/json_provider.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import json
+from datetime import date, datetime
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency: fall back to the stdlib encoder
+    orjson = None
+
+
+def _default(value):
+    """Encode BSON types without rewriting documents first."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.tzinfo is None:
+            return text + "Z"  # pymongo datetimes are naive UTC
+        return text[:-6] + "Z" if text.endswith("+00:00") else text  # as orjson's OPT_UTC_Z
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj, sort_keys=False):
+        """Serialize to UTF-8 JSON bytes."""
+        option = _ORJSON_OPTS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+
+    def loads(s):
+        return orjson.loads(s)
+else:
+    def dumps_bytes(obj, sort_keys=False):
+        """Serialize to UTF-8 JSON bytes."""
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+        ).encode()
+
+    def loads(s):
+        return json.loads(s)
+
+
+class ConfesslyJSONProvider(JSONProvider):
+    """
+    Flask JSON provider that encodes ObjectId, datetime (ISO-8601, UTC)
+    and Decimal128 natively, using orjson when it is installed.
+    """
+
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj, sort_keys=kwargs.get("sort_keys", False)).decode()
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
@@ -0,0 +1,183 @@
+# ==========================================================
+# 💬 CONFESSLY — REQUEST / QUERY METRICS
+# File: app/utils/metrics.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+from flask import Response, g, has_request_context, request
+from app.config import Config
+
+# Latency buckets in seconds (Prometheus histogram `le` bounds)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(self, name, help_text, label_names, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}  # labels -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for labels, series in items:
+            base = _labels(self.label_names, labels)
+            for i, bound in enumerate(self.buckets):
+                lines.append(f'{self.name}_bucket{{{base}le="{bound}"}} {series[i]}')
+            lines.append(f'{self.name}_bucket{{{base}le="+Inf"}} {series[len(self.buckets)]}')
+            lines.append(f"{self.name}_sum{{{base.rstrip(',')}}} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{base.rstrip(',')}}} {series[len(self.buckets)]}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values."""
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{{{_labels(self.label_names, labels).rstrip(',')}}} {value}")
+        return lines
+
+
+def _labels(names, values):
+    return "".join(f'{n}="{str(v)}",' for n, v in zip(names, values))
+
+
+REQUEST_LATENCY = Histogram(
+    "confessly_request_duration_seconds", "HTTP request latency by route.",
+    ("method", "route", "status")
+)
+MONGO_LATENCY = Histogram(
+    "confessly_mongo_command_duration_seconds", "MongoDB command latency by command.",
+    ("command",)
+)
+MONGO_FAILURES = Counter(
+    "confessly_mongo_command_failures_total", "Failed MongoDB commands by command.",
+    ("command",)
+)
+SLOW_QUERIES = Counter(
+    "confessly_mongo_slow_commands_total", "MongoDB commands slower than SLOW_QUERY_MS.",
+    ("command",)
+)
+
+# Extra gauge providers: name -> callable returning {metric suffix: number}
+_gauge_providers = {}
+
+
+def register_gauges(prefix, provider):
+    """Expose a stats dict (e.g. pool or buffer stats) as gauges on /metrics."""
+    _gauge_providers[prefix] = provider
+
+
+# ==========================================================
+# Per-request timing (Server-Timing phases)
+# ==========================================================
+def record_phase(name, seconds):
+    """Add time to a named phase of the current request (no-op outside requests)."""
+    if has_request_context():
+        timings = g.setdefault("timings", {})
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def timed(name):
+    """Context manager that records its duration as a request phase."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def record_mongo_command(command, seconds):
+    """Called by the driver listener for every finished command."""
+    MONGO_LATENCY.observe((command,), seconds)
+    if has_request_context():
+        g.mongo_ops = g.get("mongo_ops", 0) + 1
+        record_phase("db", seconds)
+
+
+def _before_request():
+    g.request_started = time.perf_counter()
+
+
+def _after_request(response):
+    started = g.get("request_started")
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    REQUEST_LATENCY.observe((request.method, route, response.status_code), elapsed)
+
+    parts = []
+    for phase, seconds in g.get("timings", {}).items():
+        desc = f';desc="{g.get("mongo_ops", 0)} ops"' if phase == "db" else ""
+        parts.append(f"{phase};dur={seconds * 1000:.2f}{desc}")
+    parts.append(f"total;dur={elapsed * 1000:.2f}")
+    response.headers["Server-Timing"] = ", ".join(parts)
+    return response
+
+
+def render_metrics():
+    """All metrics in Prometheus text exposition format."""
+    lines = []
+    for metric in (REQUEST_LATENCY, MONGO_LATENCY, MONGO_FAILURES, SLOW_QUERIES):
+        lines += metric.render()
+    for prefix, provider in sorted(_gauge_providers.items()):
+        for key, value in sorted(provider().items()):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                name = f"confessly_{prefix}_{key}"
+                lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def metrics_endpoint():
+    """GET /metrics (bearer METRICS_TOKEN required when set)."""
+    if Config.METRICS_TOKEN:
+        supplied = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(supplied.encode(), f"Bearer {Config.METRICS_TOKEN}".encode()):
+            return {"error": "Unauthorized"}, 401
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
+def init_metrics(app):
+    """Register request timing hooks, and /metrics when a token or METRICS_ENABLED allows it."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    if Config.METRICS_TOKEN or Config.METRICS_ENABLED:
+        app.add_url_rule("/metrics", "metrics", metrics_endpoint, methods=["GET"])
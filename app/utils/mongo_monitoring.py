@@ -0,0 +1,134 @@
+# ==========================================================
+# 💬 CONFESSLY — MONGO DRIVER MONITORING
+# File: app/utils/mongo_monitoring.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import threading
+from pymongo import monitoring
+from app.config import Config
+from app.utils.metrics import MONGO_FAILURES, SLOW_QUERIES, record_mongo_command
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Tracks connection pool usage via pymongo CMAP events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stats = {
+                "open_connections": 0,
+                "checked_out": 0,
+                "max_checked_out": 0,
+                "checkouts": 0,
+                "checkout_failures": 0,
+                "checkout_timeouts": 0,
+                "wait_ms_total": 0.0,
+                "wait_ms_max": 0.0,
+                "pool_clears": 0
+            }
+
+    def snapshot(self):
+        """Current pool statistics for this worker process."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["wait_ms_avg"] = round(stats["wait_ms_total"] / stats["checkouts"], 3) if stats["checkouts"] else 0
+        stats["wait_ms_total"] = round(stats["wait_ms_total"], 3)
+        stats["wait_ms_max"] = round(stats["wait_ms_max"], 3)
+        return stats
+
+    # ------------------------------------------------------
+    # Checkout lifecycle
+    # ------------------------------------------------------
+    def connection_checked_out(self, event):
+        wait_ms = (event.duration or 0) * 1000
+        with self._lock:
+            s = self._stats
+            s["checkouts"] += 1
+            s["checked_out"] += 1
+            s["max_checked_out"] = max(s["max_checked_out"], s["checked_out"])
+            s["wait_ms_total"] += wait_ms
+            s["wait_ms_max"] = max(s["wait_ms_max"], wait_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self._stats["checked_out"] = max(0, self._stats["checked_out"] - 1)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self._stats["checkout_failures"] += 1
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                self._stats["checkout_timeouts"] += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    # ------------------------------------------------------
+    # Connection / pool lifecycle
+    # ------------------------------------------------------
+    def connection_created(self, event):
+        with self._lock:
+            self._stats["open_connections"] += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._stats["open_connections"] = max(0, self._stats["open_connections"] - 1)
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._stats["pool_clears"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+
+class CommandTimingListener(monitoring.CommandListener):
+    """
+    Times every MongoDB command, attributes it to the current request
+    (Server-Timing `db` phase) and logs commands over SLOW_QUERY_MS.
+    """
+
+    def __init__(self, slow_ms=None):
+        self.slow_ms = Config.SLOW_QUERY_MS if slow_ms is None else slow_ms
+        self._targets = {}  # (request_id, connection_id) -> collection
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        target = event.command.get(event.command_name)
+        if isinstance(target, str):
+            with self._lock:
+                self._targets[(event.request_id, event.connection_id)] = target
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        MONGO_FAILURES.inc((event.command_name,))
+        self._finish(event)
+
+    def _finish(self, event):
+        with self._lock:
+            collection = self._targets.pop((event.request_id, event.connection_id), None)
+        seconds = event.duration_micros / 1e6
+        record_mongo_command(event.command_name, seconds)
+
+        if self.slow_ms and seconds * 1000 >= self.slow_ms:
+            SLOW_QUERIES.inc((event.command_name,))
+            target = f"{event.database_name}.{collection}" if collection else event.database_name
+            print(f"🐢 Slow query: {event.command_name} on {target} took {seconds * 1000:.1f} ms")
+
+
+pool_stats = PoolStatsListener()
+command_timing = CommandTimingListener()
@@ -0,0 +1,161 @@
+# ==========================================================
+# 💬 CONFESSLY — KEYSET PAGINATION HELPERS
+# File: app/utils/pagination.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import base64
+import json
+from datetime import datetime, timezone
+from bson import ObjectId
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Newest first, with _id as tie-breaker so the order is total
+KEYSET_SORT = [("created_at", -1), ("_id", -1)]
+
+
+def parse_limit(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Clamp a user-supplied page size into [1, maximum]."""
+    try:
+        limit = int(raw) if raw is not None else default
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+    return max(1, min(limit, maximum))
+
+
+def parse_offset(raw):
+    """Non-negative integer offset (for ranked results that can't use keysets)."""
+    try:
+        return max(0, int(raw)) if raw is not None else 0
+    except (TypeError, ValueError):
+        raise ValueError("offset must be an integer")
+
+
+def parse_time(raw, name="time"):
+    """Parse an ISO-8601 query param into a naive UTC datetime (Mongo style)."""
+    if not raw:
+        return None
+    try:
+        value = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO-8601 datetime")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def time_filter(since=None, until=None):
+    """{"created_at": {$gte, $lt}} for an optional [since, until) range ({} if open)."""
+    if not (since or until):
+        return {}
+    return {"created_at": {**({"$gte": since} if since else {}), **({"$lt": until} if until else {})}}
+
+
+def keyset_query(since=None, until=None):
+    """
+    time_filter() for keyset-paged lists. Open ranges still require
+    created_at: documents without it cannot be ordered or carry a cursor.
+    """
+    return time_filter(since, until) or {"created_at": {"$exists": True}}
+
+
+def encode_cursor(doc):
+    """Build an opaque cursor token from the last document of a page."""
+    payload = {
+        "t": doc["created_at"].isoformat(),
+        "id": str(doc["_id"])
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Decode a cursor token into a (created_at, ObjectId) pair."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def keyset_filter(query, token):
+    """Extend a Mongo query so it only matches documents after the cursor."""
+    if not token:
+        return query
+    created_at, last_id = decode_cursor(token)
+    after = {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": last_id}}
+    ]}
+    return {"$and": [query, after]} if query else after
+
+
+def page_cursor(collection, query, projection=None, token=None, limit=DEFAULT_PAGE_SIZE):
+    """Cursor for one keyset page (one extra row tells whether more exist)."""
+    return (
+        collection.find(keyset_filter(query, token), projection)
+        .sort(KEYSET_SORT)
+        .limit(limit + 1)
+    )
+
+
+def finish_page(docs, limit):
+    """Trim the look-ahead row -> (documents, next_cursor or None)."""
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1])
+    return docs, next_cursor
+
+
+def fetch_page(collection, query, projection=None, token=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    Run one keyset page against a collection.
+    Returns (documents, next_cursor) where next_cursor is None on the last page.
+    """
+    return finish_page(list(page_cursor(collection, query, projection, token, limit)), limit)
+
+
+async def afetch_page(collection, query, projection=None, token=None, limit=DEFAULT_PAGE_SIZE):
+    """fetch_page for an asyncio (motor) collection."""
+    cursor = page_cursor(collection, query, projection, token, limit)
+    return finish_page(await cursor.to_list(length=limit + 1), limit)
+
+
+# ----------------------------------------------------------
+# Version markers: cheap change detection for list ETags
+# ----------------------------------------------------------
+VERSION_FIELDS = ("created_at",)
+
+
+def _version_probe(query, field):
+    return query, {field: 1}, [(field, -1), ("_id", -1)]
+
+
+def _version_entry(doc, field):
+    return [doc.get(field), doc["_id"]] if doc else None
+
+
+def list_version(collection, query, fields=VERSION_FIELDS):
+    """
+    Change marker for a list query without reading the list: the match
+    count plus, per field, the newest (value, _id). For created_at that is
+    a single probe of the (created_at, _id) keyset index.
+    """
+    marker = [collection.count_documents(query) if query else collection.estimated_document_count()]
+    for field in fields:
+        filter_, projection, sort = _version_probe(query, field)
+        marker.append(_version_entry(collection.find_one(filter_, projection, sort=sort), field))
+    return marker
+
+
+async def alist_version(collection, query, fields=VERSION_FIELDS):
+    """list_version for an asyncio (motor) collection."""
+    marker = [await collection.count_documents(query) if query else await collection.estimated_document_count()]
+    for field in fields:
+        filter_, projection, sort = _version_probe(query, field)
+        marker.append(_version_entry(await collection.find_one(filter_, projection, sort=sort), field))
+    return marker
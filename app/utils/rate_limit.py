@@ -0,0 +1,242 @@
+# ==========================================================
+# 💬 CONFESSLY — TOKEN-BUCKET RATE LIMITING
+# File: app/utils/rate_limit.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import jsonify, request
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import PyMongoError
+from app.config import Config
+from app.db import get_db, register_indexes
+from app.utils.responses import plain_error
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate):
+    """'10/minute' -> (capacity=10, refill_per_second=10/60)."""
+    count, _, period = rate.partition("/")
+    seconds = _PERIODS.get(period.strip().rstrip("s"))
+    if not seconds or not count.strip().isdigit():
+        raise ValueError(f"Invalid rate '{rate}', expected e.g. '10/minute'")
+    capacity = int(count)
+    return capacity, capacity / seconds
+
+
+# ==========================================================
+# Backends: take(key, capacity, rate, cost) -> (allowed, tokens_left),
+#           peek(key, capacity, rate) -> tokens available (nothing charged)
+# ==========================================================
+class MemoryBackend:
+    """Per-process buckets (exact for a single worker)."""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> [tokens, last_ts], least recently used first
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, cost=1):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                while len(self._buckets) >= self.max_keys:
+                    # Least recently used bucket: O(1), and the likeliest to be full again
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [capacity, now]
+            else:
+                self._buckets.move_to_end(key)
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            bucket[0], bucket[1] = tokens, now
+            return allowed, tokens
+
+    def peek(self, key, capacity, rate):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return capacity
+            return min(capacity, bucket[0] + (now - bucket[1]) * rate)
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class MongoBackend:
+    """
+    Buckets shared by all gunicorn workers: one document per key, refilled
+    and decremented atomically in a single pipeline update. Idle buckets
+    expire through a TTL index on `expires_at`.
+    """
+
+    def __init__(self, collection="rate_limits"):
+        self.collection = collection
+
+    def take(self, key, capacity, rate, cost=1):
+        now = time.time()
+        refill_seconds = capacity / rate if rate else 3600
+        doc = get_db()[self.collection].find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": {"$min": [capacity, {"$add": [
+                    {"$ifNull": ["$tokens", capacity]},
+                    {"$multiply": [{"$subtract": [now, {"$ifNull": ["$ts", now]}]}, rate]}
+                ]}]}}},
+                {"$set": {
+                    "allowed": {"$gte": ["$tokens", cost]},
+                    "ts": now,
+                    "expires_at": datetime.utcnow() + timedelta(seconds=refill_seconds)
+                }},
+                {"$set": {"tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", cost]}, "$tokens"]}}}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return doc["allowed"], doc["tokens"]
+
+    def peek(self, key, capacity, rate):
+        doc = get_db()[self.collection].find_one({"_id": key}, {"tokens": 1, "ts": 1})
+        if doc is None:
+            return capacity
+        return min(capacity, doc["tokens"] + (time.time() - doc["ts"]) * rate)
+
+
+register_indexes(
+    "rate_limits",
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+)
+
+
+# ==========================================================
+# Limiter + per-route decorator
+# ==========================================================
+def client_ip(req=None):
+    """
+    Socket address, or with RATE_LIMIT_TRUST_PROXY=N the X-Forwarded-For entry
+    N hops from the right (the one our outermost proxy saw). Entries further
+    left are client-supplied and could be rotated to dodge the limit.
+    """
+    req = req or request
+    hops = Config.RATE_LIMIT_TRUST_PROXY
+    if hops:
+        forwarded = [part.strip() for part in req.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return req.remote_addr or "unknown"
+
+
+def client_session(req=None):
+    req = req or request
+    return req.headers.get("X-Session-ID") or req.args.get("session_id")
+
+
+class RateLimiter:
+    """Applies token buckets to routes; falls open if the shared backend fails."""
+
+    def __init__(self, backend=None, enabled=True):
+        self.backend = backend or MemoryBackend()
+        self.enabled = enabled
+        self.metrics = {"allowed": 0, "limited": 0, "backend_errors": 0}
+
+    def hit(self, key, capacity, rate, cost=1):
+        if not self.enabled:
+            return True, capacity
+        try:
+            allowed, tokens = self.backend.take(key, capacity, rate, cost)
+        except PyMongoError as e:
+            self.metrics["backend_errors"] += 1
+            print(f"⚠️ Rate limit backend error, allowing request: {e}")
+            return True, capacity
+        self.metrics["allowed" if allowed else "limited"] += 1
+        return allowed, tokens
+
+    def peek(self, key, capacity, rate):
+        try:
+            return self.backend.peek(key, capacity, rate)
+        except PyMongoError as e:
+            self.metrics["backend_errors"] += 1
+            print(f"⚠️ Rate limit backend error, allowing request: {e}")
+            return capacity
+
+    def retry_after(self, name, capacity, rate, scopes, req=None):
+        """Seconds to wait if any of the request's buckets is empty, else None."""
+        keys = []
+        for scope in scopes:
+            ident = client_ip(req) if scope == "ip" else client_session(req)
+            if ident:  # no session header: the ip bucket still applies
+                keys.append(f"{name}:{scope}:{ident}")
+
+        if self.enabled and len(keys) > 1:
+            # Check every bucket before charging any, so a session that is out of
+            # tokens does not also drain the ip bucket it shares behind a NAT
+            for key in keys:
+                tokens = self.peek(key, capacity, rate)
+                if tokens < 1:
+                    self.metrics["limited"] += 1
+                    return max(1, math.ceil((1 - tokens) / rate))
+        for key in keys:
+            allowed, tokens = self.hit(key, capacity, rate)
+            if not allowed:  # only when a concurrent request emptied it since the peek
+                return max(1, math.ceil((1 - tokens) / rate))
+        return None
+
+    def limit(self, name, default_rate, per="ip"):
+        """
+        Decorator: `per` is "ip", "session" or "ip+session" (one bucket each).
+        The rate can be overridden with env RATE_LIMIT_<NAME>, e.g. RATE_LIMIT_LOGIN=5/minute.
+        """
+        capacity, rate = parse_rate(Config.rate_limit(name, default_rate))
+        scopes = per.split("+")
+
+        def decorator(f):
+            @wraps(f)
+            def decorated(*args, **kwargs):
+                wait = self.retry_after(name, capacity, rate, scopes)
+                if wait is not None:
+                    response = jsonify({"error": "Too many requests, slow down"})
+                    response.headers["Retry-After"] = str(wait)
+                    return response, 429
+                return f(*args, **kwargs)
+            return decorated
+        return decorator
+
+    def async_limit(self, name, default_rate, per="ip"):
+        """limit() for ASGI-mode handlers: same buckets, shared backend calls run off the loop."""
+        import asyncio
+        capacity, rate = parse_rate(Config.rate_limit(name, default_rate))
+        scopes = per.split("+")
+
+        def decorator(f):
+            @wraps(f)
+            async def decorated(req, *args, **kwargs):
+                if isinstance(self.backend, MemoryBackend):
+                    wait = self.retry_after(name, capacity, rate, scopes, req)
+                else:
+                    wait = await asyncio.to_thread(self.retry_after, name, capacity, rate, scopes, req)
+                if wait is not None:
+                    response = plain_error("Too many requests, slow down", 429)
+                    response.headers["Retry-After"] = str(wait)
+                    return response
+                return await f(req, *args, **kwargs)
+            return decorated
+        return decorator
+
+    def stats(self):
+        return dict(self.metrics)
+
+
+limiter = RateLimiter(
+    MongoBackend() if Config.RATE_LIMIT_BACKEND == "mongo" else MemoryBackend(),
+    enabled=Config.RATE_LIMIT_ENABLED
+)
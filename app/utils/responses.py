@@ -0,0 +1,105 @@
+# ==========================================================
+# 💬 CONFESSLY — SHARED RESPONSE HELPERS
+# File: app/utils/responses.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import hashlib
+from flask import jsonify, make_response, request
+from werkzeug.wrappers import Response
+from app.utils.json_provider import dumps_bytes
+from app.utils.metrics import timed
+
+
+def _envelope(message, data, extra):
+    body = {"message": message}
+    if data:
+        body["data"] = data
+    body.update(extra)
+    return body
+
+
+def success(message, data=None, code=200, **extra):
+    """Unified JSON success response."""
+    body = _envelope(message, data, extra)
+    with timed("json"):
+        response = jsonify(body)
+    return response, code
+
+
+def error(message, code=400):
+    """Unified JSON error response."""
+    return jsonify({"error": message}), code
+
+
+# ----------------------------------------------------------
+# Same envelopes outside a Flask app context (ASGI-mode handlers)
+# ----------------------------------------------------------
+def plain_success(message, data=None, code=200, **extra):
+    return Response(dumps_bytes(_envelope(message, data, extra)), status=code, mimetype="application/json")
+
+
+def plain_error(message, code=400):
+    return Response(dumps_bytes({"error": message}), status=code, mimetype="application/json")
+
+
+def compute_etag(data):
+    """Weak validator for a JSON-able payload."""
+    return hashlib.md5(dumps_bytes(data, sort_keys=True)).hexdigest()
+
+
+def conditional_success(message, data, etag):
+    """Success response with ETag; answers 304 when the client copy is current."""
+    if request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+    else:
+        response = make_response(success(message, data))
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def version_etag(marker, *extra):
+    """Weak validator from a list_version() marker plus request params (not the body)."""
+    return hashlib.md5(dumps_bytes([marker, *extra])).hexdigest()
+
+
+def versioned(etag, render):
+    """
+    304 without calling `render` when the client already holds `etag`;
+    otherwise tag render()'s 200 response. The version is read before the
+    data, so a concurrent write can only make the tag stale (one extra 200).
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+    else:
+        response = make_response(render())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def plain_conditional_success(req, message, data, etag):
+    """conditional_success for ASGI-mode handlers."""
+    if req.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = plain_success(message, data)
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+async def plain_versioned(req, etag, render):
+    """versioned for ASGI-mode handlers (`render` is a coroutine function)."""
+    if req.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = await render()
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
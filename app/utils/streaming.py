@@ -0,0 +1,114 @@
+# ==========================================================
+# 💬 CONFESSLY — STREAMING RESPONSE HELPERS
+# File: app/utils/streaming.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import csv
+import io
+import itertools
+import re
+from flask import Response, stream_with_context
+from app.utils.json_provider import dumps_bytes
+
+STREAM_BATCH_SIZE = 500
+STREAM_CHUNK_BYTES = 64 * 1024  # flush to the client once this much is buffered
+
+# Leading characters spreadsheet apps treat as formulas (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+MAX_EXPORT_FIELDS = 50
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z0-9_]+)*$")
+
+
+def parse_fields(raw):
+    """?fields=a,b.c -> ["a", "b.c"] (None when absent). Rejects operators and paths with `$`."""
+    if not raw:
+        return None
+    fields = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    if not fields or len(fields) > MAX_EXPORT_FIELDS:
+        raise ValueError(f"fields must list 1 to {MAX_EXPORT_FIELDS} field names")
+    bad = [f for f in fields if not _FIELD_NAME.match(f)]
+    if bad:
+        raise ValueError(f"Invalid field name: {bad[0]}")
+    return fields
+
+
+def fields_projection(fields):
+    """Inclusion projection for parse_fields() output; _id only when asked for."""
+    if not fields:
+        return None
+    return {"_id": 0, **{f: 1 for f in fields}}
+
+
+def _chunked(cursor, encode, head=()):
+    """Encode documents (`head` first, then the cursor), yielding ~STREAM_CHUNK_BYTES chunks."""
+    buffer, size = [], 0
+    try:
+        for doc in itertools.chain(head, cursor):
+            data = encode(doc)
+            buffer.append(data)
+            size += len(data)
+            if size >= STREAM_CHUNK_BYTES:
+                yield b"".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b"".join(buffer)
+    finally:
+        cursor.close()
+
+
+def ndjson_response(cursor, batch_size=STREAM_BATCH_SIZE):
+    """
+    Stream a pymongo cursor as newline-delimited JSON.
+    Documents are written as the cursor yields them, so memory stays flat.
+    """
+    cursor = cursor.batch_size(batch_size)
+    generate = _chunked(cursor, lambda doc: dumps_bytes(doc) + b"\n")
+    return Response(stream_with_context(generate), mimetype="application/x-ndjson")
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return "'" + value if value.startswith(_FORMULA_PREFIXES) else value
+    if isinstance(value, (dict, list)):
+        return dumps_bytes(value).decode()
+    return dumps_bytes(value).decode().strip('"')  # ObjectId, datetime, numbers
+
+
+def _lookup(doc, column):
+    for part in column.split("."):
+        doc = doc.get(part) if isinstance(doc, dict) else None
+    return doc
+
+
+def csv_response(cursor, columns, filename, batch_size=STREAM_BATCH_SIZE):
+    """
+    Stream a pymongo cursor as CSV. The header row is `columns` (dotted
+    paths allowed) or, when None, the first document's fields. Missing
+    fields are blank; nested values are JSON-encoded.
+    """
+    cursor = cursor.batch_size(batch_size)
+    out = io.StringIO()
+    writer = csv.writer(out)
+
+    def encode(row):
+        out.seek(0)
+        out.truncate()
+        writer.writerow(row)
+        return out.getvalue().encode()
+
+    def generate():
+        header, head = columns, ()
+        if header is None:
+            first = next(cursor, None)
+            header = list(first) if first is not None else []
+            head = (first,) if first is not None else ()
+        yield encode(header)
+        yield from _chunked(cursor, lambda doc: encode([_csv_cell(_lookup(doc, c)) for c in header]), head)
+
+    response = Response(stream_with_context(generate()), mimetype="text/csv")
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,291 @@
+# ==========================================================
+# 💬 CONFESSLY — WRITE-BEHIND UPDATE BUFFER
+# File: app/utils/write_behind.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import atexit
+import os
+import threading
+import time
+from datetime import datetime
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from app.config import Config
+from app.db import get_db, register_indexes
+
+DEAD_LETTER_COLLECTION = "write_behind_dead_letters"
+
+
+class WriteBehindBuffer:
+    """
+    Coalesces high-frequency update_one calls and flushes them as bulk_write.
+
+    Updates are keyed by (collection, filter): $inc amounts are summed,
+    $set is last-write-wins, $max keeps the largest value and $addToSet
+    values are unioned. A flush happens when `max_batch` keys are pending
+    or every `flush_interval` seconds. When `max_pending` keys are queued
+    the caller flushes synchronously (backpressure) before adding more.
+
+    Ops that fail to write are merged back into the buffer and retried on
+    the next flush; after `max_retries` failed flushes they are copied to
+    `write_behind_dead_letters` instead of being dropped silently.
+    """
+
+    def __init__(self, max_batch=500, flush_interval=1.0, max_pending=5000,
+                 max_retries=3, enabled=True):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.enabled = enabled
+
+        self._pending = {}  # (collection, filter items) -> op dict
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+        self.metrics = {
+            "events": 0,
+            "flushes": 0,
+            "ops_written": 0,
+            "flush_errors": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+            "backpressure_waits": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0
+        }
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+    def update(self, collection, filter_doc, inc=None, set_fields=None,
+               max_fields=None, add_to_set=None, upsert=False):
+        """Queue an update; falls back to a direct update_one when disabled."""
+        if not self.enabled or self._closed:
+            self._write_now(collection, filter_doc, inc, set_fields, max_fields, add_to_set, upsert)
+            return
+
+        self._ensure_worker()
+        key = (collection, tuple(sorted(filter_doc.items())))
+
+        with self._lock:
+            full = len(self._pending) >= self.max_pending and key not in self._pending
+        if full:
+            self.metrics["backpressure_waits"] += 1
+            self.flush()
+
+        new = {
+            "filter": dict(filter_doc), "inc": dict(inc or {}), "set": dict(set_fields or {}),
+            "max": dict(max_fields or {}),
+            "add_to_set": {field: {value} for field, value in (add_to_set or {}).items()},
+            "upsert": upsert, "attempts": 0
+        }
+        with self._lock:
+            op = self._pending.get(key)
+            self._pending[key] = new if op is None else self._combine(op, new)
+            self.metrics["events"] += 1
+            pending = len(self._pending)
+
+        if pending >= self.max_batch:
+            self._wakeup.set()
+
+    def flush(self):
+        """Write every pending update now. Returns the number of ops written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            by_collection = {}
+            for key, op in batch.items():
+                by_collection.setdefault(key[0], []).append(key)
+
+            written = 0
+            failed = []  # (key, op, error)
+            db = get_db()
+            for collection, keys in by_collection.items():
+                requests = [
+                    UpdateOne(batch[key]["filter"], self._update_doc(batch[key]), upsert=batch[key]["upsert"])
+                    for key in keys
+                ]
+                try:
+                    db[collection].bulk_write(requests, ordered=False)
+                    written += len(requests)
+                except BulkWriteError as e:
+                    # Unordered: everything outside writeErrors was applied.
+                    # nMatched, not nModified: a $max that changes nothing still succeeded.
+                    self.metrics["flush_errors"] += 1
+                    written += e.details.get("nMatched", 0) + e.details.get("nUpserted", 0)
+                    for write_error in e.details.get("writeErrors", []):
+                        key = keys[write_error["index"]]
+                        failed.append((key, batch[key], write_error.get("errmsg")))
+                    print(f"⚠️ Write-behind flush to '{collection}': "
+                          f"{len(e.details.get('writeErrors', []))} of {len(requests)} ops failed")
+                except PyMongoError as e:
+                    self.metrics["flush_errors"] += 1
+                    failed.extend((key, batch[key], str(e)) for key in keys)
+                    print(f"⚠️ Write-behind flush to '{collection}' failed: {e}")
+            if failed:
+                self._requeue(failed)
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            m = self.metrics
+            m["flushes"] += 1
+            m["ops_written"] += written
+            m["last_batch_size"] = len(batch)
+            m["max_batch_size"] = max(m["max_batch_size"], len(batch))
+            m["last_flush_ms"] = round(elapsed_ms, 3)
+            m["max_flush_ms"] = max(m["max_flush_ms"], round(elapsed_ms, 3))
+            m["total_flush_ms"] += elapsed_ms
+            return written
+
+    def close(self):
+        """Stop the flusher thread and drain the buffer (worker shutdown)."""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+            self._thread.join(timeout=5)
+        if get_db() is not None:
+            # Failed ops are re-queued; each pass either writes or dead-letters them
+            for _ in range(self.max_retries + 1):
+                self.flush()
+                if not self._pending:
+                    break
+
+    def stats(self):
+        """Snapshot of buffer metrics (batch sizes, flush latency)."""
+        m = dict(self.metrics)
+        m["pending"] = len(self._pending)
+        m["avg_batch_size"] = round(m["ops_written"] / m["flushes"], 2) if m["flushes"] else 0
+        m["avg_flush_ms"] = round(m["total_flush_ms"] / m["flushes"], 3) if m["flushes"] else 0
+        m["total_flush_ms"] = round(m["total_flush_ms"], 3)
+        return m
+
+    # ------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------
+    @staticmethod
+    def _combine(op, newer):
+        """Fold `newer` into `op`: $inc sums, $set takes newer, $max keeps the max, $addToSet unions."""
+        for field, amount in newer["inc"].items():
+            op["inc"][field] = op["inc"].get(field, 0) + amount
+        op["set"].update(newer["set"])
+        for field, value in newer["max"].items():
+            current = op["max"].get(field)
+            op["max"][field] = value if current is None else max(current, value)
+        for field, values in newer["add_to_set"].items():
+            op["add_to_set"].setdefault(field, set()).update(values)
+        op["upsert"] = op["upsert"] or newer["upsert"]
+        op["attempts"] = max(op["attempts"], newer["attempts"])
+        return op
+
+    def _requeue(self, failed):
+        """Merge failed ops back under anything queued since, or dead-letter them."""
+        dead = []
+        with self._lock:
+            for key, op, error in failed:
+                op["attempts"] += 1
+                if op["attempts"] > self.max_retries:
+                    dead.append((key[0], op, error))
+                    continue
+                newer = self._pending.get(key)
+                self._pending[key] = op if newer is None else self._combine(op, newer)
+                self.metrics["retried"] += 1
+        if dead:
+            self._dead_letter(dead)
+
+    def _dead_letter(self, dead):
+        now = datetime.utcnow()
+        docs = [{
+            "collection": collection, "filter": op["filter"], "inc": op["inc"], "set": op["set"],
+            "max": op["max"], "add_to_set": {f: list(v) for f, v in op["add_to_set"].items()},
+            "upsert": op["upsert"], "attempts": op["attempts"], "error": error, "created_at": now
+        } for collection, op, error in dead]
+        self.metrics["dead_lettered"] += len(docs)
+        try:
+            get_db()[DEAD_LETTER_COLLECTION].insert_many(docs, ordered=False)
+        except PyMongoError as e:
+            print(f"⚠️ Write-behind dead-lettering failed, {len(docs)} ops lost: {e}")
+
+    @staticmethod
+    def _update_doc(op):
+        update = {}
+        if op["inc"]:
+            update["$inc"] = op["inc"]
+        if op["set"]:
+            update["$set"] = op["set"]
+        if op["max"]:
+            update["$max"] = op["max"]
+        if op["add_to_set"]:
+            update["$addToSet"] = {
+                field: {"$each": list(values)} for field, values in op["add_to_set"].items()
+            }
+        return update
+
+    @staticmethod
+    def _write_now(collection, filter_doc, inc, set_fields, max_fields, add_to_set, upsert):
+        update = {}
+        if inc:
+            update["$inc"] = inc
+        if set_fields:
+            update["$set"] = set_fields
+        if max_fields:
+            update["$max"] = max_fields
+        if add_to_set:
+            update["$addToSet"] = add_to_set
+        get_db()[collection].update_one(filter_doc, update, upsert=upsert)
+
+    def _ensure_worker(self):
+        """Start the flusher lazily, once per process (safe across gunicorn fork)."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Forked child: the parent's queue belongs to the parent
+                self._pending = {}
+                self._flush_lock = threading.Lock()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="confessly-write-behind", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ Write-behind flusher error: {e}")
+
+
+register_indexes(
+    DEAD_LETTER_COLLECTION,
+    IndexModel([("created_at", ASCENDING)], name="created_at_1", expireAfterSeconds=30 * 86400),
+)
+
+
+write_buffer = WriteBehindBuffer(
+    max_batch=Config.WRITE_BEHIND_MAX_BATCH,
+    flush_interval=Config.WRITE_BEHIND_FLUSH_INTERVAL,
+    max_pending=Config.WRITE_BEHIND_MAX_PENDING,
+    max_retries=Config.WRITE_BEHIND_MAX_RETRIES,
+    enabled=Config.WRITE_BEHIND_ENABLED
+)
+
+# Drain pending writes when the worker process exits
+atexit.register(write_buffer.close)
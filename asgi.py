@@ -0,0 +1,4 @@
+from app.asgi import create_asgi_app
+
+# Initialize ASGI app (async admin reads; all other routes via Flask)
+app = create_asgi_app()
@@ -0,0 +1,142 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: SYNC vs ASGI SERVING MODE
+# File: benchmarks/bench_async.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Starts the app twice with ONE worker each and drives the same admin reads
+at a fixed client concurrency, reporting requests/sec per worker:
+
+  sync   gunicorn -w 1 --threads N run:app        (pymongo, thread per request)
+  asgi   uvicorn --workers 1 asgi:app             (motor, coroutine per request)
+
+Needs a disposable mongod in MONGO_URI (the `confessly` database is seeded
+with --seed confessions) and `pip install -r benchmarks/requirements.txt`.
+
+    python -m benchmarks.bench_async --concurrency 64 --duration 15 --threads 8
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+import httpx
+import jwt
+from pymongo import MongoClient
+from app.config import Config
+
+ROUTES = [
+    "/api/admin/search?limit=50",
+    "/api/admin/search?mood=sad&limit=20",
+    "/api/admin/feedback",
+    "/api/admin/all",
+    "/api/admin/profile",
+]
+
+
+def seed(count):
+    database = MongoClient(os.environ["MONGO_URI"]).get_database("confessly")
+    rng = random.Random(3)
+    now = datetime.utcnow()
+    database.confessions.delete_many({"bench": True})
+    database.confessions.insert_many([{
+        "text": f"bench confession {i}", "mood": rng.choice(["happy", "neutral", "sad"]),
+        "status": "active", "reactions": {}, "created_at": now - timedelta(seconds=i), "bench": True
+    } for i in range(count)])
+    database.admins.update_one(
+        {"username": "bench_admin"},
+        {"$setOnInsert": {"email": "bench@example.com", "password_hash": "!", "role": "superadmin",
+                          "status": "active", "created_at": now, "last_login": None}},
+        upsert=True
+    )
+
+
+def start(mode, port, threads):
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "false", "MOOD_ANALYSIS_ENABLED": "false",
+           "TRENDING_ENABLED": "false", "ASGI_SYNC_THREADS": str(threads)}
+    if mode == "sync":
+        cmd = [sys.executable, "-m", "gunicorn", "-w", "1", "--threads", str(threads),
+               "-b", f"127.0.0.1:{port}", "run:app"]
+    else:
+        cmd = [sys.executable, "-m", "uvicorn", "--workers", "1", "--no-access-log",
+               "--port", str(port), "asgi:app"]
+    process = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start on port {port}")
+
+
+async def load(base_url, token, concurrency, duration):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    headers = {"Authorization": f"Bearer {token}"}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as client:
+        async def user(i):
+            nonlocal errors
+            rng = random.Random(i)
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(rng.choice(ROUTES))
+                latencies.append(time.perf_counter() - started)
+                errors += response.status_code >= 400
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64, help="concurrent clients")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per mode")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads / ASGI sync pool")
+    parser.add_argument("--seed", type=int, default=5000, help="confessions to insert (0 = skip)")
+    parser.add_argument("--modes", default="sync,asgi")
+    args = parser.parse_args(argv)
+
+    if not os.getenv("MONGO_URI"):
+        parser.error("MONGO_URI must point at a disposable mongod")
+    if args.seed:
+        seed(args.seed)
+
+    token = jwt.encode(
+        {"username": "bench_admin", "role": "superadmin", "exp": datetime.utcnow() + timedelta(hours=1)},
+        Config.JWT_SECRET, algorithm=Config.JWT_ALGORITHM
+    )
+
+    print(f"{'mode':<6} {'req/s/worker':>13} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for port, mode in enumerate(args.modes.split(","), start=8101):
+        process = start(mode, port, args.threads)
+        try:
+            asyncio.run(load(f"http://127.0.0.1:{port}", token, args.concurrency, 2))  # warm-up
+            row = asyncio.run(load(f"http://127.0.0.1:{port}", token, args.concurrency, args.duration))
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=10)
+        print(f"{mode:<6} {row['rps']:>13.1f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: LIVE STREAM FAN-OUT
+# File: benchmarks/bench_live.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Fan-out latency of the live hub (app/services/live.py) with N asyncio
+subscribers on one event loop, the way an ASGI worker holds SSE clients.
+Each round publishes a burst of reactions, flushes one tick and records,
+per subscriber, the time from flush to the frame being picked up by its
+coroutine. No database is needed.
+
+    python -m benchmarks.bench_live                       # 1k and 10k subscribers
+    python -m benchmarks.bench_live --subscribers 500,5000 --rounds 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("MONGO_URI", "mongodb://127.0.0.1:1")
+
+from bson import ObjectId  # noqa: E402
+from app.services.live import LiveHub  # noqa: E402
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+async def run(count, rounds, burst, confessions, filtered):
+    # Huge tick: the background ticker never fires, rounds flush explicitly
+    hub = LiveHub(tick=3600, queue_size=64, max_subscribers=count)
+    loop = asyncio.get_running_loop()
+    ids = [str(ObjectId()) for _ in range(confessions)]
+    received = []
+    flushed_at = [0.0]
+
+    async def client(subscriber, rounds_left):
+        while rounds_left:
+            chunk = await subscriber.next_chunk(60)
+            if chunk:
+                received.append(time.perf_counter() - flushed_at[0])
+                rounds_left -= 1
+        hub.unsubscribe(subscriber)
+
+    tasks = []
+    for i in range(count):
+        # --filtered: every client watches one confession (a detail page)
+        subscriber = hub.subscribe({ids[i % confessions]} if filtered else None, loop=loop)
+        tasks.append(asyncio.ensure_future(client(subscriber, rounds)))
+    await asyncio.sleep(0)
+
+    fanout_ms, round_ms = [], []
+    for _ in range(rounds):
+        for n in range(burst):
+            hub.on_reaction(ids[n % confessions], "heart")
+        received.clear()
+        flushed_at[0] = time.perf_counter()
+        await loop.run_in_executor(None, hub.flush)  # the ticker thread in production
+        fanout_ms.append(hub.metrics["last_fanout_ms"])
+        while len(received) < count:
+            await asyncio.sleep(0)
+        round_ms.append([s * 1000 for s in received])
+    await asyncio.gather(*tasks)
+
+    latencies = [s for samples in round_ms for s in samples]
+    return {
+        "fanout_ms": statistics.median(fanout_ms),
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "max": max(latencies),
+        "last_p50": statistics.median(max(samples) for samples in round_ms),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", default="1000,10000")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--burst", type=int, default=200, help="reactions published per tick")
+    parser.add_argument("--confessions", type=int, default=50, help="distinct confessions in a burst")
+    parser.add_argument("--filtered", action="store_true", help="each client follows one confession")
+    args = parser.parse_args(argv)
+
+    print(f"rounds={args.rounds} burst={args.burst} confessions={args.confessions} filtered={args.filtered}")
+    print(f"{'subscribers':>11} {'fan-out ms':>11} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'last client p50':>16}")
+    for count in (int(n) for n in args.subscribers.split(",")):
+        r = asyncio.run(run(count, args.rounds, args.burst, args.confessions, args.filtered))
+        print(f"{count:>11} {r['fanout_ms']:>11.2f} {r['p50']:>8.2f} {r['p99']:>8.2f} "
+              f"{r['max']:>8.2f} {r['last_p50']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
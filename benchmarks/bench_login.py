@@ -0,0 +1,85 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: LOGIN THROUGHPUT UNDER CONCURRENCY
+# File: benchmarks/bench_login.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Measures password verification throughput through the bounded hashing
+pool (app.utils.hashing) for each hasher, at several client concurrency
+levels. Rejections are jobs refused with HashingBusy (HTTP 429 in the API).
+No database needed:
+
+    python -m benchmarks.bench_login --concurrency 1 4 16 64 --attempts 64
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from app.utils.hashing import (
+    BcryptHasher, HashingBusy, HashingPool, PasswordHasher, WerkzeugHasher
+)
+
+
+def _run(pool, password_hash, concurrency, attempts):
+    latencies = []
+    rejected = 0
+    lock = threading.Lock()
+    per_client = max(1, attempts // concurrency)
+
+    def client():
+        nonlocal rejected
+        for _ in range(per_client):
+            started = time.perf_counter()
+            try:
+                pool.verify(password_hash, "correct horse")
+            except HashingBusy:
+                with lock:
+                    rejected += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    return {
+        "ok": len(latencies),
+        "rejected": rejected,
+        "logins_per_sec": len(latencies) / elapsed if elapsed else 0,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "p95_ms": p95 * 1000
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--attempts", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=16)
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    for hasher in (BcryptHasher(rounds=args.bcrypt_rounds), WerkzeugHasher()):
+        facade = PasswordHasher(hasher.name, [hasher])
+        password_hash = facade.hash("correct horse")
+        print(f"\n{hasher.name} (pool workers={args.workers}, max_queue={args.max_queue})")
+        print(f"{'clients':>8} {'ok':>6} {'429':>6} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+        for concurrency in args.concurrency:
+            pool = HashingPool(facade, workers=args.workers, max_queue=args.max_queue, timeout=60)
+            r = _run(pool, password_hash, concurrency, args.attempts)
+            pool.shutdown()
+            print(f"{concurrency:>8} {r['ok']:>6} {r['rejected']:>6} {r['logins_per_sec']:>10.1f} "
+                  f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: MOOD SCORING THROUGHPUT
+# File: benchmarks/bench_mood.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Reports confessions/sec scored by MoodPipeline.score() for several batch
+sizes, with unique texts (cold cache) and with repeated texts (warm cache).
+No database needed:
+
+    python -m benchmarks.bench_mood --count 2048 --batch-sizes 1 32 256 --workers 2
+"""
+
+import argparse
+import random
+import time
+from app.services.mood import MoodPipeline, _textblob
+
+WORDS = ("love hate happy sad tired angry calm lonely grateful scared proud sorry "
+         "friend family work school night today never always really").split()
+
+
+def make_texts(n, seed=7):
+    rng = random.Random(seed)
+    return [f"confession {i}: " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+            for i in range(n)]
+
+
+def _throughput(pipeline, texts, batch_size):
+    started = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        pipeline.score(texts[i:i + batch_size])
+    return len(texts) / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2048)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32, 256])
+    parser.add_argument("--workers", type=int, default=1, help="scoring processes (0 = in-thread)")
+    args = parser.parse_args(argv)
+
+    _textblob()  # exclude the one-off import from the numbers
+    texts = make_texts(args.count)
+
+    print(f"workers={args.workers}, confessions={args.count}")
+    print(f"{'batch':>6} {'cold conf/s':>12} {'warm conf/s':>12}")
+    for batch_size in args.batch_sizes:
+        pipeline = MoodPipeline(batch_size=batch_size, workers=args.workers, enabled=False)
+        if args.workers:
+            pipeline.score(["warm up the worker pool"])
+        cold = _throughput(pipeline, texts, batch_size)
+        warm = _throughput(pipeline, texts, batch_size)
+        if pipeline._executor is not None:
+            pipeline._executor.shutdown()
+        print(f"{batch_size:>6} {cold:>12.0f} {warm:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: RATE LIMIT DECISION OVERHEAD
+# File: benchmarks/bench_rate_limit.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Measures the per-request cost of a rate-limit decision:
+
+  backend   — MemoryBackend.take() over many distinct client keys
+  decorator — a view wrapped by limiter.limit(per="ip+session"), called
+              inside a Flask request context (header parsing included)
+  mongo     — MongoBackend.take() round trip (only with --mongo; needs a
+              disposable mongod in MONGO_URI)
+
+    python -m benchmarks.bench_rate_limit --calls 200000 --keys 10000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+from flask import Flask
+from app.utils.rate_limit import MemoryBackend, MongoBackend, RateLimiter, parse_rate
+
+
+def _summary(samples):
+    samples.sort()
+    return (statistics.median(samples), samples[int(len(samples) * 0.99) - 1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--mongo", action="store_true")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    capacity, rate = parse_rate("120/minute")
+    keys = [f"feed:ip:10.0.{i // 256}.{i % 256}" for i in range(args.keys)]
+
+    backend = MemoryBackend()
+    samples = []
+    for _ in range(args.calls):
+        key = rng.choice(keys)
+        t0 = time.perf_counter()
+        backend.take(key, capacity, rate)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    p50, p99 = _summary(samples)
+    print(f"backend   (memory): p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+    app = Flask("bench")
+    limiter = RateLimiter(MemoryBackend())
+    view = limiter.limit("feed", "120/minute", per="ip+session")(lambda: "ok")
+    samples = []
+    calls = min(args.calls, 50000)
+    for i in range(calls):
+        ip = f"10.1.{i % 200}.{rng.randint(0, 255)}"
+        with app.test_request_context("/", environ_base={"REMOTE_ADDR": ip},
+                                      headers={"X-Session-ID": f"s{i % 5000}"}):
+            t0 = time.perf_counter()
+            view()
+            samples.append((time.perf_counter() - t0) * 1e6)
+    p50, p99 = _summary(samples)
+    print(f"decorator (memory): p50 {p50:6.2f} µs  p99 {p99:6.2f} µs  (2 buckets per request)")
+
+    if args.mongo:
+        import app.db as db_module
+        from pymongo import MongoClient
+        db_module.db = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017")).confessly_bench
+        db_module._client_pid = os.getpid()
+        mongo = MongoBackend(collection="rate_limits_bench")
+        samples = []
+        for _ in range(min(args.calls, 5000)):
+            t0 = time.perf_counter()
+            mongo.take(rng.choice(keys), capacity, rate)
+            samples.append((time.perf_counter() - t0) * 1e6)
+        db_module.get_db().drop_collection("rate_limits_bench")
+        p50, p99 = _summary(samples)
+        print(f"backend   (mongo):  p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: REACTION STORE LAYOUTS
+# File: benchmarks/bench_reactions.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Compares per-reaction update latency as the number of reactors on one
+confession grows:
+
+  array  — legacy layout: $inc + $addToSet session_id into one document
+  votes  — current layout: insert into reaction_votes (unique index) + $inc
+
+Needs a disposable MongoDB (local mongod recommended):
+
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.bench_reactions --reactors 50000
+"""
+
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import DuplicateKeyError
+
+VOTE_TTL = timedelta(hours=24)  # votes expire with their confession (models/reaction.py)
+
+
+def _array_reaction(db, confession_id, session_id):
+    db.reactions_array.update_one(
+        {"confession_id": confession_id, "emoji": "heart"},
+        {
+            "$inc": {"count": 1},
+            "$addToSet": {"session_ids": session_id},
+            "$set": {"created_at": datetime.utcnow()}
+        },
+        upsert=True
+    )
+
+
+def _vote_reaction(db, confession_id, session_id):
+    try:
+        db.reaction_votes.insert_one({
+            "confession_id": confession_id, "emoji": "heart",
+            "session_id": session_id, "created_at": datetime.utcnow(),
+            "expires_at": confession_id.generation_time.replace(tzinfo=None) + VOTE_TTL
+        })
+    except DuplicateKeyError:
+        return
+    db.reactions.update_one(
+        {"confession_id": confession_id, "emoji": "heart"},
+        {"$inc": {"count": 1}, "$set": {"created_at": datetime.utcnow()}},
+        upsert=True
+    )
+
+
+def _run(db, fn, reactors, checkpoint):
+    confession_id = ObjectId()
+    rows = []
+    window = []
+    for i in range(1, reactors + 1):
+        started = time.perf_counter()
+        fn(db, confession_id, f"session-{i}")
+        window.append((time.perf_counter() - started) * 1e6)
+        if i % checkpoint == 0:
+            rows.append((i, statistics.median(window), max(window)))
+            window = []
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reactors", type=int, default=20000)
+    parser.add_argument("--checkpoint", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    db = client.get_database("confessly_bench")
+    for name in ("reactions_array", "reactions", "reaction_votes"):
+        db.drop_collection(name)
+    db.reactions_array.create_index([("confession_id", ASCENDING), ("emoji", ASCENDING)], unique=True)
+    db.reactions.create_index([("confession_id", ASCENDING), ("emoji", ASCENDING)], unique=True)
+    db.reaction_votes.create_index(
+        [("confession_id", ASCENDING), ("emoji", ASCENDING), ("session_id", ASCENDING)], unique=True
+    )
+
+    array_rows = _run(db, _array_reaction, args.reactors, args.checkpoint)
+    vote_rows = _run(db, _vote_reaction, args.reactors, args.checkpoint)
+
+    array_doc = db.reactions_array.find_one()
+    print(f"{'reactors':>10} | {'array p50 µs':>13} {'max':>9} | {'votes p50 µs':>13} {'max':>9}")
+    for (n, a50, amax), (_, v50, vmax) in zip(array_rows, vote_rows):
+        print(f"{n:>10} | {a50:>13.1f} {amax:>9.1f} | {v50:>13.1f} {vmax:>9.1f}")
+    print(f"array doc size: {len(array_doc.get('session_ids', []))} ids, "
+          f"~{db.command('collStats', 'reactions_array')['avgObjSize']} bytes")
+
+    client.drop_database("confessly_bench")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: ROUTE LOAD SUITE
+# File: benchmarks/bench_routes.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Seeds a database with realistic volumes, drives every admin (and public
+confession) route through the Flask test client, then runs a concurrent
+mixed-read load. Reports p50/p95/p99 latency, throughput, Mongo ops and
+body bytes per request, and saves everything as a JSON baseline that later
+runs can diff. A wire phase replays the admin lists uncompressed, gzip/br
+encoded and as conditional GETs (If-None-Match -> 304).
+
+Backends:
+  --backend mock   in-memory stand-in (needs `pip install -r benchmarks/requirements.txt`)
+  --backend mongo  disposable local mongod from MONGO_URI (database `confessly_bench`
+                   is dropped and re-seeded; ops/request come from Server-Timing)
+
+    python -m benchmarks.bench_routes --backend mock --scale 0.1 --save benchmarks/results/base.json
+    python -m benchmarks.bench_routes --backend mock --scale 0.1 --compare benchmarks/results/base.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import MongoClient
+from werkzeug.security import generate_password_hash
+
+# Deterministic, background-free app for benchmarking (must precede app imports)
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("MOOD_ANALYSIS_ENABLED", "false")
+os.environ.setdefault("TRENDING_ENABLED", "false")
+os.environ.setdefault("LIVE_ENABLED", "false")
+os.environ.setdefault("SLOW_QUERY_MS", "0")
+os.environ.setdefault("INDEX_SYNC", "off")  # the suite reconciles its own database
+
+MOODS = ["happy", "neutral", "sad"]
+EMOJIS = ["heart", "laugh", "sad", "angry", "relate"]
+VOTE_TTL = timedelta(hours=24)  # votes expire with their confession (models/reaction.py)
+WORDS = ("i never told anyone that my boss friend family school work feels lonely "
+         "happy tired scared angry love hate night today abusive spam").split()
+
+# Volumes at --scale 1.0
+VOLUMES = {"confessions": 50000, "reactions": 100000, "sessions": 20000, "feedback": 5000, "reports": 2000}
+
+_SERVER_TIMING_OPS = re.compile(r'db;dur=[0-9.]+;desc="(\d+) ops"')
+
+
+# ==========================================================
+# Op counting for the in-memory stand-in (no driver events there)
+# ==========================================================
+_COUNTED = {
+    "find", "find_one", "insert_one", "insert_many", "update_one", "update_many",
+    "delete_one", "delete_many", "bulk_write", "aggregate", "count_documents",
+    "estimated_document_count", "find_one_and_update", "command", "list_collection_names"
+}
+_ops = threading.local()
+
+
+def _count(fn):
+    def wrapper(*args, **kwargs):
+        _ops.count = getattr(_ops, "count", 0) + 1
+        # mongomock mutates projection dicts in place; shared module-level
+        # projections would race across load threads
+        args = tuple(dict(a) if isinstance(a, dict) else a for a in args)
+        kwargs = {k: dict(v) if isinstance(v, dict) else v for k, v in kwargs.items()}
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+class _CountingCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        return _count(attr) if name in _COUNTED else attr
+
+
+class _CountingDatabase:
+    def __init__(self, database):
+        self._database = database
+
+    def __getitem__(self, name):
+        return _CountingCollection(self._database[name])
+
+    def __getattr__(self, name):
+        if name in _COUNTED:
+            return _count(getattr(self._database, name))
+        if name.startswith("_") or name in ("name", "client", "drop_collection"):
+            return getattr(self._database, name)
+        return _CountingCollection(self._database[name])
+
+
+# ==========================================================
+# Seeding
+# ==========================================================
+def seed(db, scale, rng):
+    now = datetime.utcnow()
+    counts = {name: max(10, int(n * scale)) for name, n in VOLUMES.items()}
+
+    confessions = []
+    for i in range(counts["confessions"]):
+        confessions.append({
+            "_id": ObjectId(),
+            "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 40))),
+            "mood": rng.choice(MOODS),
+            "status": "active" if rng.random() > 0.05 else "deleted",
+            "ip_hash": f"{rng.getrandbits(128):032x}",
+            "session_id": f"s{rng.randrange(counts['sessions'])}",
+            "reactions": {e: rng.randint(0, 50) for e in EMOJIS},
+            "created_at": now - timedelta(seconds=rng.randint(0, 86000))
+        })
+    db.confessions.insert_many(confessions)
+
+    ids = [c["_id"] for c in confessions]
+    votes, seen = [], set()
+    for _ in range(counts["reactions"]):
+        key = (rng.choice(ids), rng.choice(EMOJIS), f"s{rng.randrange(counts['sessions'])}")
+        if key not in seen:
+            seen.add(key)
+            votes.append({
+                "confession_id": key[0], "emoji": key[1], "session_id": key[2], "created_at": now,
+                "expires_at": key[0].generation_time.replace(tzinfo=None) + VOTE_TTL
+            })
+    db.reaction_votes.insert_many(votes)
+    totals = {}
+    for v in votes:
+        totals[(v["confession_id"], v["emoji"])] = totals.get((v["confession_id"], v["emoji"]), 0) + 1
+    db.reactions.insert_many([
+        {"confession_id": cid, "emoji": e, "count": n, "created_at": now} for (cid, e), n in totals.items()
+    ])
+
+    db.sessions.insert_many([{
+        "session_id": f"s{i}", "confession_count": rng.randint(0, 10), "mood_profile": {},
+        "last_activity": now, "created_at": now
+    } for i in range(counts["sessions"])])
+    db.feedback.insert_many([{
+        "message": "app feedback " + " ".join(rng.choice(WORDS) for _ in range(20)),
+        "rating": rng.randint(1, 5), "created_at": now - timedelta(minutes=i)
+    } for i in range(counts["feedback"])])
+    db.reports.insert_many([{
+        "confession_id": rng.choice(ids), "reason": rng.choice(["spam", "abuse", "other"]),
+        "created_at": now - timedelta(minutes=i)
+    } for i in range(counts["reports"])])
+    db.admins.insert_many([{
+        "username": name, "email": f"{name}@example.com",
+        "password_hash": generate_password_hash("benchpass", method="pbkdf2:sha256:1000"),
+        "role": "superadmin" if name == "root" else "moderator",
+        "permissions": [], "status": "active", "created_at": now, "last_login": None
+    } for name in ["root"] + [f"mod{i}" for i in range(20)]])
+    return counts, ids
+
+
+# ==========================================================
+# Scenarios: name -> (method, url factory, json factory)
+# ==========================================================
+def scenarios(ids, rng):
+    counter = iter(range(10 ** 9))
+    deletable = iter(ids[::7])
+    moderators = iter([f"mod{i}" for i in range(20)])
+    return {
+        "POST /login": ("POST", lambda: "/api/admin/login",
+                        lambda: {"username": "root", "password": "benchpass"}),
+        "GET /profile": ("GET", lambda: "/api/admin/profile", None),
+        "GET /dashboard": ("GET", lambda: "/api/admin/dashboard", None),
+        "GET /feedback": ("GET", lambda: "/api/admin/feedback", None),
+        "GET /reports": ("GET", lambda: "/api/admin/reports", None),
+        "GET /health": ("GET", lambda: "/api/admin/health", None),
+        "GET /all": ("GET", lambda: "/api/admin/all", None),
+        "GET /search": ("GET", lambda: f"/api/admin/search?mood={rng.choice(MOODS)}&limit=50", None),
+        "GET /search?q": ("GET", lambda: f"/api/admin/search?q={rng.choice(WORDS)}", None),
+        "GET /analytics": ("GET", lambda: "/api/admin/analytics?granularity=hour", None),
+        "DELETE /confessions/<id>": ("DELETE", lambda: f"/api/admin/confessions/{next(deletable)}", None),
+        "POST /moderator": ("POST", lambda: "/api/admin/moderator",
+                            lambda: {"username": f"bench{next(counter)}", "email": "b@x", "password": "pw"}),
+        "DELETE /delete/<username>": ("DELETE", lambda: f"/api/admin/delete/{next(moderators)}", None),
+        "GET /confessions/feed": ("GET", lambda: "/api/confessions/feed", None),
+        "GET /confessions/trending": ("GET", lambda: "/api/confessions/trending", None),
+    }
+
+
+# Admin lists measured per encoding / revalidation in the wire phase
+WIRE_ROUTES = ["GET /feedback", "GET /reports", "GET /search", "GET /all"]
+WIRE_VARIANTS = {
+    "identity": {},
+    "gzip": {"Accept-Encoding": "gzip"},
+    "br": {"Accept-Encoding": "br"},
+    "revalidate": {"Accept-Encoding": "gzip"},  # plus If-None-Match: <ETag>
+}
+
+READ_MIX = ["GET /dashboard", "GET /search", "GET /feedback", "GET /profile",
+            "GET /confessions/feed", "GET /search?q"]
+
+
+def _request(client, spec, headers):
+    method, url, body = spec
+    _ops.count = 0
+    started = time.perf_counter()
+    response = client.open(url(), method=method, json=body() if body else None, headers=headers)
+    body = response.get_data()  # drains streamed bodies
+    elapsed = time.perf_counter() - started
+    match = _SERVER_TIMING_OPS.search(response.headers.get("Server-Timing", ""))
+    ops = int(match.group(1)) if match else _ops.count
+    return elapsed, ops, response.status_code, len(body)
+
+
+def _summarize(latencies, ops, statuses, sizes, wall=None):
+    latencies = sorted(latencies)
+
+    def pick(q):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+
+    row = {
+        "requests": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(pick(0.95), 3),
+        "p99_ms": round(pick(0.99), 3),
+        "mongo_ops_per_request": round(sum(ops) / len(ops), 2),
+        "body_bytes": int(statistics.median(sizes)),
+        "status": {str(k): statuses.count(k) for k in sorted(set(statuses))}
+    }
+    if wall:
+        row["throughput_rps"] = round(len(latencies) / wall, 1)
+    return row
+
+
+def run(args):
+    rng = random.Random(11)
+    if args.backend == "mock":
+        # mongomock has no $text; rank from the in-process index instead
+        os.environ.setdefault("SEARCH_BACKEND", "memory")
+        os.environ.setdefault("MONGO_SERVER_SELECTION_TIMEOUT_MS", "100")
+    os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    import app.db as db_module
+
+    if args.backend == "mock":
+        import mongomock
+        raw_db = mongomock.MongoClient().confessly_bench
+    else:
+        client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+        client.drop_database("confessly_bench")
+        raw_db = client.confessly_bench
+
+    counts, ids = seed(raw_db, args.scale, rng)
+    db_module.ensure_indexes(raw_db)
+
+    from app import create_app
+    from app.utils.write_behind import write_buffer
+    app = create_app()
+    db_module.db = _CountingDatabase(raw_db) if args.backend == "mock" else raw_db
+    db_module._client_pid = os.getpid()
+    db_module._initialized = True
+
+    client = app.test_client()
+    login = client.post("/api/admin/login", json={"username": "root", "password": "benchpass"}).get_json()
+    headers = {"Authorization": f"Bearer {login['data']['token']}"}
+    specs = scenarios(ids, rng)
+
+    results = {"meta": {
+        "backend": args.backend, "scale": args.scale, "seeded": counts,
+        "iterations": args.iterations, "threads": args.threads, "duration_s": args.duration,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }, "routes": {}, "load": {}, "wire": {}}
+
+    # Serial: every route
+    for name, spec in specs.items():
+        if name == "DELETE /delete/<username>":
+            continue  # destructive; run last
+        for _ in range(min(5, args.iterations)):
+            _request(client, spec, headers)  # warm caches / JIT paths
+        samples = [_request(client, spec, headers) for _ in range(args.iterations)]
+        results["routes"][name] = _summarize(*zip(*samples))
+        print(f"{name:<30} {results['routes'][name]}")
+    name = "DELETE /delete/<username>"
+    samples = [_request(client, specs[name], headers) for _ in range(min(20, args.iterations))]
+    results["routes"][name] = _summarize(*zip(*samples))
+    print(f"{name:<30} {results['routes'][name]}")
+
+    # Concurrent: mixed reads
+    collected = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker(seed_value):
+        local_rng = random.Random(seed_value)
+        local_client = app.test_client()
+        local = []
+        while time.perf_counter() < deadline:
+            local.append(_request(local_client, specs[local_rng.choice(READ_MIX)], headers))
+        with lock:
+            collected.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    results["load"]["mixed_reads"] = _summarize(*zip(*collected), wall=wall)
+    print(f"{'load: mixed reads':<30} {results['load']['mixed_reads']}")
+
+    # Wire: same URL per list, before (identity) vs after (compressed / 304)
+    from app.utils.compression import ENCODINGS
+    for name in WIRE_ROUTES:
+        method, url, _ = specs[name]
+        fixed = url()
+        etag = client.get(fixed, headers=headers).headers.get("ETag")
+        for variant, extra in WIRE_VARIANTS.items():
+            if variant == "br" and "br" not in ENCODINGS:
+                continue  # optional Brotli package not installed
+            extra = dict(extra, **({"If-None-Match": etag} if variant == "revalidate" and etag else {}))
+            spec = (method, lambda: fixed, None)
+            samples = [_request(client, spec, {**headers, **extra}) for _ in range(args.iterations)]
+            key = f"{name} [{variant}]"
+            results["wire"][key] = _summarize(*zip(*samples))
+            print(f"{key:<30} {results['wire'][key]}")
+
+    write_buffer.flush()
+    return results
+
+
+# ==========================================================
+# Baseline diff
+# ==========================================================
+def compare(current, baseline, threshold, floor_ms):
+    print(f"\n{'route':<30} {'p95 base':>10} {'p95 now':>10} {'Δ%':>8} {'ops base':>9} {'ops now':>8}"
+          f" {'bytes base':>11} {'bytes now':>10}")
+    regressions = 0
+    rows = [(section, key, now) for section in ("routes", "load", "wire")
+            for key, now in current.get(section, {}).items()]
+    for section, key, now in rows:
+        base = baseline.get(section, {}).get(key)
+        if not base:
+            continue
+        delta = (now["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0
+        base_bytes = base.get("body_bytes")
+        flag = ""
+        if (
+            (delta > threshold and now["p95_ms"] - base["p95_ms"] > floor_ms)
+            or now["mongo_ops_per_request"] > base["mongo_ops_per_request"] + 0.1
+            or (base_bytes is not None and now["body_bytes"] > base_bytes * (1 + threshold / 100))
+        ):
+            flag = "  ⚠️ regression"
+            regressions += 1
+        name = key if section == "routes" else f"{section}:{key}"
+        print(f"{name:<30} {base['p95_ms']:>10.2f} {now['p95_ms']:>10.2f} {delta:>7.1f}% "
+              f"{base['mongo_ops_per_request']:>9} {now['mongo_ops_per_request']:>8}"
+              f" {base_bytes if base_bytes is not None else '-':>11} {now['body_bytes']:>10}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["mock", "mongo"], default="mock")
+    parser.add_argument("--scale", type=float, default=0.1, help="fraction of the full seed volumes")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of concurrent load")
+    parser.add_argument("--save", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=20.0, help="p95 regression threshold in %%")
+    parser.add_argument("--floor-ms", type=float, default=1.0,
+                        help="ignore p95 regressions smaller than this in absolute terms")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(results, fh, indent=2)
+        print(f"\n💾 Saved baseline to {args.save}")
+    if args.compare:
+        with open(args.compare) as fh:
+            regressions = compare(results, json.load(fh), args.threshold, args.floor_ms)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: SEARCH LATENCY VS CORPUS SIZE
+# File: benchmarks/bench_search.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Builds the in-process InvertedIndex (the `memory` search backend) over
+synthetic confessions and reports query latency as the corpus grows.
+Query mixes: single term, two-term AND, prefix, and term + mood filter.
+
+    python -m benchmarks.bench_search --sizes 10000 50000 100000 200000
+
+For the Mongo `$text` backend, seed a local mongod and time
+`ConfessionModel.search` instead; index build time is reported here only
+for the in-process structure.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+from app.services.search import InvertedIndex, parse_query
+
+# Zipf-distributed vocabulary; real words sit at mid-frequency ranks
+VOCAB_SIZE = 20000
+NAMED = ("feel never told anyone today work school friend family love hate sad "
+         "happy tired lonely angry scared boss parents night").split()
+RARE = ["abuse", "abusive", "abused", "harass", "harassment", "threat", "threaten",
+        "bully", "bullied", "stalker", "spam", "scam", "crypto", "giveaway"]
+MOODS = ["happy", "neutral", "sad"]
+
+QUERIES = [
+    ("term", "lonely", None),
+    ("and", "boss abusive", None),
+    ("prefix", "harass*", None),
+    ("prefix2", "ab*", None),
+    ("filtered", "tired", "sad"),
+]
+
+
+def build_vocab():
+    vocab = [f"w{i}" for i in range(VOCAB_SIZE)]
+    for n, word in enumerate(NAMED):
+        vocab[20 + n * 15] = word
+    cumulative, total = [], 0.0
+    for rank in range(VOCAB_SIZE):
+        total += 1 / (rank + 1)
+        cumulative.append(total)
+    return vocab, cumulative
+
+
+VOCAB, CUM_WEIGHTS = build_vocab()
+
+
+def make_doc(rng, now, i):
+    words = rng.choices(VOCAB, cum_weights=CUM_WEIGHTS, k=rng.randint(8, 60))
+    if rng.random() < 0.05:
+        words.insert(rng.randrange(len(words)), rng.choice(RARE))
+    return {
+        "_id": ObjectId(),
+        "text": " ".join(words),
+        "mood": rng.choice(MOODS),
+        "status": "active",
+        "created_at": now - timedelta(seconds=i)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(3)
+    now = datetime.utcnow()
+    index = InvertedIndex()
+    built = 0
+
+    header = " ".join(f"{name + ' p50/p95 ms':>22}" for name, _, _ in QUERIES)
+    print(f"{'docs':>8} {'build s':>8} {header}")
+    for size in sorted(args.sizes):
+        started = time.perf_counter()
+        for i in range(built, size):
+            index.add(make_doc(rng, now, i))
+        build_s = time.perf_counter() - started
+        built = size
+
+        cells = []
+        for _, q, mood in QUERIES:
+            terms, prefixes = parse_query(q)
+            samples = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                index.search(terms, prefixes, mood=mood, status="active", limit=args.limit)
+                samples.append((time.perf_counter() - t0) * 1000)
+            samples.sort()
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            cells.append(f"{statistics.median(samples):>10.2f}/{p95:<11.2f}")
+        print(f"{size:>8} {build_s:>8.1f} {' '.join(cells)}")
+
+
+if __name__ == "__main__":
+    main()
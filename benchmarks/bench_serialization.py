@@ -0,0 +1,83 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: JSON SERIALIZATION
+# File: benchmarks/bench_serialization.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Serializes lists of confession-shaped documents (ObjectId, datetime,
+reaction map) through:
+
+  legacy   — per-document `doc["_id"] = str(doc["_id"])` loop + Flask's default provider
+  provider — ConfesslyJSONProvider (orjson when installed), no rewriting loop
+
+    python -m benchmarks.bench_serialization --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+from flask import Flask, jsonify
+from app.utils.json_provider import ConfesslyJSONProvider, orjson
+
+MOODS = ["happy", "sad", "angry", "anxious", "calm"]
+
+
+def make_docs(n):
+    now = datetime.utcnow()
+    return [{
+        "_id": ObjectId(),
+        "text": "I never told anyone, but " + "x" * random.randint(40, 280),
+        "mood": random.choice(MOODS),
+        "status": "active",
+        "session_id": ObjectId(),
+        "reactions": {e: random.randint(0, 500) for e in ("heart", "laugh", "sad", "angry", "relate")},
+        "created_at": now - timedelta(seconds=i)
+    } for i in range(n)]
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    legacy_app = Flask("legacy")
+    fast_app = Flask("fast")
+    fast_app.json = ConfesslyJSONProvider(fast_app)
+
+    print(f"encoder: {'orjson' if orjson else 'stdlib json'}")
+    print(f"{'docs':>8} {'legacy ms':>11} {'provider ms':>12} {'speedup':>8} {'bytes':>12}")
+    for n in args.sizes:
+        docs = make_docs(n)
+
+        def legacy():
+            rows = [dict(d) for d in docs]
+            for d in rows:
+                d["_id"] = str(d["_id"])
+                d["session_id"] = str(d["session_id"])
+            with legacy_app.app_context():
+                return jsonify({"message": "ok", "data": rows}).get_data()
+
+        def provider():
+            with fast_app.app_context():
+                return jsonify({"message": "ok", "data": docs}).get_data()
+
+        legacy_s = _time(legacy, args.repeat)
+        fast_s = _time(provider, args.repeat)
+        size = len(provider())
+        print(f"{n:>8} {legacy_s * 1000:>11.1f} {fast_s * 1000:>12.1f} {legacy_s / fast_s:>7.1f}x {size:>12}")
+
+
+if __name__ == "__main__":
+    main()
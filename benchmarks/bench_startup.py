@@ -0,0 +1,89 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: WORKER STARTUP TIME
+# File: benchmarks/bench_startup.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Measures what a fresh gunicorn worker pays before serving: `import app`,
+create_app() and the first request, each in a brand-new interpreter so
+nothing is cached. Runs once per INDEX_SYNC mode (once | worker | off).
+
+Point MONGO_URI at a real cluster to see the cost of inline index sync,
+or leave the default (nothing listening) to simulate an unreachable DB:
+startup must not wait for it in `once` / `off` mode.
+
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --importtime   # slowest imports
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+flask_app = app.create_app()
+t2 = time.perf_counter()
+flask_app.test_client().get("/")
+t3 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "factory_ms": (t2 - t1) * 1000,
+                  "first_request_ms": (t3 - t2) * 1000, "total_ms": (t3 - t0) * 1000}))
+"""
+
+
+def probe(env):
+    out = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def importtime(env, top):
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app"],
+                         env=env, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        rows.append((int(cumulative_us), int(self_us), name))
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>8.1f}  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--modes", default="once,worker,off")
+    parser.add_argument("--importtime", action="store_true", help="list the slowest imports instead")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--selection-timeout-ms", help="override MONGO_SERVER_SELECTION_TIMEOUT_MS (default 20000)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault("MONGO_URI", "mongodb://127.0.0.1:1")
+    env.setdefault("MONGO_TLS", "false")
+    if args.selection_timeout_ms:
+        env["MONGO_SERVER_SELECTION_TIMEOUT_MS"] = args.selection_timeout_ms
+
+    if args.importtime:
+        importtime(env, args.top)
+        return
+
+    print(f"MONGO_URI={env['MONGO_URI']}  runs={args.runs}")
+    print(f"{'mode':<7} {'import ms':>10} {'factory ms':>11} {'1st req ms':>11} {'total p50':>10} {'total max':>10}")
+    for mode in args.modes.split(","):
+        samples = [probe({**env, "INDEX_SYNC": mode}) for _ in range(args.runs)]
+        med = {k: statistics.median(s[k] for s in samples) for k in samples[0]}
+        worst = max(s["total_ms"] for s in samples)
+        print(f"{mode:<7} {med['import_ms']:>10.1f} {med['factory_ms']:>11.1f} "
+              f"{med['first_request_ms']:>11.1f} {med['total_ms']:>10.1f} {worst:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# ==========================================================
+# 💬 CONFESSLY — BENCHMARK: TRENDING ENGINE
+# File: benchmarks/bench_trending.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+"""
+Feeds the TrendingEngine with N confessions created over the last day
+and a Zipf-skewed reaction stream (a few viral confessions, a long tail),
+then reports event cost and top-K read latency. No database needed:
+
+    python -m benchmarks.bench_trending --confessions 100000 --reactions 500000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+from app.services.trending import REACTION_WEIGHTS, TrendingEngine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--confessions", type=int, default=100000)
+    parser.add_argument("--reactions", type=int, default=500000)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--zipf", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    engine = TrendingEngine(k=args.k, enabled=False)
+    now = datetime.utcnow()
+    ids = [ObjectId() for _ in range(args.confessions)]
+
+    started = time.perf_counter()
+    for i, cid in enumerate(ids):
+        engine.on_create(cid, now - timedelta(seconds=86400 * (1 - i / args.confessions)))
+    create_s = time.perf_counter() - started
+
+    # Zipf-like popularity over a shuffled order, newest-biased timestamps
+    order = ids[:]
+    rng.shuffle(order)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(len(order))]
+    stream = rng.choices(order, weights=weights, k=args.reactions)
+    emojis = list(REACTION_WEIGHTS)
+    base = time.time() - 3600
+
+    reads = []
+    read_every = max(1, args.reactions // args.reads)
+    started = time.perf_counter()
+    for i, cid in enumerate(stream):
+        engine.on_reaction(cid, emojis[i % len(emojis)], at=base + 3600 * i / args.reactions)
+        if i % read_every == 0:
+            t0 = time.perf_counter()
+            engine.top()
+            reads.append(time.perf_counter() - t0)
+    stream_s = time.perf_counter() - started
+
+    cached = []
+    for _ in range(args.reads):
+        t0 = time.perf_counter()
+        engine.top()
+        cached.append(time.perf_counter() - t0)
+
+    reads.sort()
+    cached.sort()
+    print(f"confessions={args.confessions} reactions={args.reactions} k={args.k}")
+    print(f"create:   {args.confessions / create_s:,.0f} events/s")
+    print(f"reaction: {args.reactions / stream_s:,.0f} events/s (incl. interleaved reads)")
+    print(f"top() during stream: p50 {statistics.median(reads) * 1e6:.1f} µs, "
+          f"p99 {reads[int(len(reads) * 0.99) - 1] * 1e6:.1f} µs")
+    print(f"top() steady state:  p50 {statistics.median(cached) * 1e6:.1f} µs, "
+          f"p99 {cached[int(len(cached) * 0.99) - 1] * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
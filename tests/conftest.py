@@ -0,0 +1,62 @@
+# ==========================================================
+# 💬 CONFESSLY — TEST CONFIGURATION
+# File: tests/conftest.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+import pytest
+
+# Importing `app` must never reach a real cluster: nothing here calls create_app()
+os.environ.setdefault("MONGO_URI", "mongodb://127.0.0.1:1")
+os.environ.setdefault("INDEX_SYNC", "off")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic(); advance with clock[0] += seconds."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """A fresh in-memory `confessly` database (mongomock) behind get_db(), indexes applied."""
+    mongomock = pytest.importorskip("mongomock")
+    import app.db as app_db
+    database = mongomock.MongoClient().confessly
+    monkeypatch.setattr(app_db, "db", database)
+    monkeypatch.setattr(app_db, "_client_pid", os.getpid())
+    app_db.ensure_indexes(database)
+    return database
+
+
+@pytest.fixture
+def app(db):
+    from app import create_app
+    return create_app()
+
+
+@pytest.fixture
+def admin_headers():
+    import jwt
+    token = jwt.encode(
+        {"username": "tester", "role": "superadmin", "exp": datetime.utcnow() + timedelta(hours=1)},
+        os.environ["JWT_SECRET"], algorithm="HS256"
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def direct_writes(monkeypatch):
+    """Bypass the write-behind buffer so counters land in `db` immediately."""
+    from app.utils.write_behind import write_buffer
+    monkeypatch.setattr(write_buffer, "enabled", False)
+    return write_buffer
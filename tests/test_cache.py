@@ -0,0 +1,91 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: TTL CACHE
+# File: tests/test_cache.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import threading
+import time
+import pytest
+from app.utils.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("k", "v")
+    clock[0] += 9.9
+    assert cache.get("k") == "v"
+    clock[0] += 0.1
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+    clock[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_is_evicted():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_compute_recomputes_after_expiry(clock):
+    cache = TTLCache(ttl=5)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("k", compute) == 1
+    assert cache.get_or_compute("k", compute) == 1
+    clock[0] += 5
+    assert cache.get_or_compute("k", compute) == 2
+
+
+def test_get_or_compute_is_single_flight():
+    cache = TTLCache(ttl=60)
+    calls = []
+    callers = 16
+    barrier = threading.Barrier(callers)
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)  # long enough for every caller to pile up on the miss
+        return "value"
+
+    def caller():
+        barrier.wait()
+        results.append(cache.get_or_compute("summary", compute))
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * callers
+
+
+def test_failed_compute_is_not_cached():
+    cache = TTLCache(ttl=60)
+
+    def boom():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("k", boom)
+    assert cache.get_or_compute("k", lambda: "ok") == "ok"
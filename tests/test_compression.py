@@ -0,0 +1,70 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: COMPRESSION & CONDITIONAL GETS
+# File: tests/test_compression.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import gzip
+import json
+from datetime import datetime, timedelta
+import pytest
+
+URL = "/api/admin/feedback"
+
+
+@pytest.fixture
+def client(app, db):
+    now = datetime.utcnow()
+    db.feedback.insert_many([
+        {"message": f"feedback number {i} " * 5, "rating": i % 5, "created_at": now - timedelta(minutes=i)}
+        for i in range(40)
+    ])
+    return app.test_client()
+
+
+def test_gzip_when_accepted(client, admin_headers):
+    response = client.get(URL, headers={**admin_headers, "Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    body = json.loads(gzip.decompress(response.data))
+    assert len(body["data"]) == 40
+
+
+def test_brotli_preferred_when_available(client, admin_headers):
+    brotli = pytest.importorskip("brotli")
+    response = client.get(URL, headers={**admin_headers, "Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(response.data))["data"]
+
+
+@pytest.mark.parametrize("accept", [None, "identity", "gzip;q=0"])
+def test_identity_otherwise(client, admin_headers, accept):
+    headers = {**admin_headers, **({"Accept-Encoding": accept} if accept else {})}
+    response = client.get(URL, headers=headers)
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert len(response.get_json()["data"]) == 40
+
+
+def test_small_bodies_and_exports_stay_plain(client, admin_headers):
+    small = client.get(URL, headers={**admin_headers, "Accept-Encoding": "gzip"}, query_string={"limit": 1})
+    assert "Content-Encoding" not in small.headers
+    export = client.get(URL, headers={**admin_headers, "Accept-Encoding": "gzip"}, query_string={"format": "ndjson"})
+    assert "Content-Encoding" not in export.headers
+    assert len(export.data.splitlines()) == 40
+
+
+def test_etag_revalidation(client, admin_headers, db):
+    first = client.get(URL, headers=admin_headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"') and first.headers["Cache-Control"] == "private, no-cache"
+
+    again = client.get(URL, headers={**admin_headers, "If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert again.status_code == 304 and again.data == b""
+    assert again.headers["ETag"] == etag
+
+    # Other params are another representation; a write changes the version
+    assert client.get(URL, headers={**admin_headers, "If-None-Match": etag}, query_string={"limit": 5}).status_code == 200
+    db.feedback.insert_one({"message": "new", "created_at": datetime.utcnow()})
+    changed = client.get(URL, headers={**admin_headers, "If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
@@ -0,0 +1,67 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: ADMIN LISTS & STREAMED EXPORTS
+# File: tests/test_export.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+import pytest
+
+URL = "/api/admin/feedback"
+
+
+@pytest.fixture
+def feedback(db):
+    now = datetime.utcnow()
+    db.feedback.insert_many([
+        {"message": f"note {i}", "rating": i, "session_id": f"s{i}", "created_at": now - timedelta(minutes=i)}
+        for i in range(5)
+    ])
+    db.feedback.insert_one({"message": "=HYPERLINK(\"x\")", "rating": 9})  # legacy: no created_at
+    return db.feedback
+
+
+def _get(app, headers, **params):
+    return app.test_client().get(URL, headers=headers, query_string=params)
+
+
+def test_pages_skip_docs_without_created_at(app, admin_headers, feedback):
+    seen, cursor = [], None
+    while True:
+        body = _get(app, admin_headers, limit=2, **({"cursor": cursor} if cursor else {})).get_json()
+        seen += [doc["message"] for doc in body["data"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [f"note {i}" for i in range(5)]
+
+
+def test_ndjson_export(app, admin_headers, feedback):
+    response = _get(app, admin_headers, format="ndjson")
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [row["rating"] for row in rows] == [0, 1, 2, 3, 4]
+
+
+def test_csv_columns_follow_first_document(app, admin_headers, feedback):
+    response = _get(app, admin_headers, format="csv")
+    assert response.headers["Content-Disposition"].startswith('attachment; filename="feedback-')
+    rows = list(csv.DictReader(io.StringIO(response.data.decode())))
+    assert sorted(rows[0]) == ["_id", "created_at", "message", "rating", "session_id"]
+    assert len(rows) == 5
+    assert (rows[0]["message"], rows[0]["rating"], rows[0]["session_id"]) == ("note 0", "0", "s0")
+
+
+def test_csv_fields_param(app, admin_headers, feedback):
+    feedback.insert_one({"message": "=cmd()", "rating": 7, "created_at": datetime.utcnow()})
+    rows = list(csv.reader(io.StringIO(_get(app, admin_headers, format="csv", fields="rating,message").data.decode())))
+    assert rows[0] == ["rating", "message"]
+    assert rows[1] == ["7", "'=cmd()"]  # formula prefix neutralised
+
+
+@pytest.mark.parametrize("params", [{"format": "xml"}, {"format": "csv", "fields": "$where"}, {"cursor": "nope"}])
+def test_bad_export_params(app, admin_headers, feedback, params):
+    assert _get(app, admin_headers, **params).status_code == 400
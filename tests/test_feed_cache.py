@@ -0,0 +1,88 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: FEED CACHE
+# File: tests/test_feed_cache.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime, timedelta
+import pytest
+from app.services.feed import FeedCache
+
+PROJECTION = {"text": 1, "created_at": 1}
+
+
+@pytest.fixture
+def confessions(db):
+    """Ten active confessions, one minute apart (newest is "c9"), plus one hidden."""
+    base = datetime.utcnow() - timedelta(hours=1)
+    db.confessions.insert_many(
+        [{"text": f"c{i}", "status": "active", "created_at": base + timedelta(minutes=i)} for i in range(10)]
+        + [{"text": "hidden", "status": "hidden", "created_at": base + timedelta(minutes=30)}]
+    )
+    return db.confessions
+
+
+def _walk(cache, limit):
+    texts, token = [], None
+    while True:
+        docs, token = cache.page(PROJECTION, token, limit)
+        texts += [d["text"] for d in docs]
+        if not token:
+            return texts
+
+
+def _new(collection, text, minutes=60):
+    doc = {"text": text, "status": "active", "created_at": datetime.utcnow() + timedelta(minutes=minutes)}
+    doc["_id"] = collection.insert_one(dict(doc)).inserted_id
+    return doc
+
+
+def test_pages_cross_from_window_to_mongo(confessions, clock):
+    cache = FeedCache(max_items=5, ttl=30)
+    assert _walk(cache, 2) == [f"c{i}" for i in range(9, -1, -1)]
+    assert cache.stats()["reloads"] == 1
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 3  # a page must fit the window
+
+
+def test_small_feed_is_complete(confessions, clock):
+    cache = FeedCache(max_items=50, ttl=30)
+    assert len(_walk(cache, 4)) == 10
+    assert cache.stats()["misses"] == 0
+
+
+def test_create_and_delete_patch_the_window(confessions, clock):
+    cache = FeedCache(max_items=5, ttl=30)
+    cache.page(PROJECTION)
+    new = _new(confessions, "fresh")
+    cache.on_create(new)
+    docs, _ = cache.page(PROJECTION, limit=2)
+    assert [d["text"] for d in docs] == ["fresh", "c9"]
+
+    cache.on_delete(new["_id"])
+    docs, _ = cache.page(PROJECTION, limit=2)
+    assert [d["text"] for d in docs] == ["c9", "c8"]
+    assert cache.stats()["reloads"] == 1
+
+
+def test_ttl_reload_sees_other_workers(confessions, clock):
+    cache = FeedCache(max_items=5, ttl=30)
+    cache.page(PROJECTION)
+    _new(confessions, "from another worker")
+    assert cache.page(PROJECTION, limit=1)[0][0]["text"] == "c9"
+    clock[0] += 31
+    assert cache.page(PROJECTION, limit=1)[0][0]["text"] == "from another worker"
+
+
+def test_delete_during_reload_is_replayed(confessions, clock, monkeypatch):
+    cache = FeedCache(max_items=5, ttl=30)
+    victim = confessions.find_one({"text": "c9"})
+    real_find = confessions.find
+
+    def racing_find(*args, **kwargs):
+        cursor = real_find(*args, **kwargs)
+        cache.on_delete(victim["_id"])  # lands while the reload query is in flight
+        return cursor
+
+    monkeypatch.setattr(confessions, "find", racing_find)
+    docs, _ = cache.page(PROJECTION, limit=1)
+    assert docs[0]["text"] == "c8"
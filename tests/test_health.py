@@ -0,0 +1,26 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: SYSTEM HEALTH
+# File: tests/test_health.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime, timedelta
+import pytest
+from app.services.health import db_stats_sampler
+
+
+def _snapshot(age=0, error=None):
+    return {"sampled_at": datetime.utcnow() - timedelta(seconds=age), "error": error, "data_size": 2 * 1024 * 1024}
+
+
+@pytest.mark.parametrize("snapshot, code, status", [
+    (_snapshot(), 200, "ok"),
+    (_snapshot(error="OperationFailure: not authorized"), 503, "degraded"),
+    (_snapshot(age=3 * db_stats_sampler.interval + 1), 503, "degraded"),
+    (None, 503, "degraded"),
+])
+def test_system_health_reflects_snapshot(app, admin_headers, monkeypatch, snapshot, code, status):
+    monkeypatch.setattr(db_stats_sampler, "snapshot", lambda: snapshot)
+    response = app.test_client().get("/api/admin/health", headers=admin_headers)
+    assert response.status_code == code
+    assert response.get_json()["data"]["status"] == status
@@ -0,0 +1,73 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: JSON PROVIDER
+# File: tests/test_json_provider.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import importlib.util
+import sys
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from flask import Flask, jsonify
+from app.utils import json_provider
+
+OID = ObjectId("65a1b2c3d4e5f60718293a4b")
+DOC = {
+    "_id": OID,
+    "created_at": datetime(2024, 1, 2, 3, 4, 5, 678000),
+    "day": date(2024, 1, 2),
+    "price": Decimal128(Decimal("1.50")),
+    "tags": {"x"},
+    "text": "héllo 💬",
+}
+EXPECTED = {
+    "_id": "65a1b2c3d4e5f60718293a4b",
+    "created_at": "2024-01-02T03:04:05.678000Z",
+    "day": "2024-01-02",
+    "price": "1.50",
+    "tags": ["x"],
+    "text": "héllo 💬",
+}
+
+
+@pytest.fixture
+def stdlib_provider(monkeypatch):
+    """A second copy of the module imported as if orjson were missing."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("json_provider_stdlib", json_provider.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.orjson is None
+    return module
+
+
+def test_bson_types_encode(stdlib_provider):
+    for module in (json_provider, stdlib_provider):
+        assert module.loads(module.dumps_bytes(DOC)) == EXPECTED
+
+
+def test_aware_datetimes_match_across_encoders(stdlib_provider):
+    utc = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    ist = datetime(2024, 1, 2, 8, 34, 5, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+    for module in (json_provider, stdlib_provider):
+        assert module.loads(module.dumps_bytes([utc, ist])) == ["2024-01-02T03:04:05Z", "2024-01-02T08:34:05+05:30"]
+
+
+def test_sort_keys_and_unknown_types(stdlib_provider):
+    for module in (json_provider, stdlib_provider):
+        assert module.dumps_bytes({"b": 1, "a": 2}, sort_keys=True) == b'{"a":2,"b":1}'
+        with pytest.raises(TypeError):
+            module.dumps_bytes({"x": object()})
+
+
+def test_flask_responses_use_provider():
+    app = Flask(__name__)
+    app.json = json_provider.ConfesslyJSONProvider(app)
+    with app.app_context():
+        response = jsonify(DOC)
+    assert response.mimetype == "application/json"
+    assert json_provider.loads(response.data) == EXPECTED
+    assert app.json.loads(app.json.dumps({"_id": OID})) == {"_id": str(OID)}
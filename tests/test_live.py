@@ -0,0 +1,83 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: LIVE UPDATES HUB
+# File: tests/test_live.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import json
+from bson import ObjectId
+from app.config import Config
+from app.services.live import LiveHub
+
+
+def _events(chunk):
+    """Decode an SSE chunk into [(event, data)]."""
+    out = []
+    for message in chunk.decode().strip().split("\n\n"):
+        kind, data = message.split("\n")
+        out.append((kind[len("event: "):], json.loads(data[len("data: "):])))
+    return out
+
+
+def _hub(queue_size=64):
+    return LiveHub(tick=3600, queue_size=queue_size)  # ticks are flushed by hand
+
+
+def test_tick_coalesces_per_confession():
+    hub = _hub()
+    subscriber = hub.subscribe()
+    a, b = ObjectId(), ObjectId()
+    hub.on_reaction(a, "heart")
+    hub.on_reaction(a, "heart")
+    hub.on_reaction(a, "sad")
+    hub.on_reaction(b, "heart")
+    hub.on_delete(b)  # a delete wins over earlier reactions
+
+    assert hub.flush() == 2
+    assert _events(subscriber.drain()) == [
+        ("reactions", {"type": "reactions", "id": str(a), "delta": {"heart": 2, "sad": 1}}),
+        ("deleted", {"type": "deleted", "id": str(b)}),
+    ]
+
+
+def test_filtered_subscriber_only_gets_its_ids():
+    hub = _hub()
+    a, b = ObjectId(), ObjectId()
+    watcher = hub.subscribe({str(a)})
+    hub.on_reaction(a, "heart")
+    hub.on_reaction(b, "heart")
+    hub.flush()
+    assert [data["id"] for _, data in _events(watcher.drain())] == [str(a)]
+
+
+def test_queue_is_bounded_in_frames_oldest_dropped():
+    hub = _hub(queue_size=3)
+    subscriber = hub.subscribe()
+    ids = [ObjectId() for _ in range(5)]
+    for cid in ids[:2]:
+        hub.on_reaction(cid, "heart")
+    hub.flush()
+    for cid in ids[2:]:
+        hub.on_reaction(cid, "heart")
+    hub.flush()  # 5 frames queued against a limit of 3
+
+    assert [data["id"] for _, data in _events(subscriber.drain())] == [str(c) for c in ids[2:]]
+    assert subscriber.dropped == 2
+    hub.unsubscribe(subscriber)
+    assert hub.stats()["dropped"] == 2
+
+
+def test_sync_stream_refuses_single_threaded_workers(app, monkeypatch):
+    client = app.test_client()
+    monkeypatch.setattr(Config, "LIVE_ENABLED", False)
+    assert client.get("/api/confessions/stream").status_code == 503
+
+    monkeypatch.setattr(Config, "LIVE_ENABLED", True)
+    response = client.get("/api/confessions/stream")  # the test client is not multithreaded
+    assert response.status_code == 503
+    assert "ASGI" in response.get_json()["error"]
+
+    response = client.get("/api/confessions/stream", environ_overrides={"wsgi.multithread": True})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    response.close()
@@ -0,0 +1,74 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: BULK MODERATION
+# File: tests/test_moderation.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import time
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from app.config import Config
+from app.services import moderation
+
+
+def _confessions(db, n, **fields):
+    docs = [{"text": f"spam {i}", "status": "active", "mood": "sad", "created_at": datetime.utcnow(), **fields}
+            for i in range(n)]
+    return db.confessions.insert_many(docs).inserted_ids
+
+
+def _wait(job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = moderation.moderation_jobs.get(job_id)
+        if job["state"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("moderation job did not finish")
+
+
+def test_inline_ids_report_every_outcome(db):
+    ids = _confessions(db, 2)
+    db.confessions.update_one({"_id": ids[1]}, {"$set": {"status": "hidden"}})
+    report, job = moderation.moderate(
+        {"ids": [str(ids[0]), str(ids[1]), str(ObjectId()), "junk", str(ids[0])], "status": "hidden"}
+    )
+    assert job is None
+    assert report["counts"] == {"updated": 1, "unchanged": 1, "not_found": 1, "invalid_id": 1}
+    assert db.confessions.count_documents({"status": "hidden"}) == 2
+
+
+@pytest.mark.parametrize("body", [
+    {"ids": ["a"], "filter": {"mood": "sad"}},
+    {"filter": {"nothing": "here"}},
+    {"ids": ["a"], "status": "banished"},
+])
+def test_invalid_requests(db, body):
+    with pytest.raises(ValueError):
+        moderation.moderate(body)
+
+
+def test_ids_list_is_capped(db, monkeypatch):
+    monkeypatch.setattr(Config, "MODERATION_MAX_IDS", 3)
+    with pytest.raises(ValueError, match="At most 3 ids"):
+        moderation.moderate({"ids": [str(ObjectId()) for _ in range(4)]})
+
+
+def test_filter_job_pages_by_id(db, monkeypatch):
+    monkeypatch.setattr(Config, "MODERATION_CHUNK_SIZE", 3)
+    monkeypatch.setattr(Config, "MODERATION_SYNC_LIMIT", 2)
+    _confessions(db, 7, session_id="raider")
+    _confessions(db, 2, session_id="someone-else")
+    finds = []
+    real_find = db.confessions.find
+    monkeypatch.setattr(db.confessions, "find", lambda *a, **kw: finds.append(a[0]) or real_find(*a, **kw))
+
+    report, job = moderation.moderate({"filter": {"session_id": "raider"}, "status": "deleted"})
+    assert report is None and job["total"] == 7
+    job = _wait(job["_id"])
+    assert job["state"] == "done"
+    assert job["processed"] == 7 and job["counts"]["updated"] == 7
+    assert db.confessions.count_documents({"status": "deleted"}) == 7
+    resumed = [f["$and"][1]["_id"]["$gt"] for f in finds if "$and" in f]
+    assert len(resumed) == 2  # chunks 2 and 3 are fresh queries starting after the previous chunk
@@ -0,0 +1,47 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: MOOD PIPELINE
+# File: tests/test_mood.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime
+from app.services.mood import MoodPipeline
+
+
+def _pipeline():
+    return MoodPipeline(workers=0)  # inline scoring, no background thread
+
+
+def _confession(db, text):
+    return db.confessions.insert_one(
+        {"text": text, "status": "active", "created_at": datetime.utcnow()}
+    ).inserted_id
+
+
+def test_batch_writes_mood(db, direct_writes):
+    cid = _confession(db, "I am so happy and grateful today")
+    _pipeline().process_batch([(cid, "I am so happy and grateful today")])
+    assert db.confessions.find_one({"_id": cid})["mood"] == "happy"
+
+
+def test_first_mood_wins_across_workers(db, direct_writes):
+    cid = _confession(db, "I feel great")
+    db.confessions.update_one({"_id": cid}, {"$set": {"mood": "neutral"}})  # scored elsewhere
+    pipeline = _pipeline()
+    pipeline.process_batch([(cid, "I feel great")])
+    doc = db.confessions.find_one({"_id": cid})
+    assert doc["mood"] == "neutral"
+    assert "mood_batch" not in doc
+    assert pipeline.metrics["already_scored"] == 1
+
+
+def test_only_written_docs_are_reported(db, direct_writes, monkeypatch):
+    fresh = _confession(db, "what a wonderful day")
+    done = _confession(db, "awful, terrible day")
+    db.confessions.update_one({"_id": done}, {"$set": {"mood": "sad"}})
+    recorded = []
+    monkeypatch.setattr("app.services.rollups.record_mood", lambda ts, mood: recorded.append(mood))
+    pipeline = _pipeline()
+    pipeline.process_batch([(fresh, "what a wonderful day"), (done, "awful, terrible day"), (fresh, "what a wonderful day")])
+    assert recorded == [db.confessions.find_one({"_id": fresh})["mood"]]
+    assert pipeline.metrics["already_scored"] == 2
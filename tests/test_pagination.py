@@ -0,0 +1,76 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: KEYSET PAGINATION HELPERS
+# File: tests/test_pagination.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from app.utils.pagination import (
+    decode_cursor, encode_cursor, finish_page, keyset_filter, parse_limit, parse_time
+)
+
+
+def _doc(created_at=None):
+    return {"_id": ObjectId(), "created_at": created_at or datetime(2026, 10, 18, 9, 30, 15, 123000)}
+
+
+def test_cursor_round_trip():
+    doc = _doc()
+    token = encode_cursor(doc)
+    assert "=" not in token  # padding stripped, safe in a query string
+    assert decode_cursor(token) == (doc["created_at"], doc["_id"])
+
+
+def test_cursor_round_trip_whole_seconds():
+    doc = _doc(datetime(2026, 1, 1))
+    assert decode_cursor(encode_cursor(doc)) == (doc["created_at"], doc["_id"])
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJ0IjoieCJ9", encode_cursor(_doc())[:-4]])
+def test_decode_rejects_garbage(token):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token)
+
+
+def test_keyset_filter_without_token_is_unchanged():
+    query = {"status": "active"}
+    assert keyset_filter(query, None) is query
+
+
+def test_keyset_filter_seeks_past_cursor():
+    doc = _doc()
+    after = {"$or": [
+        {"created_at": {"$lt": doc["created_at"]}},
+        {"created_at": doc["created_at"], "_id": {"$lt": doc["_id"]}}
+    ]}
+    token = encode_cursor(doc)
+    assert keyset_filter({}, token) == after
+    assert keyset_filter({"status": "active"}, token) == {"$and": [{"status": "active"}, after]}
+
+
+def test_finish_page_trims_look_ahead_row():
+    docs = [_doc(datetime(2026, 1, 1, 0, 0, i)) for i in range(3, 0, -1)]
+    page, next_cursor = finish_page(list(docs), 2)
+    assert page == docs[:2]
+    assert decode_cursor(next_cursor) == (docs[1]["created_at"], docs[1]["_id"])
+
+    page, next_cursor = finish_page(docs[:2], 2)
+    assert page == docs[:2] and next_cursor is None
+
+
+def test_parse_limit_clamps():
+    assert parse_limit(None, default=20) == 20
+    assert parse_limit("0") == 1
+    assert parse_limit("500", maximum=50) == 50
+    with pytest.raises(ValueError):
+        parse_limit("ten")
+
+
+def test_parse_time_normalizes_to_naive_utc():
+    assert parse_time("2026-10-18T10:00:00+02:00") == datetime(2026, 10, 18, 8, 0)
+    assert parse_time("2026-10-18T08:00:00Z") == datetime(2026, 10, 18, 8, 0)
+    assert parse_time(None) is None
+    with pytest.raises(ValueError, match="from"):
+        parse_time("yesterday", "from")
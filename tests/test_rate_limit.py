@@ -0,0 +1,134 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: TOKEN-BUCKET RATE LIMITING
+# File: tests/test_rate_limit.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import pytest
+from flask import Flask
+from app.config import Config
+from app.utils.rate_limit import MemoryBackend, RateLimiter, client_ip, parse_rate
+
+
+def _request(remote_addr="10.0.0.1", forwarded=None):
+    """A detached Flask request (client_ip/retry_after accept one explicitly)."""
+    headers = {"X-Forwarded-For": forwarded} if forwarded else {}
+    app = Flask(__name__)
+    with app.test_request_context(headers=headers, environ_base={"REMOTE_ADDR": remote_addr}) as ctx:
+        return ctx.request
+
+
+@pytest.fixture
+def limited_app():
+    """A one-route app behind a fresh 2/minute ip+session limiter."""
+    limiter = RateLimiter(MemoryBackend())
+    app = Flask(__name__)
+
+    @app.route("/ping")
+    @limiter.limit("test_ping", "2/minute", per="ip+session")
+    def ping():
+        return {"ok": True}
+
+    return app, limiter
+
+
+@pytest.mark.parametrize("rate, expected", [
+    ("10/minute", (10, 10 / 60)),
+    ("5/second", (5, 5.0)),
+    ("100/hours", (100, 100 / 3600)),
+    ("1/day", (1, 1 / 86400)),
+])
+def test_parse_rate(rate, expected):
+    assert parse_rate(rate) == expected
+
+
+@pytest.mark.parametrize("rate", ["10", "ten/minute", "10/fortnight", "-1/minute"])
+def test_parse_rate_rejects_bad_input(rate):
+    with pytest.raises(ValueError):
+        parse_rate(rate)
+
+
+def test_bucket_empties_and_refills(clock):
+    backend = MemoryBackend()
+    capacity, rate = parse_rate("2/minute")
+    assert backend.take("k", capacity, rate)[0]
+    assert backend.take("k", capacity, rate)[0]
+    assert not backend.take("k", capacity, rate)[0]
+    clock[0] += 30  # one token back
+    assert backend.take("k", capacity, rate)[0]
+    assert not backend.take("k", capacity, rate)[0]
+
+
+def test_memory_backend_evicts_least_recently_used(clock):
+    backend = MemoryBackend(max_keys=2)
+    backend.take("a", 1, 0.001)
+    backend.take("b", 1, 0.001)
+    backend.take("a", 1, 0.001)  # touch: "b" is now the oldest
+    backend.take("c", 1, 0.001)
+    assert list(backend._buckets) == ["a", "c"]
+
+
+def test_limit_returns_429_with_retry_after(limited_app, clock):
+    app, limiter = limited_app
+    client = app.test_client()
+    assert client.get("/ping").status_code == 200
+    assert client.get("/ping").status_code == 200
+
+    response = client.get("/ping")
+    assert response.status_code == 429
+    assert response.get_json() == {"error": "Too many requests, slow down"}
+    assert response.headers["Retry-After"] == "30"  # 2/minute: one token every 30s
+    assert limiter.stats()["limited"] == 1
+
+
+def test_session_and_ip_buckets_are_separate(limited_app, clock):
+    app, _ = limited_app
+    client = app.test_client()
+    alice = {"X-Session-ID": "alice"}
+    for _ in range(2):
+        assert client.get("/ping", headers=alice).status_code == 200
+    assert client.get("/ping", headers=alice).status_code == 429
+
+    # Same IP, other session: the ip bucket is spent too, so this is limited as well
+    assert client.get("/ping", headers={"X-Session-ID": "bob"}).status_code == 429
+    # Another IP with a fresh session goes through
+    response = client.get("/ping", headers={"X-Session-ID": "bob"}, environ_base={"REMOTE_ADDR": "10.0.0.9"})
+    assert response.status_code == 200
+
+
+def test_denied_session_does_not_drain_shared_ip(limited_app, clock):
+    app, limiter = limited_app
+    client = app.test_client()
+    alice, nat = {"X-Session-ID": "alice"}, {"REMOTE_ADDR": "10.0.0.9"}
+    for _ in range(2):
+        assert client.get("/ping", headers=alice).status_code == 200
+    # alice moves behind a NAT: her own bucket is empty, so the NAT's ip bucket is left alone
+    for _ in range(3):
+        assert client.get("/ping", headers=alice, environ_base=nat).status_code == 429
+    assert limiter.backend.peek("test_ping:ip:10.0.0.9", 2, 2 / 60) == 2
+    for _ in range(2):
+        assert client.get("/ping", headers={"X-Session-ID": "bob"}, environ_base=nat).status_code == 200
+
+
+def test_bucket_keys_name_scope_and_identity(limited_app, clock):
+    app, limiter = limited_app
+    app.test_client().get("/ping", headers={"X-Session-ID": "alice"}, environ_base={"REMOTE_ADDR": "10.0.0.1"})
+    assert set(limiter.backend._buckets) == {"test_ping:ip:10.0.0.1", "test_ping:session:alice"}
+
+
+def test_disabled_limiter_allows_everything():
+    limiter = RateLimiter(MemoryBackend(), enabled=False)
+    assert limiter.retry_after("x", 1, 0.001, ["ip"], _request()) is None
+    assert limiter.retry_after("x", 1, 0.001, ["ip"], _request()) is None
+
+
+@pytest.mark.parametrize("hops, forwarded, expected", [
+    (0, "1.1.1.1", "10.0.0.1"),                 # proxy headers ignored unless trusted
+    (1, "6.6.6.6, 2.2.2.2", "2.2.2.2"),         # rightmost entry: what our proxy saw
+    (2, "6.6.6.6, 3.3.3.3, 4.4.4.4", "3.3.3.3"),
+    (2, "4.4.4.4", "10.0.0.1"),                 # fewer entries than hops: socket address
+    (1, None, "10.0.0.1"),
+])
+def test_client_ip_trusts_only_proxy_hops(monkeypatch, hops, forwarded, expected):
+    monkeypatch.setattr(Config, "RATE_LIMIT_TRUST_PROXY", hops)
+    assert client_ip(_request(forwarded=forwarded)) == expected
@@ -0,0 +1,58 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: REACTION VOTES
+# File: tests/test_reactions.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+import pytest
+from bson import ObjectId
+from app.config import Config
+from app.models.reaction import CONFESSION_TTL, ReactionModel
+
+
+def test_one_vote_per_session(db, direct_writes):
+    cid = ObjectId()
+    assert ReactionModel.add_reaction(cid, "❤️", "s1") is True
+    assert ReactionModel.add_reaction(cid, "❤️", "s1") is False
+    assert ReactionModel.add_reaction(cid, "❤️", "s2") is True
+    assert ReactionModel.add_reaction(cid, "😂", "s1") is True
+    assert ReactionModel.get_counts(cid) == {"❤️": 2, "😂": 1}
+    assert ReactionModel.has_reacted(cid, "❤️", "s1")
+
+
+def test_votes_expire_with_confession(db, direct_writes):
+    cid = ObjectId()
+    ReactionModel.add_reaction(cid, "❤️", "s1")
+    vote = db.reaction_votes.find_one({"confession_id": cid})
+    assert vote["expires_at"] == cid.generation_time.replace(tzinfo=None) + CONFESSION_TTL
+
+
+def test_failed_enqueue_releases_vote(db, direct_writes, monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError("buffer closed")
+    monkeypatch.setattr(direct_writes, "update", broken)
+    cid = ObjectId()
+    with pytest.raises(RuntimeError):
+        ReactionModel.add_reaction(cid, "❤️", "s1")
+    assert not ReactionModel.has_reacted(cid, "❤️", "s1")
+
+
+def test_legacy_session_ids_block_repeat(db, direct_writes, monkeypatch):
+    monkeypatch.setattr(Config, "REACTION_LEGACY_CHECK", True)
+    cid = ObjectId()
+    db.reactions.insert_one({"confession_id": cid, "emoji": "❤️", "count": 1, "session_ids": ["s1"]})
+    assert ReactionModel.add_reaction(cid, "❤️", "s1") is False
+    assert ReactionModel.get_counts(cid) == {"❤️": 1}
+
+
+def test_migrate_votes_is_idempotent(db, direct_writes):
+    cid = ObjectId()
+    db.reactions.insert_one({"confession_id": cid, "emoji": "❤️", "count": 2, "session_ids": ["s1", "s2"]})
+    db.reaction_votes.insert_one({"confession_id": cid, "emoji": "😂", "session_id": "s3"})  # pre-expires_at
+
+    assert ReactionModel.migrate_votes() == 1
+    assert ReactionModel.migrate_votes() == 0
+    assert db.reaction_votes.count_documents({"confession_id": cid}) == 3
+    assert db.reaction_votes.count_documents({"expires_at": {"$exists": False}}) == 0
+    assert "session_ids" not in db.reactions.find_one({"confession_id": cid})
+    assert ReactionModel.add_reaction(cid, "❤️", "s2") is False
@@ -0,0 +1,61 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: ANALYTICS ROLLUPS
+# File: tests/test_rollups.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime, timedelta
+import pytest
+from app.services import rollups
+from app.services.mood import MoodPipeline
+
+
+def _today():
+    """Recent enough to survive the expires_at TTL index (mongomock enforces it)."""
+    return rollups.bucket_start(datetime.utcnow(), "day")
+
+
+def test_bucket_start_truncates():
+    ts = datetime(2024, 5, 17, 13, 47, 21)
+    assert rollups.bucket_start(ts, "minute") == datetime(2024, 5, 17, 13, 47)
+    assert rollups.bucket_start(ts, "hour") == datetime(2024, 5, 17, 13)
+    assert rollups.bucket_start(ts, "day") == datetime(2024, 5, 17)
+
+
+def test_record_fills_every_granularity(db, direct_writes):
+    ts = _today() + timedelta(hours=13, minutes=47, seconds=21)
+    rollups.record_confession(ts)
+    rollups.record_confession(ts + timedelta(minutes=5))
+
+    hour = db[rollups.COLLECTION].find_one({"granularity": "hour", "bucket": _today() + timedelta(hours=13)})
+    assert hour["confessions"] == 2
+    assert hour["expires_at"] == hour["bucket"] + timedelta(days=90)
+    day = db[rollups.COLLECTION].find_one({"granularity": "day"})
+    assert day["confessions"] == 2 and "expires_at" not in day
+    assert db[rollups.COLLECTION].count_documents({"granularity": "minute"}) == 2
+
+
+def test_series_range_and_limits(db, direct_writes):
+    start = _today()
+    for hours in range(5):
+        rollups.record_confession(start + timedelta(hours=hours))
+    buckets = rollups.series("hour", since=start + timedelta(hours=1), until=start + timedelta(hours=4))
+    assert [b["bucket"].hour for b in buckets] == [1, 2, 3]
+    assert "expires_at" not in buckets[0]
+
+    with pytest.raises(ValueError):
+        rollups.series("week")
+    with pytest.raises(ValueError, match="Range too large"):
+        rollups.series("minute", since=start, until=start + timedelta(days=30))
+
+
+def test_rescoring_does_not_recount_mood(db, direct_writes):
+    cid = db.confessions.insert_one(
+        {"text": "I am so happy", "status": "active", "created_at": datetime.utcnow()}
+    ).inserted_id
+    batch = [(cid, "I am so happy")]
+    MoodPipeline(workers=0).process_batch(batch)
+    MoodPipeline(workers=0).process_batch(batch)  # a second worker / backfill pass
+
+    day = db[rollups.COLLECTION].find_one({"granularity": "day"})
+    assert day["moods"] == {"happy": 1}
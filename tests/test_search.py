@@ -0,0 +1,74 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: CONFESSION SEARCH
+# File: tests/test_search.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime, timedelta
+import pytest
+from bson import ObjectId
+from app.services.search import ConfessionSearch, InvertedIndex, parse_query, tokenize
+
+
+def _index(*texts, **meta):
+    index = InvertedIndex()
+    ids = []
+    for text in texts:
+        ids.append(ObjectId())
+        index.add({"_id": ids[-1], "text": text, "status": "active", "created_at": datetime.utcnow(), **meta})
+    return index, ids
+
+
+@pytest.mark.parametrize("text, tokens", [
+    ("Hello, WORLD!", ["hello", "world"]),
+    ("Straße café", ["strasse", "café"]),
+    ("नमस्ते दुनिया", ["नमस्ते", "दुनिया"]),          # vowel signs stay inside the word
+    ("મને ગુજરાતી ગમે છે", ["મને", "ગુજરાતી", "ગમે", "છે"]),
+    ("cafe\u0301", ["caf\u00e9"]),                # decomposed input is NFC-normalised
+])
+def test_tokenize_any_script(text, tokens):
+    assert tokenize(text) == tokens
+
+
+def test_parse_query_prefixes():
+    assert parse_query("Exam stress* exam") == (["exam"], ["stress"])
+    assert parse_query("exam str", prefix_last=True) == (["exam"], ["str"])
+
+
+def test_bm25_prefers_rarer_and_denser_matches():
+    index, (short, long_, other) = _index(
+        "exam stress", "exam stress and a lot of unrelated words about my day", "exam tomorrow"
+    )
+    ranked, total = index.search(["exam", "stress"], [])
+    assert total == 2  # all terms must match
+    assert [cid for cid, _ in ranked] == [short, long_]
+    assert index.search(["stress"], [])[0][0][1] > index.search(["exam"], [])[0][0][1]  # rarer term weighs more
+
+
+def test_prefix_filters_and_removal():
+    index, (a, b) = _index("studying late", "student life")
+    assert {cid for cid, _ in index.search([], ["stud"])[0]} == {a, b}
+    index.update(a, mood="sad")
+    assert [cid for cid, _ in index.search([], ["stud"], mood="sad")[0]] == [a]
+    index.remove(b)
+    assert index.expand("stud") == ["studying"]
+    assert len(index) == 1
+
+
+def test_paging_reports_total():
+    index, _ = _index(*[f"note {i}" for i in range(5)])
+    page, total = index.search(["note"], [], offset=3, limit=2)
+    assert len(page) == 2 and total == 5
+
+
+def test_memory_backend_reads_documents(db, clock):
+    old = datetime.utcnow() - timedelta(hours=2)
+    db.confessions.insert_many([
+        {"text": "नमस्ते दोस्तों", "status": "active", "mood": "happy", "created_at": old},
+        {"text": "नमस्ते", "status": "deleted", "mood": "happy", "created_at": old},
+    ])
+    search = ConfessionSearch(backend="memory", refresh=300)
+    docs, has_more = search.search("नमस्ते", {"text": 1}, status="active")
+    assert [d["text"] for d in docs] == ["नमस्ते दोस्तों"] and not has_more
+    assert docs[0]["score"] > 0
+    assert search.search("नम", {"text": 1}, prefix_last=True)[0]
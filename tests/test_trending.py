@@ -0,0 +1,73 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: TRENDING ENGINE
+# File: tests/test_trending.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime
+from bson import ObjectId
+from app.services.trending import TrendingEngine
+
+
+def _worker():
+    """One gunicorn worker's engine; syncs are driven by hand."""
+    engine = TrendingEngine(k=5, sync_interval=3600)
+    engine._ensure_worker = lambda: None
+    return engine
+
+
+def _ranked(engine):
+    return [cid for cid, _ in engine.top()]
+
+
+def test_reactions_rank_and_merge_across_workers(db):
+    a, b = _worker(), _worker()
+    hot, cold = ObjectId(), ObjectId()
+    for cid in (hot, cold):
+        a.on_create(cid, datetime.utcnow())
+    b.on_reaction(hot, "relate")
+    b.on_reaction(hot, "heart")
+    a.sync()
+    b.sync()
+    a.sync()
+    assert _ranked(a) == [hot, cold]
+    assert _ranked(b) == [hot, cold]
+
+
+def test_delete_is_not_undone_by_other_workers(db):
+    a, b = _worker(), _worker()
+    cid = ObjectId()
+    a.on_create(cid, datetime.utcnow())
+    a.sync()
+    b.on_reaction(cid, "heart")  # pending on b when a sees the delete
+    a.on_delete(cid)
+    a.sync()
+    b.sync()
+    a.sync()
+    assert db.trending_scores.find_one({"_id": cid})["deleted"] is True
+    assert cid not in _ranked(a) and cid not in _ranked(b)
+    assert b.metrics["sync_errors"] == 0
+
+
+def test_delete_before_first_sync_leaves_tombstone(db):
+    a, b = _worker(), _worker()
+    cid = ObjectId()
+    a.on_create(cid, datetime.utcnow())
+    a.on_delete(cid)
+    b.on_reaction(cid, "heart")
+    a.sync()
+    b.sync()
+    assert db.trending_scores.count_documents({"_id": cid, "deleted": {"$ne": True}}) == 0
+
+
+def test_restore_clears_tombstone(db):
+    a, b = _worker(), _worker()
+    cid = ObjectId()
+    a.on_create(cid, datetime.utcnow())
+    a.on_delete(cid)
+    a.sync()
+    a.on_restore(cid, datetime.utcnow())
+    a.sync()
+    b.sync()
+    assert _ranked(b) == [cid]
+    assert "deleted" not in db.trending_scores.find_one({"_id": cid})
@@ -0,0 +1,53 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: USER HISTORY
+# File: tests/test_user_history.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from app.models.user import HISTORY, UserModel
+
+
+def _ids(items):
+    return [item["ref_id"] for item in items]
+
+
+def test_history_pages_newest_first(db):
+    refs = [ObjectId() for _ in range(5)]
+    for ref in refs:
+        UserModel.add_confession("s1", ref)
+    UserModel.add_confession("s1", refs[0])  # repeats add nothing
+
+    first, cursor = UserModel.get_history("s1", limit=3)
+    rest, end = UserModel.get_history("s1", cursor=cursor, limit=3)
+    assert len(_ids(first) + _ids(rest)) == 5
+    assert set(_ids(first) + _ids(rest)) == set(refs)
+    assert end is None
+    assert UserModel.get_history("s1", kind="reply") == ([], None)
+    with pytest.raises(ValueError):
+        UserModel.get_history("s1", kind="likes")
+
+
+def test_migrate_history_is_idempotent(db):
+    confession, reply = ObjectId(), ObjectId()
+    db.users.insert_one({
+        "session_id": "s1", "created_at": datetime.utcnow(),
+        "confessions": [str(confession)], "replies": [str(reply), "not-an-id"]
+    })
+
+    assert UserModel.migrate_history() == 1
+    assert UserModel.migrate_history() == 0
+    assert db[HISTORY].count_documents({"session_id": "s1"}) == 3
+    entry = db[HISTORY].find_one({"ref_id": str(confession)})
+    assert entry["kind"] == "confession"
+    assert entry["created_at"] == confession.generation_time.replace(tzinfo=None)
+    user = UserModel.find_by_session("s1")
+    assert "confessions" not in user and "replies" not in user
+
+
+def test_duplicate_sessions(db):
+    db.users.drop_index("session_id_unique")  # as on a cluster that predates it
+    db.users.insert_many([{"session_id": "a"}, {"session_id": "a"}, {"session_id": "b"}])
+    assert UserModel.duplicate_sessions() == [("a", 2)]
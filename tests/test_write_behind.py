@@ -0,0 +1,85 @@
+# ==========================================================
+# 💬 CONFESSLY — TESTS: WRITE-BEHIND BUFFER
+# File: tests/test_write_behind.py
+# Author: Jaydevsinh Gohil
+# ==========================================================
+
+from datetime import datetime
+import pytest
+from pymongo.errors import AutoReconnect
+from app.utils.write_behind import DEAD_LETTER_COLLECTION, WriteBehindBuffer
+
+
+@pytest.fixture
+def buffer(db):
+    """A buffer flushed by hand (no flusher thread)."""
+    buf = WriteBehindBuffer(max_batch=100, max_retries=2)
+    buf._ensure_worker = lambda: None
+    return buf
+
+
+@pytest.fixture
+def outage(monkeypatch):
+    """outage[0] = number of upcoming bulk_write calls that fail with AutoReconnect."""
+    import mongomock
+    remaining = [0]
+    real = mongomock.collection.Collection.bulk_write
+
+    def bulk_write(self, *args, **kwargs):
+        if remaining[0]:
+            remaining[0] -= 1
+            raise AutoReconnect("primary stepped down")
+        return real(self, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "bulk_write", bulk_write)
+    return remaining
+
+
+def test_updates_coalesce_per_filter(db, buffer):
+    early, late = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    buffer.update("counters", {"_id": "a"}, inc={"n": 1}, max_fields={"seen": late}, upsert=True)
+    buffer.update("counters", {"_id": "a"}, inc={"n": 2}, max_fields={"seen": early}, add_to_set={"tags": "x"})
+    buffer.update("counters", {"_id": "a"}, add_to_set={"tags": "y"}, set_fields={"v": 2})
+    buffer.update("counters", {"_id": "b"}, inc={"n": 1}, upsert=True)
+    assert buffer.stats()["pending"] == 2
+
+    assert buffer.flush() == 2
+    doc = db.counters.find_one({"_id": "a"})
+    assert (doc["n"], doc["seen"], sorted(doc["tags"]), doc["v"]) == (3, late, ["x", "y"], 2)
+
+
+def test_failed_flush_is_retried_and_merged(db, buffer, outage):
+    buffer.update("counters", {"_id": "a"}, inc={"n": 1}, upsert=True)
+    outage[0] = 1
+    assert buffer.flush() == 0
+    buffer.update("counters", {"_id": "a"}, inc={"n": 1}, upsert=True)  # queued during the outage
+    assert buffer.flush() == 1
+    assert db.counters.find_one({"_id": "a"})["n"] == 2
+    assert buffer.stats()["retried"] == 1
+
+
+def test_ops_dead_letter_after_max_retries(db, buffer, outage):
+    buffer.update("counters", {"_id": "a"}, inc={"n": 1}, upsert=True)
+    outage[0] = 3
+    for _ in range(3):
+        buffer.flush()
+    assert buffer.stats()["pending"] == 0
+    dead = db[DEAD_LETTER_COLLECTION].find_one()
+    assert (dead["collection"], dead["filter"], dead["inc"], dead["attempts"]) == ("counters", {"_id": "a"}, {"n": 1}, 3)
+    assert "primary stepped down" in dead["error"]
+
+
+def test_partial_bulk_failure_keeps_the_rest(db, buffer):
+    db.things.create_index("slug", unique=True)
+    db.things.insert_one({"_id": "taken", "slug": "x"})
+    buffer.update("things", {"_id": "clash"}, set_fields={"slug": "x"}, upsert=True)
+    buffer.update("things", {"_id": "fine"}, set_fields={"slug": "y"}, upsert=True)
+    assert buffer.flush() == 1
+    assert db.things.find_one({"_id": "fine"})["slug"] == "y"
+    assert buffer.stats()["pending"] == 1  # only the failed op is retried
+
+
+def test_disabled_buffer_writes_through(db):
+    buf = WriteBehindBuffer(enabled=False)
+    buf.update("counters", {"_id": "a"}, inc={"n": 1}, upsert=True)
+    assert db.counters.find_one({"_id": "a"})["n"] == 1